@@ -3,8 +3,6 @@ from __future__ import annotations
 import argparse
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
@@ -23,7 +21,7 @@ INPUT_S = """\
 EXPECTED = 1
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -34,9 +32,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
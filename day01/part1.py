@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+from typing import Iterable
+from typing import Iterator
 
 import support
 
@@ -11,17 +11,23 @@ INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
 def compute(s: str) -> int:
-    calories: list[list[int]] = [[]]
+    return compute_stream(s.splitlines())
+
+
+def compute_stream(lines: Iterable[str]) -> int:
+    return max(totals(lines))
 
-    lines = s.splitlines()
+
+def totals(lines: Iterable[str]) -> Iterator[int]:
+    # one elf at a time, a blank line ends an elf
+    total = 0
     for line in lines:
         if line != "":
-            calories[-1].append(int(line))
+            total += int(line)
         else:
-            calories.append([])
-
-    sums = [sum(ec) for ec in calories]
-    return max(sums)
+            yield total
+            total = 0
+    yield total
 
 
 INPUT_S = """\
@@ -43,7 +49,7 @@ INPUT_S = """\
 EXPECTED = 24000
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -54,10 +60,11 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
-        print(compute(f.read()))
+    with open(args.data_file) as f, support.measure(args), support.timing():
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
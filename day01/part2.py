@@ -3,8 +3,7 @@ from __future__ import annotations
 import argparse
 import os.path
 from typing import Iterable
-
-import pytest
+from typing import Iterator
 
 import support
 
@@ -12,17 +11,23 @@ INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
 def compute(s: str) -> int:
-    calories: list[list[int]] = [[]]
+    return compute_stream(s.splitlines())
+
+
+def compute_stream(lines: Iterable[str]) -> int:
+    return sum(topn(totals(lines), 3))
 
-    lines = s.splitlines()
+
+def totals(lines: Iterable[str]) -> Iterator[int]:
+    # one elf at a time, a blank line ends an elf
+    total = 0
     for line in lines:
         if line != "":
-            calories[-1].append(int(line))
+            total += int(line)
         else:
-            calories.append([])
-
-    sums = [sum(ec) for ec in calories]
-    return sum(topn(sums, 3))
+            yield total
+            total = 0
+    yield total
 
 
 def topn(L: Iterable[int], n: int) -> list[int]:
@@ -77,7 +82,7 @@ INPUT_S = """\
 EXPECTED = 45000
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -88,10 +93,11 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
-        print(compute(f.read()))
+    with open(args.data_file) as f, support.measure(args), support.timing():
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
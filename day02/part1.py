@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -22,14 +21,31 @@ win_points = {
     "C Z": 3,
 }
 
+# the score of a line by its first and last byte
+line_points = {
+    (ord(line[0]), ord(line[-1])): win_points[line] + shape_points[line[-1]]
+    for line in win_points
+}
+
 
 def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
+def compute_stream(lines: Iterable[str]) -> int:
     score = 0
-    for line in s.splitlines():
+    for line in lines:
         score += win_points[line] + shape_points[line[-1]]
     return score
 
 
+def compute_bytes(b: support.Bytes) -> int:
+    score = 0
+    for start, end in support.line_spans(b):
+        score += line_points[b[start], b[end - 1]]
+    return score
+
+
 INPUT_S = """\
 A Y
 B X
@@ -38,21 +54,24 @@ C Z
 EXPECTED = 15
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
 def test(input_s: str, expected: int) -> None:
     assert compute(input_s) == expected
+    assert compute_bytes(input_s.encode()) == expected
 
 
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
-        print(compute(f.read()))
+    with support.read_input(args.data_file) as b:
+        with support.measure(args), support.timing():
+            print(compute_bytes(b))
 
     return 0
 
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -11,9 +10,12 @@ INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
 def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
+def compute_stream(lines: Iterable[str]) -> int:
     priority = 0
 
-    lines = s.splitlines()
     for line in lines:
         n = len(line)
         priority += get_priority(
@@ -39,7 +41,7 @@ CrZsJsPPZsGzwwsLwLmpwMDw
 EXPECTED = 157
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -50,10 +52,11 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
-        print(compute(f.read()))
+    with open(args.data_file) as f, support.measure(args), support.timing():
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
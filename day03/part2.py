@@ -2,11 +2,10 @@ from __future__ import annotations
 
 import argparse
 import os.path
+from typing import Iterable
 from typing import Iterator
 from typing import TypeVar
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
@@ -30,10 +29,13 @@ def chunked(it: Iterator[T], n: int) -> Iterator[list[T]]:
 
 
 def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
+def compute_stream(lines: Iterable[str]) -> int:
     priority = 0
 
-    lines = (L for L in s.splitlines() if L)
-    for lines3 in chunked(lines, 3):
+    for lines3 in chunked((L for L in lines if L), 3):
         intersect = set(lines3.pop())
         for s in lines3:
             intersect = intersect.intersection(s)
@@ -58,7 +60,7 @@ CrZsJsPPZsGzwwsLwLmpwMDw
 EXPECTED = 70
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -69,10 +71,11 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
-        print(compute(f.read()))
+    with open(args.data_file) as f, support.measure(args), support.timing():
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
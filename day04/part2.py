@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -11,9 +10,12 @@ INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
 def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
+def compute_stream(lines: Iterable[str]) -> int:
     subgroups = 0
 
-    lines = s.splitlines()
     for line in lines:
         a, b = parse_group(line)
         if a.intersection(b):
@@ -21,13 +23,12 @@ def compute(s: str) -> int:
     return subgroups
 
 
-def parse_group(line: str) -> list[set[int]]:
-    assignments = line.split(",")
-    groups = []
-    for ass in assignments:
-        edges = [int(x) for x in ass.split("-")]
-        groups.append(set(range(edges[0], edges[1] + 1)))
-    return groups
+def parse_group(line: str) -> list[support.IntervalSet]:
+    a_start, a_end, b_start, b_end = support.ints(line)
+    return [
+        support.IntervalSet([(a_start, a_end + 1)]),
+        support.IntervalSet([(b_start, b_end + 1)]),
+    ]
 
 
 INPUT_S = """2-4,6-8
@@ -40,7 +41,7 @@ INPUT_S = """2-4,6-8
 EXPECTED = 4
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -51,10 +52,11 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
-        print(compute(f.read()))
+    with open(args.data_file) as f, support.measure(args), support.timing():
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
@@ -2,16 +2,11 @@ from __future__ import annotations
 
 import argparse
 import os.path
-import re
-
-import pytest
 
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
-movere = re.compile(r"move (\d+) from (\d+) to (\d+)")
-
 
 def compute(s: str) -> str:
     stacks, moves = parse(s)
@@ -28,19 +23,10 @@ def applymove(stacks: list[list[str]], move: tuple[int, int, int]) -> None:
 
 
 def parse(s: str) -> tuple[list[list[str]], list[tuple[int, int, int]]]:
-    stacklines = []
-    moves: list[tuple[int, int, int]] = []
-    phase = "stacks"
-    for line in s.splitlines():
-        if line == "":
-            phase = "moves"
-            continue
-
-        if phase == "stacks":
-            stacklines.append(line)
-        elif phase == "moves":
-            moves.append(tuple(map(int, movere.match(line).groups())))  # type: ignore
-    return parsestacks(stacklines), moves
+    stacks_s, _, moves_s = s.partition("\n\n")
+    nums = support.int_array(moves_s, 3)
+    moves = list(zip(nums[0::3], nums[1::3], nums[2::3]))
+    return parsestacks(stacks_s.splitlines()), moves
 
 
 def parsestacks(stacklines: list[str]) -> list[list[str]]:
@@ -72,7 +58,7 @@ move 1 from 1 to 2
 EXPECTED = "CMZ"
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -86,7 +72,7 @@ EXPECTED_PARSE = (
 )
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED_PARSE),),
 )
@@ -99,9 +85,10 @@ def test_parse(
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
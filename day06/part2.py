@@ -3,17 +3,26 @@ from __future__ import annotations
 import argparse
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
 def compute(s: str) -> int:
-    for i in range(len(s) - 13):
-        if len(set(s[i : i + 14])) == 14:  # noqa: E203
-            return i + 14
+    return compute_bytes(s.encode())
+
+
+def compute_bytes(b: support.Bytes) -> int:
+    # the window starts just past the last repeat, so it never has duplicates
+    last_seen = [-1] * 256
+    start = 0
+    with memoryview(b) as view:
+        for i, c in enumerate(view):
+            if last_seen[c] >= start:
+                start = last_seen[c] + 1
+            last_seen[c] = i
+            if i + 1 - start == 14:
+                return i + 1
     return 0
 
 
@@ -21,7 +30,7 @@ INPUT_S = "mjqjpqmgbljsphdztnvjfqwrcgsmlb"
 EXPECTED = 19
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     (
         (INPUT_S, EXPECTED),
@@ -38,10 +47,12 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
-        print(compute(f.read()))
+    with support.read_input(args.data_file) as b:
+        with support.measure(args), support.timing():
+            print(compute_bytes(b))
 
     return 0
 
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -11,14 +10,18 @@ INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
 def compute(s: str) -> int:
-    fs = read_dir_structure(s)
+    return compute_stream(s.splitlines())
+
+
+def compute_stream(lines: Iterable[str]) -> int:
+    fs = read_dir_structure(lines)
     return compute_size(fs)
 
 
-def read_dir_structure(s: str) -> dict[tuple[str, ...], int]:
+def read_dir_structure(lines: Iterable[str]) -> dict[tuple[str, ...], int]:
     dirs: dict[tuple[str, ...], int] = {}
     current_dir = None
-    for line in s.splitlines():
+    for line in lines:
         if line.startswith("$"):
             if line == "$ cd /":
                 current_dir = ["/"]
@@ -68,7 +71,7 @@ $ ls
 EXPECTED = 95437
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -79,10 +82,11 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
-        print(compute(f.read()))
+    with open(args.data_file) as f, support.measure(args), support.timing():
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -11,14 +10,23 @@ INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
 def compute(s: str) -> int:
-    fs = read_dir_structure(s)
+    return compute_stream(s.splitlines())
+
+
+def compute_stream(lines: Iterable[str]) -> int:
+    fs = read_dir_structure(lines)
     return find_smallest_deletable_dir(fs)
 
 
-def read_dir_structure(s: str) -> dict[tuple[str, ...], int]:
+def compute_both(s: str) -> tuple[int, int]:
+    fs = read_dir_structure(s.splitlines())
+    return compute_size(fs), find_smallest_deletable_dir(fs)
+
+
+def read_dir_structure(lines: Iterable[str]) -> dict[tuple[str, ...], int]:
     dirs: dict[tuple[str, ...], int] = {}
     current_dir = None
-    for line in s.splitlines():
+    for line in lines:
         if line.startswith("$"):
             if line == "$ cd /":
                 current_dir = ["/"]
@@ -80,9 +88,10 @@ $ ls
 7214296 k
 """
 EXPECTED = 24933642
+EXPECTED_PART1 = 95437
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -90,13 +99,22 @@ def test(input_s: str, expected: int) -> None:
     assert compute(input_s) == expected
 
 
+@support.parametrize(
+    ("input_s", "expected"),
+    ((INPUT_S, (EXPECTED_PART1, EXPECTED)),),
+)
+def test_both(input_s: str, expected: tuple[int, int]) -> None:
+    assert compute_both(input_s) == expected
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
-        print(compute(f.read()))
+    with open(args.data_file) as f, support.measure(args), support.timing():
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
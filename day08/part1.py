@@ -3,37 +3,38 @@ from __future__ import annotations
 import argparse
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
 def compute(s: str) -> int:
-    heights = []
-    for line in s.splitlines():
-        heights.append([int(x) for x in line])
-        visible = 0
-        for i in range(len(heights)):
-            for j in range(len(heights[i])):
-                if is_visible(heights, i, j):
-                    visible += 1
-    return visible
-
-
-def is_visible(heights: list[list[int]], i: int, j: int) -> bool:
-    if i == 0 or j == 0 or i == len(heights) - 1 or j == len(heights[i]) - 1:
-        return True
-    if all(heights[i][j] > heights[xi][j] for xi in range(i)):
-        return True
-    if all(heights[i][j] > heights[xi][j] for xi in range(i + 1, len(heights))):
-        return True
-    if all(heights[i][j] > heights[i][xj] for xj in range(j)):
-        return True
-    if all(heights[i][j] > heights[i][xj] for xj in range(j + 1, len(heights[i]))):
-        return True
-    return False
+    return compute_bytes(s.encode())
+
+
+def compute_bytes(b: support.Bytes) -> int:
+    heights = support.Grid.from_bytes(b)
+    return sum(is_visible(heights, i) for i in heights.indices())
+
+
+def sightlines(heights: support.Grid, i: int) -> list[range]:
+    # the flat indices from a tree out to each edge, nearest first
+    x, y = heights.coords(i)
+    up, right, down, left = heights.offsets_4
+    return [
+        range(i + up, i + up * (y + 1), up),
+        range(i + right, i + right * (heights.width - x), right),
+        range(i + down, i + down * (heights.height - y), down),
+        range(i + left, i + left * (x + 1), left),
+    ]
+
+
+def is_visible(heights: support.Grid, i: int) -> bool:
+    data = heights.data
+    height = data[i]
+    return any(
+        all(data[j] < height for j in sightline) for sightline in sightlines(heights, i)
+    )
 
 
 INPUT_S = """30373
@@ -45,7 +46,7 @@ INPUT_S = """30373
 EXPECTED = 21
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -56,10 +57,12 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
-        print(compute(f.read()))
+    with support.read_input(args.data_file) as b:
+        with support.measure(args), support.timing():
+            print(compute_bytes(b))
 
     return 0
 
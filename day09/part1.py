@@ -3,8 +3,7 @@ from __future__ import annotations
 import argparse
 import os.path
 import sys
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -12,12 +11,15 @@ INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
 def compute(s: str) -> int:
-    gridsize = 1000
-    grid = [[False for i in range(gridsize)] for j in range(gridsize)]
-    curhead = (gridsize // 2, gridsize // 2)
+    return compute_stream(s.splitlines())
+
+
+def compute_stream(lines: Iterable[str]) -> int:
+    visited = support.BitGrid()
+    curhead = (0, 0)
     curtail = curhead
-    grid[curtail[0]][curtail[1]] = True
-    for line in s.splitlines():
+    visited.add(curtail[1], curtail[0])
+    for line in lines:
         dir_letter, steps = line[0], int(line[2:])
         direction = {"U": (-1, 0), "D": (1, 0), "L": (0, -1), "R": (0, 1)}[dir_letter]
 
@@ -25,9 +27,9 @@ def compute(s: str) -> int:
             curhead = (curhead[0] + direction[0], curhead[1] + direction[1])
             curtail = movetail(curhead, curtail)
             # print(curhead, curtail, file=sys.stderr)
-            grid[curtail[0]][curtail[1]] = True
-    # printgrid(grid)
-    return sum(sum(row) for row in grid)
+            visited.add(curtail[1], curtail[0])
+    # printgrid(visited)
+    return len(visited)
 
 
 def movetail(curhead: tuple[int, int], curtail: tuple[int, int]) -> tuple[int, int]:
@@ -45,11 +47,8 @@ def sign(x: int) -> int:
     return 1 if x > 0 else -1 if x < 0 else 0
 
 
-def printgrid(grid: list[list[bool]]) -> None:
-    for row in grid:
-        for col in row:
-            print("#" if col else ".", end="", file=sys.stderr)
-        print(file=sys.stderr)
+def printgrid(visited: support.BitGrid) -> None:
+    print(visited, file=sys.stderr)
 
 
 INPUT_S = """R 4
@@ -64,7 +63,7 @@ R 2
 EXPECTED = 13
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -75,10 +74,11 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
-        print(compute(f.read()))
+    with open(args.data_file) as f, support.measure(args), support.timing():
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
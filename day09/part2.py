@@ -3,23 +3,24 @@ from __future__ import annotations
 import argparse
 import os.path
 import sys
-
-import pytest
+from typing import Iterable
 
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
-GRID_SIZE = 1000
-
 
 def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
+def compute_stream(lines: Iterable[str]) -> int:
     tail_size = 9
-    grid = [[False for i in range(GRID_SIZE)] for j in range(GRID_SIZE)]
-    start = (GRID_SIZE // 2, GRID_SIZE // 2)
+    visited = support.BitGrid()
+    start = (0, 0)
     curtail = [start for _ in range(tail_size + 1)]
-    grid[curtail[-1][0]][curtail[-1][1]] = True
-    for line in s.splitlines():
+    visited.add(curtail[-1][1], curtail[-1][0])
+    for line in lines:
         dir_letter, steps = line[0], int(line[2:])
         direction = {"U": (-1, 0), "D": (1, 0), "L": (0, -1), "R": (0, 1)}[dir_letter]
 
@@ -28,9 +29,9 @@ def compute(s: str) -> int:
             for i in range(tail_size):
                 curtail[i + 1] = movetail(curtail[i], curtail[i + 1])
             # print(curhead, curtail, file=sys.stderr)
-            grid[curtail[-1][0]][curtail[-1][1]] = True
-    # printgrid(grid)
-    return sum(sum(row) for row in grid)
+            visited.add(curtail[-1][1], curtail[-1][0])
+    # printgrid(visited)
+    return len(visited)
 
 
 def movetail(curhead: tuple[int, int], curtail: tuple[int, int]) -> tuple[int, int]:
@@ -48,11 +49,8 @@ def sign(x: int) -> int:
     return 1 if x > 0 else -1 if x < 0 else 0
 
 
-def printgrid(grid: list[list[bool]]) -> None:
-    for row in grid:
-        for col in row:
-            print("#" if col else ".", end="", file=sys.stderr)
-        print(file=sys.stderr)
+def printgrid(visited: support.BitGrid) -> None:
+    print(visited, file=sys.stderr)
 
 
 INPUT_S = """R 5
@@ -67,7 +65,7 @@ U 20
 EXPECTED = 36
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -78,10 +76,11 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
-        print(compute(f.read()))
+    with open(args.data_file) as f, support.measure(args), support.timing():
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
@@ -4,17 +4,20 @@ import argparse
 import os.path
 from typing import Any
 from typing import Callable
+from typing import Iterable
 from typing import Iterator
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
 def compute(s: str) -> None:
-    reg = init_reg(s)
+    compute_stream(s.splitlines())
+
+
+def compute_stream(lines: Iterable[str]) -> None:
+    reg = init_reg(lines)
     screen = [["." for _ in range(40)] for _ in range(6)]
     for i, regx in enumerate(reg()):
         x = i % 40
@@ -27,11 +30,11 @@ def compute(s: str) -> None:
     return
 
 
-def init_reg(s: str) -> Callable[[], Iterator[int]]:
+def init_reg(lines: Iterable[str]) -> Callable[[], Iterator[int]]:
     def get_reg() -> Iterator[int]:
         x = 1
         yield x
-        for line in s.splitlines():
+        for line in lines:
             if line == "noop":
                 yield x
             if line.startswith("addx"):
@@ -54,7 +57,7 @@ EXPECTED = """\
 """
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -66,10 +69,11 @@ def test(input_s: str, expected: int, capsys: Any) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
-        compute(f.read())
+    with open(args.data_file) as f, support.measure(args), support.timing():
+        compute_stream(support.iter_lines(f))
 
     return 0
 
@@ -6,8 +6,6 @@ import re
 from collections import deque
 from typing import Iterable
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
@@ -159,7 +157,7 @@ Monkey 3:
 EXPECTED = 10605
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -170,9 +168,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
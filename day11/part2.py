@@ -6,14 +6,15 @@ import os.path
 import re
 from collections import deque
 from typing import Iterable
-
-import pytest
-from tqdm import tqdm
+from typing import Iterator
 
 import support
+from support.cycles import find_cycle
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
+ROUNDS = 10000
+
 
 monkey_re = re.compile(
     r"""Monkey (?P<id>\d+):
@@ -30,7 +31,6 @@ class Monkey:
     def __init__(self, monkey_dict: dict[str, str]) -> None:
         self.id = int(monkey_dict["id"])
         self.items = deque(map(int, monkey_dict["start"].split(", ")))
-        self.inspects = 0
         try:
             val = int(monkey_dict["val"])
         except ValueError:
@@ -59,21 +59,13 @@ class Monkey:
         self.divisor = test
         returnval = {True: int(monkey_dict["true"]), False: int(monkey_dict["false"])}
 
-        def process(self: Monkey, lcm: int) -> tuple[int, int]:
-            self.inspects += 1
-            item = self.items.popleft()
+        def inspect(item: int, lcm: int) -> tuple[int, int]:
             new_item = op(item)
             new_item = new_item % lcm
             # new_item = new_item // 3
             return returnval[new_item % test == 0], new_item
 
-        self.process_one = process
-
-    def process(self, lcm: int) -> tuple[int, int]:
-        return self.process_one(self, lcm)
-
-    def receive(self, item: int) -> None:
-        self.items.append(item)
+        self.inspect = inspect
 
 
 class MonkeyKeepAway:
@@ -84,18 +76,45 @@ class MonkeyKeepAway:
         }
         self.lcm = math.lcm(*[m.divisor for m in self.monkeys.values()])
 
-    def play_round(self) -> None:
-        for monkey in self.monkeys.values():
-            while len(monkey.items) > 0:
-                monkey_id, new_item = monkey.process(self.lcm)
-                self.monkeys[monkey_id].receive(new_item)
+    def item_inspections(self, monkey_id: int, item: int) -> list[int]:
+        # how often each monkey inspects this one item.  an item goes from
+        # monkey to monkey the same whatever the others do, so its (monkey,
+        # worry) comes round again long before the last round
+        rounds: list[list[int]] = []
+
+        def states() -> Iterator[tuple[int, int]]:
+            monkey, worry = monkey_id, item
+            while True:
+                yield monkey, worry
+                inspected = []
+                # thrown to a monkey which hasn't had its turn, it goes again
+                while True:
+                    inspected.append(monkey)
+                    thrower = monkey
+                    monkey, worry = self.monkeys[thrower].inspect(worry, self.lcm)
+                    if monkey < thrower:
+                        break
+                rounds.append(inspected)
+
+        cycle = find_cycle(states())
+        m, k = cycle.reduce(ROUNDS)
+        inspects = [0] * len(self.monkeys)
+        for inspected in rounds[:m]:
+            for monkey in inspected:
+                inspects[monkey] += 1
+        for inspected in rounds[cycle.start : cycle.start + cycle.length]:
+            for monkey in inspected:
+                inspects[monkey] += k
+        return inspects
 
 
 def compute(s: str) -> int:
     game = MonkeyKeepAway(s)
-    for _ in tqdm(range(10000)):
-        game.play_round()
-    inspects = (m.inspects for m in game.monkeys.values())
+    inspects = [0] * len(game.monkeys)
+    for monkey in game.monkeys.values():
+        for item in monkey.items:
+            for i, n in enumerate(game.item_inspections(monkey.id, item)):
+                inspects[i] += n
     topinspects = topn(inspects, 2)
     return topinspects[0] * topinspects[1]
 
@@ -164,7 +183,7 @@ Monkey 3:
 EXPECTED = 2713310158
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -175,9 +194,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
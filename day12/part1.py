@@ -2,57 +2,43 @@ from __future__ import annotations
 
 import argparse
 import os.path
-from collections import deque
 from typing import Iterator
 
-import pytest
-
 import support
+from support.search import bfs
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
 def compute(s: str) -> int:
-    heightmap, start, end = parse(s)
-    return dijkstra(heightmap, start, end)
-
-
-def get_neighbors(
-    heightmap: list[list[int]], pos: tuple[int, int]
-) -> Iterator[tuple[int, int]]:
-    xi, yi = pos
-    for xj, yj in ((xi - 1, yi), (xi + 1, yi), (xi, yi - 1), (xi, yi + 1)):
-        if 0 <= xj < len(heightmap[0]) and 0 <= yj < len(heightmap):
-            if heightmap[yi][xi] + 1 >= heightmap[yj][xj]:
-                yield (xj, yj)
-
-
-def dijkstra(
-    heightmap: list[list[int]], start: tuple[int, int], end: tuple[int, int]
-) -> int:
-    length = {start: 0}
-    queue = deque([start])
-    while queue:
-        current = queue.popleft()
-        for neighbor in get_neighbors(heightmap, current):
-            if neighbor not in length:
-                if neighbor == end:
-                    return length[current] + 1
-                length[neighbor] = length[current] + 1
-                queue.append(neighbor)
-    raise ValueError("No path found")
-
-
-def parse(s: str) -> tuple[list[list[int]], tuple[int, int], tuple[int, int]]:
-    heightmap = []
-    for j, line in enumerate(s.splitlines()):
-        if "S" in line:
-            start = (line.index("S"), j)
-            line = line.replace("S", "a")
-        if "E" in line:
-            end = (line.index("E"), j)
-            line = line.replace("E", "z")
-        heightmap.append([ord(c) for c in line])
+    with support.span("parse"):
+        heightmap, start, end = parse(s)
+    with support.span("search"):
+        result = bfs(
+            [start],
+            lambda pos: get_neighbors(heightmap, pos),
+            goal=end.__eq__,
+            size=len(heightmap.data),
+        )
+    length = result.distance()
+    if length is None:
+        raise ValueError("No path found")
+    return length
+
+
+def get_neighbors(heightmap: support.Grid, pos: int) -> Iterator[int]:
+    height = heightmap.data[pos]
+    for neighbor in heightmap.adjacent_4(pos):
+        if height + 1 >= heightmap.data[neighbor]:
+            yield neighbor
+
+
+def parse(s: str) -> tuple[support.Grid, int, int]:
+    heightmap = support.Grid.from_str(s)
+    start = heightmap.data.index(b"S")
+    end = heightmap.data.index(b"E")
+    heightmap[heightmap.coords(start)] = ord("a")
+    heightmap[heightmap.coords(end)] = ord("z")
     return heightmap, start, end
 
 
@@ -65,7 +51,7 @@ abdefghi
 EXPECTED = 31
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -76,9 +62,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
@@ -2,65 +2,72 @@ from __future__ import annotations
 
 import argparse
 import os.path
-from collections import deque
 from typing import Iterator
 
-import pytest
-
 import support
+from support.search import bfs
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
 def compute(s: str) -> int:
-    heightmap, starts, end = parse(s)
-    return min(
-        length
-        for start in starts
-        if (length := dijkstra(heightmap, start, end)) is not None
-    )
-
-
-def get_neighbors(
-    heightmap: list[list[int]], pos: tuple[int, int]
-) -> Iterator[tuple[int, int]]:
-    xi, yi = pos
-    for xj, yj in ((xi - 1, yi), (xi + 1, yi), (xi, yi - 1), (xi, yi + 1)):
-        if 0 <= xj < len(heightmap[0]) and 0 <= yj < len(heightmap):
-            if heightmap[yi][xi] + 1 >= heightmap[yj][xj]:
-                yield (xj, yj)
-
-
-def dijkstra(
-    heightmap: list[list[int]], start: tuple[int, int], end: tuple[int, int]
-) -> int | None:
-    length = {start: 0}
-    queue = deque([start])
-    while queue:
-        current = queue.popleft()
-        for neighbor in get_neighbors(heightmap, current):
-            if neighbor not in length:
-                if neighbor == end:
-                    return length[current] + 1
-                length[neighbor] = length[current] + 1
-                queue.append(neighbor)
-    return None
-
-
-def parse(s: str) -> tuple[list[list[int]], list[tuple[int, int]], tuple[int, int]]:
-    heightmap = []
-    starts = []
-    for j, line in enumerate(s.splitlines()):
-        if "S" in line:
-            line = line.replace("S", "a")
-        if "E" in line:
-            end = (line.index("E"), j)
-            line = line.replace("E", "z")
-        for i, c in enumerate(line):
-            if c == "a":
-                starts.append((i, j))
-        heightmap.append([ord(c) for c in line])
-    return heightmap, starts, end
+    with support.span("parse"):
+        heightmap, _, starts, end = parse(s)
+    with support.span("search"):
+        # a single search from every lowest point at once
+        result = bfs(
+            starts,
+            lambda pos: get_neighbors(heightmap, pos),
+            goal=end.__eq__,
+            size=len(heightmap.data),
+        )
+    length = result.distance()
+    if length is None:
+        raise ValueError("No path found")
+    return length
+
+
+def compute_both(s: str) -> tuple[int, int]:
+    with support.span("parse"):
+        heightmap, start, starts, end = parse(s)
+    with support.span("search"):
+        # a single search back from the end reaches every start at once
+        result = bfs(
+            [end],
+            lambda pos: get_neighbors_reversed(heightmap, pos),
+            size=len(heightmap.data),
+        )
+    length = result.distance(start)
+    if length is None:
+        raise ValueError("No path found")
+    lengths = (result.distance(i) for i in starts)
+    return length, min(d for d in lengths if d is not None)
+
+
+def get_neighbors(heightmap: support.Grid, pos: int) -> Iterator[int]:
+    height = heightmap.data[pos]
+    for neighbor in heightmap.adjacent_4(pos):
+        if height + 1 >= heightmap.data[neighbor]:
+            yield neighbor
+
+
+def get_neighbors_reversed(heightmap: support.Grid, pos: int) -> Iterator[int]:
+    # where pos can be climbed to from
+    height = heightmap.data[pos]
+    for neighbor in heightmap.adjacent_4(pos):
+        if heightmap.data[neighbor] + 1 >= height:
+            yield neighbor
+
+
+def parse(s: str) -> tuple[support.Grid, int, list[int], int]:
+    heightmap = support.Grid.from_str(s)
+    data = heightmap.data
+    start = data.index(b"S")
+    end = data.index(b"E")
+    heightmap[heightmap.coords(start)] = ord("a")
+    heightmap[heightmap.coords(end)] = ord("z")
+    starts = [i for i in heightmap.indices() if data[i] == ord("a")]
+    return heightmap, start, starts, end
 
 
 INPUT_S = """Sabqponm
@@ -70,9 +77,10 @@ acctuvwj
 abdefghi
 """
 EXPECTED = 29
+EXPECTED_PART1 = 31
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -80,12 +88,21 @@ def test(input_s: str, expected: int) -> None:
     assert compute(input_s) == expected
 
 
+@support.parametrize(
+    ("input_s", "expected"),
+    ((INPUT_S, (EXPECTED_PART1, EXPECTED)),),
+)
+def test_both(input_s: str, expected: tuple[int, int]) -> None:
+    assert compute_both(input_s) == expected
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
@@ -3,9 +3,8 @@ from __future__ import annotations
 import argparse
 import os.path
 
-import pytest
-
 import support
+from support.cache import cached
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
@@ -13,12 +12,8 @@ NestedList = int | list["NestedList"]
 
 
 def compute(s: str) -> int:
-    pairs: list[list[NestedList]] = [[]]
-    for line in s.splitlines():
-        if line:
-            pairs[-1].append(eval(line))
-        else:
-            pairs.append([])
+    packets = parse_packets(s)
+    pairs = zip(packets[0::2], packets[1::2])
 
     total = 0
     for i, (a, b) in enumerate(pairs):
@@ -27,13 +22,18 @@ def compute(s: str) -> int:
     return total
 
 
+@cached
+def parse_packets(s: str) -> list[NestedList]:
+    return [eval(line) for line in s.splitlines() if line]
+
+
 def cmp(a: NestedList, b: NestedList) -> int:
     if isinstance(a, int) and isinstance(b, int):
         if a == b:
             return 0
         return -1 if a < b else 1
     if isinstance(a, list) and isinstance(b, list):
-        for (x, y) in zip(a, b):
+        for x, y in zip(a, b):
             if cmp(x, y) == 0:
                 continue
             return cmp(x, y)
@@ -74,7 +74,7 @@ INPUT_S = """[1,1,3,1,1]
 EXPECTED = 13
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -85,9 +85,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
@@ -4,9 +4,8 @@ import argparse
 import os.path
 from functools import cmp_to_key
 
-import pytest
-
 import support
+from support.cache import cached
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
@@ -14,22 +13,24 @@ NestedList = int | list["NestedList"]
 
 
 def compute(s: str) -> int:
-    signals = []
-    for line in s.splitlines():
-        if line:
-            signals.append(eval(line))
+    signals = parse_packets(s)
     signals.extend([[[2]], [[6]]])
     signals.sort(key=cmp_to_key(cmp))
     return (signals.index([[2]]) + 1) * (signals.index([[6]]) + 1)
 
 
+@cached
+def parse_packets(s: str) -> list[NestedList]:
+    return [eval(line) for line in s.splitlines() if line]
+
+
 def cmp(a: NestedList, b: NestedList) -> int:
     if isinstance(a, int) and isinstance(b, int):
         if a == b:
             return 0
         return -1 if a < b else 1
     if isinstance(a, list) and isinstance(b, list):
-        for (x, y) in zip(a, b):
+        for x, y in zip(a, b):
             if cmp(x, y) == 0:
                 continue
             return cmp(x, y)
@@ -70,7 +71,7 @@ INPUT_S = """[1,1,3,1,1]
 EXPECTED = 140
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -81,9 +82,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
@@ -4,8 +4,6 @@ import argparse
 import os.path
 import sys
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
@@ -15,23 +13,21 @@ MAX_Y = 1000
 
 def compute(s: str) -> int:
     y_bound = 0
-    cavemap = [["." for _ in range(1000)] for _ in range(MAX_Y)]
+    with support.span("build"):
+        cavemap = support.Grid(1000, MAX_Y, fill=ord("."))
     start = (500, 0)
     for line in s.splitlines():
-        points = line.split(" -> ")
-        for point in points:
-            cur = [int(x) for x in point.split(",")]
-            if y_bound <= cur[1]:
-                y_bound = cur[1]
-
-        cur = [int(x) for x in points[0].split(",")]
-        for point in points[1:]:
-            next = [int(x) for x in point.split(",")]
+        coords = support.ints(line)
+        y_bound = max(y_bound, *coords[1::2])
+
+        cur = [coords[0], coords[1]]
+        for i in range(2, len(coords), 2):
+            next = [coords[i], coords[i + 1]]
             while cur != next:
                 if MAX_Y <= cur[1]:
                     print("Out of bounds", file=sys.stderr)
                     sys.exit(1)
-                cavemap[cur[1]][cur[0]] = "#"
+                cavemap[cur[0], cur[1]] = ord("#")
                 if cur[0] < next[0]:
                     cur[0] += 1
                 elif cur[0] > next[0]:
@@ -40,49 +36,49 @@ def compute(s: str) -> int:
                     cur[1] += 1
                 elif cur[1] > next[1]:
                     cur[1] -= 1
-            cavemap[cur[1]][cur[0]] = "#"
-    cavemap[start[1]][start[0]] = "+"
+            cavemap[cur[0], cur[1]] = ord("#")
+    cavemap[start] = ord("+")
 
     # printmap(cavemap, y_bound)
 
-    sands = []
+    data = cavemap.data
+    source = cavemap.index(*start)
+    below = cavemap.stride
+    sands = 0
     try:
-        while True:
-            if cavemap[start[1]][start[0]] == "o":
-                break
-            cursand = list(start)
+        while data[source] != ord("o"):
+            cursand = source
             while True:
-                if cavemap[cursand[1] + 1][cursand[0]] == ".":
-                    cursand[1] += 1
-                elif cavemap[cursand[1] + 1][cursand[0] - 1] == ".":
-                    cursand[0] -= 1
-                    cursand[1] += 1
-                elif cavemap[cursand[1] + 1][cursand[0] + 1] == ".":
-                    cursand[0] += 1
-                    cursand[1] += 1
+                if data[cursand + below] == ord("."):
+                    cursand += below
+                elif data[cursand + below - 1] == ord("."):
+                    cursand += below - 1
+                elif data[cursand + below + 1] == ord("."):
+                    cursand += below + 1
                 else:
                     break
-            cavemap[cursand[1]][cursand[0]] = "o"
-            sands.append(cursand)
+            data[cursand] = ord("o")
+            sands += 1
     except IndexError:
         pass
     printmap(cavemap, y_bound)
-    return len(sands)
+    return sands
 
 
-def printmap(cavemap: list[list[str]], y_bound: int) -> None:
+def printmap(cavemap: support.Grid, y_bound: int) -> None:
+    rows = [row.decode() for row in cavemap.rows()]
     bounds = [500, 500]
     for x in range(500, 1000):
-        col = [row[x] for row in cavemap[0 : y_bound + 1]]
+        col = [row[x] for row in rows[0 : y_bound + 1]]
         if all(c == "." for c in col):
             bounds[1] = x
             break
     for x in range(500, 0, -1):
-        col = [row[x] for row in cavemap[0 : y_bound + 1]]
+        col = [row[x] for row in rows[0 : y_bound + 1]]
         if all(c == "." for c in col):
             bounds[0] = x
             break
-    for row in cavemap[0 : y_bound + 1]:
+    for row in rows[0 : y_bound + 1]:
         print("".join(row[bounds[0] : bounds[1] + 1]), file=sys.stderr)
 
 
@@ -92,7 +88,7 @@ INPUT_S = """498,4 -> 498,6 -> 496,6
 EXPECTED = 24
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -103,9 +99,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
@@ -2,9 +2,6 @@ from __future__ import annotations
 
 import argparse
 import os.path
-import re
-
-import pytest
 
 import support
 
@@ -12,26 +9,18 @@ INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 Y_LEVEL = 2000000
 
 
-line_re = re.compile(
-    r"Sensor at x=(-?\d+), y=(-?\d+): closest beacon is at x=(-?\d+), y=(-?\d+)"
-)
-
-
-def compute(s: str, y: int) -> int:
-    blocks = set()
+def compute(s: str, y: int = Y_LEVEL) -> int:
+    spans = []
     beacons = set()
-    for line in s.splitlines():
-        sxstr, systr, bxstr, bystr = line_re.match(
-            line
-        ).groups()  # type: ignore[union-attr]
-        sx, sy, bx, by = map(int, (sxstr, systr, bxstr, bystr))
+    nums = support.int_array(s, 4)
+    for sx, sy, bx, by in zip(nums[0::4], nums[1::4], nums[2::4], nums[3::4]):
         if by == y:
             beacons.add(bx)
         distance = abs(sx - bx) + abs(sy - by)
         xrange = distance - abs(sy - y)
-        for x in range(sx - xrange, sx + xrange + 1):
-            blocks.add((x, y))
-    return len(blocks) - len(beacons)
+        spans.append((sx - xrange, sx + xrange + 1))
+    blocks = support.IntervalSet(spans)
+    return blocks.length() - len(beacons)
 
 
 INPUT_S = """\
@@ -53,7 +42,7 @@ Sensor at x=20, y=1: closest beacon is at x=15, y=3
 EXPECTED = 26
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "y", "expected"),
     ((INPUT_S, 10, EXPECTED),),
 )
@@ -64,9 +53,10 @@ def test(input_s: str, y: int, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read(), Y_LEVEL))
 
     return 0
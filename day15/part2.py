@@ -2,10 +2,6 @@ from __future__ import annotations
 
 import argparse
 import os.path
-import re
-
-import pytest
-from tqdm import tqdm
 
 import support
 
@@ -13,46 +9,61 @@ INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 MAX_COOR = 4_000_000
 
 
-line_re = re.compile(
-    r"Sensor at x=(-?\d+), y=(-?\d+): closest beacon is at x=(-?\d+), y=(-?\d+)"
-)
+def compute(s: str, max_coor: int = MAX_COOR) -> int:
+    sensors = []
+    nums = support.int_array(s, 4)
+    for sx, sy, bx, by in zip(nums[0::4], nums[1::4], nums[2::4], nums[3::4]):
+        sensors.append((sx, sy, abs(sx - bx) + abs(sy - by)))
+
+    # the space is on one of a few rows, on each the spans the sensors cover
+    # are merged and the space is the gap left in them
+    with support.span("candidates"):
+        rows = sorted(candidate_rows(sensors, max_coor))
+    support.count("candidate rows", len(rows))
+    with support.span("search"):
+        for y in rows:
+            covered = support.IntervalSet(
+                (sx - (distance - abs(sy - y)), sx + (distance - abs(sy - y)) + 1)
+                for sx, sy, distance in sensors
+                if abs(sy - y) <= distance
+            )
+            for x, _ in covered.gaps(0, max_coor + 1):
+                return tuning_freq(x, y)
 
+    raise ValueError("No solution found")
 
-def compute(s: str, max_coor: int) -> int:
-    # Parse the input
-    sensors = {}
-    for line in s.splitlines():
-        sxstr, systr, bxstr, bystr = line_re.match(
-            line
-        ).groups()  # type: ignore[union-attr]
-        sx, sy, bx, by = map(int, (sxstr, systr, bxstr, bystr))
-        distance = abs(sx - bx) + abs(sy - by)
-        sensors[(sx, sy)] = distance
-
-    # If there is only one possible space outside sensor range, it should be
-    # be just outside the sensor range. Create a list of all possible spaces.
-    # Using a list to store the space since using a set is not performant
-    # despite the fact that it would lead to us checking some values multiple
-    # times.
-    perimeters = []
-    for (sx, sy), distance in tqdm(sensors.items()):
-        for i in range(distance + 1):
-            perimeters.append((sx - distance - 1 + i, sy - i))
-            perimeters.append((sx + i, sy - distance - 1 + i))
-            perimeters.append((sx + distance + 1 - i, sy + i))
-            perimeters.append((sx - i, sy + distance + 1 - i))
-
-    # Check each possible space to see if it is outside the sensor range.
-    for (x, y) in tqdm(perimeters):
-        if x < 0 or x > max_coor or y < 0 or y > max_coor:
-            continue
-        for sx, sy in sensors:
-            if abs(x - sx) + abs(y - sy) <= sensors[(sx, sy)]:
-                break
-        else:  # no break
-            return tuning_freq(x, y)
 
-    raise ValueError("No solution found")
+def candidate_rows(sensors: list[tuple[int, int, int]], max_coor: int) -> set[int]:
+    # the edges of a sensor's range are on the lines y - x = rising and
+    # y + x = falling.  the one space no sensor reaches is 1 past an edge of
+    # some range, and also 1 past an edge of the other kind or on the edge
+    # of the area.  boxed in between edges of the same kind, it is 1 or 2
+    # past an edge of the other kind instead, where those ranges end
+    rising: list[set[int]] = [set(), set()]
+    falling: list[set[int]] = [set(), set()]
+    for sx, sy, distance in sensors:
+        for past in (1, 2):
+            rising[past - 1].update(
+                (sy - sx - distance - past, sy - sx + distance + past),
+            )
+            falling[past - 1].update(
+                (sy + sx - distance - past, sy + sx + distance + past),
+            )
+
+    rows = {0, max_coor}
+    for a in rising[0]:
+        rows.update((a, a + max_coor))
+    for b in falling[0]:
+        rows.update((b, b - max_coor))
+    for ups, downs in (
+        (rising[0], falling[0] | falling[1]),
+        (rising[1], falling[0]),
+    ):
+        for a in ups:
+            for b in downs:
+                if (a + b) % 2 == 0:
+                    rows.add((a + b) // 2)
+    return {y for y in rows if 0 <= y <= max_coor}
 
 
 def tuning_freq(x: int, y: int) -> int:
@@ -76,11 +87,22 @@ Sensor at x=14, y=3: closest beacon is at x=15, y=3
 Sensor at x=20, y=1: closest beacon is at x=15, y=3
 """
 EXPECTED = 56000011
+# the space is at the tip of two ranges, boxed in by edges that run the
+# same way on either side of it
+INPUT_TIP = """\
+Sensor at x=-3, y=10: closest beacon is at x=-3, y=0
+Sensor at x=11, y=5: closest beacon is at x=11, y=13
+Sensor at x=0, y=2: closest beacon is at x=0, y=6
+Sensor at x=7, y=0: closest beacon is at x=7, y=6
+"""
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "max_coor", "expected"),
-    ((INPUT_S, 20, EXPECTED),),
+    (
+        (INPUT_S, 20, EXPECTED),
+        (INPUT_TIP, 8, 3 * 4000000 + 4),
+    ),
 )
 def test(input_s: str, max_coor: int, expected: int) -> None:
     assert compute(input_s, max_coor) == expected
@@ -89,9 +111,10 @@ def test(input_s: str, max_coor: int, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read(), MAX_COOR))
 
     return 0
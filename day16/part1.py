@@ -3,12 +3,10 @@ from __future__ import annotations
 import argparse
 import os.path
 import re
-import sys
 from collections import deque
 
-import pytest
-
 import support
+from support.optimize import branch_and_bound
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
@@ -24,20 +22,9 @@ class Node:
         self.links = links
         self.flow_rate = flow_rate
 
-    def close(self, time: int) -> int:
-        flow_rate = self.flow_rate
-        self.flow_rate = 0
-        return time * flow_rate
-
-    def get_total_pressure(self, time: int) -> tuple[int, int]:
-        return (time - 1) * self.flow_rate, time - 1
-
     def __repr__(self) -> str:
         return f"Node({self.name!r}, {self.flow_rate!r})"
 
-    def copy(self) -> Node:
-        return Node(self.name, self.links.copy(), self.flow_rate)
-
 
 def parse(s: str) -> dict[str, Node]:
     nodes = {}
@@ -65,71 +52,60 @@ def get_distances(nodes: dict[str, Node], cur: str) -> dict[str, int]:
     return distances
 
 
-def get_pressure_release(
-    nodes: dict[str, Node], cur: str, time: int
-) -> dict[str, tuple[int, int]]:
-    distances = get_distances(nodes, cur)
-    pressure_release = {}
-    for name, distance in distances.items():
-        pressure_release[name] = nodes[name].flow_rate, time - distance - 1
-    return pressure_release
-
-
-def get_best_choice(
-    nodes: dict[str, Node], cur: str, time: int, path: str = ""
-) -> tuple[str, int]:
-    best_pressure = 0
-    pressure_release = get_pressure_release(nodes, cur, time)
-    choices = [
-        (name, pressure * time, time)
-        for name, (pressure, time) in pressure_release.items()
-        if time > 0 and pressure > 0
+def get_best_choice(nodes: dict[str, Node], cur: str, time: int) -> int:
+    # a state is the valves opened, a bit each, the time left and the valve
+    # just opened (or the start, after the valves)
+    valves = [name for name, node in nodes.items() if node.flow_rate > 0]
+    flows = [nodes[name].flow_rate for name in valves]
+    places = valves + [cur]
+    dist = [
+        [distances[valve] for valve in valves]
+        for distances in (get_distances(nodes, place) for place in places)
+    ]
+    by_flow = sorted(range(len(valves)), key=flows.__getitem__, reverse=True)
+    # the soonest another valve can be opened, from here and after that
+    first = [
+        1 + min((d for j, d in enumerate(row) if j != i), default=time)
+        for i, row in enumerate(dist)
     ]
-    choices.sort(key=lambda x: x[1], reverse=True)
-
-    if not choices:
-        return "", 0
-
-    for name, _, newtime in choices:
-        nextnodes = {k: v.copy() for k, v in nodes.items()}
-        extra_pressure = nextnodes[name].close(newtime)
-        potential = extra_pressure + pressure_release_potential(
-            get_pressure_release(nextnodes, name, newtime)
-        )
-
-        if potential <= best_pressure:
-            continue
-        newname, new_pressure = get_best_choice(
-            nextnodes, name, newtime, f"{path} -> {name}"
-        )
-        total_pressure = extra_pressure + new_pressure
-
-        if total_pressure > best_pressure:
-            best_pressure = total_pressure
-            best_name = name
-            print(f"{path:40}: {name} {total_pressure}", file=sys.stderr)
-
-    return best_name, best_pressure
-
-
-def pressure_release_potential(releases: dict[str, tuple[int, int]]) -> int:
-    releases_list = list(releases.values())
-    releases_list.sort(key=lambda x: x[0] * x[1], reverse=True)
-    dtime = 0
-    potential = 0
-    for pressure, time in releases_list:
-        potential += pressure * (time - dtime)
-        dtime -= 1
-        if time - dtime <= 0:
-            break
-    return potential
+    step = min(first[: len(valves)], default=1)
+
+    State = tuple[int, int, int]
+
+    def children(state: State) -> list[tuple[State, int]]:
+        opened, time, place = state
+        moves = []
+        for valve, flow in enumerate(flows):
+            left = time - dist[place][valve] - 1
+            if left > 0 and not opened >> valve & 1:
+                moves.append(((opened | 1 << valve, left, valve), flow * left))
+        moves.sort(key=lambda move: move[1], reverse=True)
+        return moves
+
+    def bound(state: State) -> int:
+        # the biggest flows first, one as soon as it could be each time
+        opened, time, place = state
+        time -= first[place]
+        potential = 0
+        for valve in by_flow:
+            if time <= 0:
+                break
+            if not opened >> valve & 1:
+                potential += flows[valve] * time
+                time -= step
+        return potential
+
+    start = (0, time, len(valves))
+    return branch_and_bound(start, children, bound).value
 
 
 def compute(s: str) -> int:
-    nodes = parse(s)
+    with support.span("parse"):
+        nodes = parse(s)
     time = 30
     cur = "AA"
-    _, total_pressure = get_best_choice(nodes, cur, time)
+    with support.span("search"):
+        total_pressure = get_best_choice(nodes, cur, time)
     return total_pressure
 
 
@@ -148,7 +124,7 @@ Valve JJ has flow rate=21; tunnel leads to valve II
 EXPECTED = 1651
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -159,9 +135,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
@@ -2,121 +2,54 @@ from __future__ import annotations
 
 import argparse
 import os.path
-import sys
-
-import pytest
 
 import support
 
-Blocks = list[tuple[int, int]]
-BlockSet = tuple[Blocks, Blocks, Blocks]
-
-
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
-SHAPES = [
-    (
-        [(0, 0), (0, 1), (0, 2), (0, 3)],
-        (
-            [(0, 4)],
-            [(0, -1)],
-            [(-1, 0), (-1, 1), (-1, 2), (-1, 3)],
-        ),
-    ),
-    (
-        [(0, 1), (1, 0), (1, 1), (1, 2), (2, 1)],
-        (
-            [(0, 2), (1, 3), (2, 2)],
-            [(0, 0), (1, -1), (2, 0)],
-            [(0, 0), (-1, 1), (0, 2)],
-        ),
-    ),
-    (
-        [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)],
-        (
-            [(0, 3), (1, 3), (2, 3)],
-            [(0, -1), (1, 1), (2, 1)],
-            [(-1, 0), (-1, 1), (-1, 2)],
-        ),
-    ),
-    (
-        [(0, 0), (1, 0), (2, 0), (3, 0)],
-        (
-            [(0, 1), (1, 1), (2, 1), (3, 1)],
-            [(0, -1), (1, -1), (2, -1), (3, -1)],
-            [(-1, 0)],
-        ),
-    ),
-    (
-        [(0, 0), (0, 1), (1, 0), (1, 1)],
-        (
-            [(0, 2), (1, 2)],
-            [(0, -1), (1, -1)],
-            [(-1, 0), (-1, 1)],
-        ),
-    ),
+WIDTH = 7
+
+# each rock is a bitmask per row, bottom row first, with bit x for column x
+ROCKS = [
+    [0b1111],
+    [0b010, 0b111, 0b010],
+    [0b111, 0b100, 0b100],
+    [0b1, 0b1, 0b1, 0b1],
+    [0b11, 0b11],
 ]
 
 
-def generate_rock(
-    round: int, height: int
-) -> tuple[list[int], list[tuple[int, int]], BlockSet]:
-    pos = [height + 3, 2]
-    return pos, *SHAPES[round % len(SHAPES)]
-
-
-def moveblock(
-    chamber: list[list[str]], pos: list[int], blocks: BlockSet, direction: str
-) -> bool:
-    sideblock = blocks[{">": 0, "<": 1}[direction]]
-    downblock = blocks[2]
-    if all(
-        pos[1] + dx >= 0
-        and pos[1] + dx < 7
-        and chamber[pos[0] + dy][pos[1] + dx] == "."
-        for dy, dx in sideblock
-    ):
-        # print(f"Moving {direction} from {pos} to ", end="")
-        pos[1] += {">": 1, "<": -1}[direction]
-        # print(pos)
-
-    if all(
-        pos[1] + dx >= 0
-        and pos[1] + dx < 7
-        and pos[0] + dy >= 0
-        and chamber[pos[0] + dy][pos[1] + dx] == "."
-        for dy, dx in downblock
-    ):
-        # print(f"Moving v from {pos} to ", end="")
-        pos[0] -= 1
-        # print(pos)
-        return True
-
-    return False
+def fits(chamber: support.BitGrid, rock: list[int], x: int, y: int) -> bool:
+    if x < 0 or y < 0:
+        return False
+    return not any(
+        (bits << x) >> WIDTH or chamber.row(y + dy) & bits << x
+        for dy, bits in enumerate(rock)
+    )
 
 
 def compute(s: str) -> int:
     s = s.strip()
-    chamber = [["." for _ in range(7)] for _ in range(1000000)]
+    chamber = support.BitGrid()
     n = len(s)
     i = 0
     height = 0
     for round in range(2022):
-        pos, shape, blocks = generate_rock(round, height)
-        # print(pos)
-        while moveblock(chamber, pos, blocks, s[i % n]):
+        rock = ROCKS[round % len(ROCKS)]
+        x, y = 2, height + 3
+        while True:
+            dx = 1 if s[i % n] == ">" else -1
             i += 1
+            if fits(chamber, rock, x + dx, y):
+                x += dx
+            if fits(chamber, rock, x, y - 1):
+                y -= 1
+            else:
+                break
 
-        for x, y in shape:
-            try:
-                chamber[pos[0] + x][pos[1] + y] = "#"
-            except IndexError:
-                print(pos, x, y, i, round, file=sys.stderr)
-                raise
-            height = max(height, pos[0] + x + 1)
-
-        i += 1
-        # print("Round", round, "height", height, "i", i)
+        for dy, bits in enumerate(rock):
+            chamber.set_row(y + dy, chamber.row(y + dy) | bits << x)
+        height = max(height, y + len(rock))
 
     return height
 
@@ -127,7 +60,7 @@ INPUT_S = """\
 EXPECTED = 3068
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -138,9 +71,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
@@ -3,15 +3,14 @@ from __future__ import annotations
 import argparse
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
 def compute(s: str) -> int:
-    cubes = [eval(line) for line in s.splitlines()]
+    nums = support.int_array(s, 3)
+    cubes = list(zip(nums[0::3], nums[1::3], nums[2::3]))
     area = 6 * len(cubes)
     for i, c1 in enumerate(cubes):
         for c2 in cubes[i + 1 :]:
@@ -38,7 +37,7 @@ INPUT_S = """\
 EXPECTED = 64
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -49,9 +48,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
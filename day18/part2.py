@@ -2,65 +2,41 @@ from __future__ import annotations
 
 import argparse
 import os.path
-from collections import deque
 from typing import Iterator
 
-import pytest
-
 import support
+from support.search import bfs
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
-D_NEIGHBOUR = [(1, 0, 0), (0, 1, 0), (0, 0, 1), (-1, 0, 0), (0, -1, 0), (0, 0, -1)]
-
-
-def get_neighbours(
-    c: tuple[int, int, int], max_dim: int
-) -> Iterator[tuple[int, int, int]]:
-    for dx, dy, dz in D_NEIGHBOUR:
-        x, y, z = c
-        x += dx
-        y += dy
-        z += dz
-        if 0 <= x <= max_dim and 0 <= y <= max_dim and 0 <= z <= max_dim:
-            yield (x, y, z)
+def get_neighbours(i: int, lava: bytearray, offsets: list[int]) -> Iterator[int]:
+    for d in offsets:
+        j = i + d
+        if 0 <= j < len(lava) and not lava[j]:
+            yield j
 
 
 def compute(s: str) -> int:
-    cubes = [eval(line) for line in s.splitlines()]
-    max_side = max(max(c) for c in zip(*cubes))
-    cells = [
-        [[0 for _ in range(max_side + 1)] for _ in range(max_side + 1)]
-        for _ in range(max_side + 1)
-    ]
-    cells[0][0][0] = 1
-    queue = deque([(0, 0, 0)])
-    visited = set(cubes)
-    visited.add(queue[0])
-
-    while queue:
-        x, y, z = queue.popleft()
-        for nx, ny, nz in get_neighbours((x, y, z), max_side):
-            if (nx, ny, nz) not in visited:
-                visited.add((nx, ny, nz))
-                queue.append((nx, ny, nz))
-                cells[nx][ny][nz] = 1
-
-    cubes = [
-        (x, y, z)
-        for x, row in enumerate(cells)
-        for y, col in enumerate(row)
-        for z, c in enumerate(col)
-        if c == 0
-    ]
-
-    area = 6 * len(cubes)
-    for i, c1 in enumerate(cubes):
-        for c2 in cubes[i + 1 :]:
-            if sum(abs(a - b) for a, b in zip(c1, c2)) == 1:
-                area -= 2
-    return area
+    nums = support.int_array(s, 3)
+    cubes = list(zip(nums[0::3], nums[1::3], nums[2::3]))
+    # cubes are stored one in from the edges of the box so the air around
+    # them is connected.  steps off a row only land elsewhere in that border
+    side = max(max(c) for c in zip(*cubes)) + 3
+    offsets = [side * side, side, 1, -side * side, -side, -1]
+    lava = bytearray(side**3)
+    for x, y, z in cubes:
+        lava[((x + 1) * side + y + 1) * side + z + 1] = 1
+
+    with support.span("search"):
+        outside = bfs([0], lambda i: get_neighbours(i, lava, offsets), size=len(lava))
+
+    return sum(
+        outside.distance(i + d) is not None
+        for i, c in enumerate(lava)
+        if c
+        for d in offsets
+    )
 
 
 INPUT_S = """\
@@ -81,7 +57,7 @@ INPUT_S = """\
 EXPECTED = 58
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -92,9 +68,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
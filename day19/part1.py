@@ -1,16 +1,13 @@
 from __future__ import annotations
 
 import argparse
-import copy
 import os.path
 import re
 import sys
 from dataclasses import dataclass
-from typing import Literal
-
-import pytest
 
 import support
+from support.optimize import branch_and_bound
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
@@ -22,7 +19,7 @@ BLUEPRINT_RE = re.compile(
     r"\s*Each geode robot costs (?P<geore>\d+) ore and (?P<geobs>\d+) obsidian\."
 )
 
-RobotType = Literal["ore", "clay", "Obsidian", "geode"]
+MINUTES = 24
 
 
 @dataclass
@@ -41,128 +38,79 @@ class Blueprint:
         self.geode = (int(matchdict["geore"]), int(matchdict["geobs"]))
 
 
-class GameState:
-    def __init__(self, blueprint: Blueprint) -> None:
-        self.blueprint = blueprint
-        self.ore = 0
-        self.clay = 0
-        self.obsidian = 0
-        self.geode = 0
-        self.ore_robots = 1
-        self.clay_robots = 0
-        self.obsidian_robots = 0
-        self.geode_robots = 0
-        self.time = 24
-        self.production: RobotType | None = None
-
-    def get_options(self) -> list[RobotType]:
-        options: list[RobotType] = []
-        if (
-            self.ore >= self.blueprint.geode[0]
-            and self.obsidian >= self.blueprint.geode[1]
-        ):
-            options.append("geode")
-        if (
-            self.ore >= self.blueprint.obsidian[0]
-            and self.clay >= self.blueprint.obsidian[1]
-        ):
-            options.append("Obsidian")
-        if self.ore >= self.blueprint.clay:
-            options.append("clay")
-        if self.ore >= self.blueprint.ore:
-            options.append("ore")
-        return options
-
-    def add_robot(self, robot: RobotType) -> None:
-        self.production = robot
-
-    def tick(self) -> None:
-        self.ore += self.ore_robots
-        self.clay += self.clay_robots
-        self.obsidian += self.obsidian_robots
-        self.geode += self.geode_robots
-        if self.production == "ore":
-            self.ore_robots += 1
-            self.ore -= self.blueprint.ore
-        elif self.production == "clay":
-            self.clay_robots += 1
-            self.ore -= self.blueprint.clay
-        elif self.production == "Obsidian":
-            self.obsidian_robots += 1
-            self.ore -= self.blueprint.obsidian[0]
-            self.clay -= self.blueprint.obsidian[1]
-        elif self.production == "geode":
-            self.geode_robots += 1
-            self.ore -= self.blueprint.geode[0]
-            self.obsidian -= self.blueprint.geode[1]
-        if self.ore < 0 or self.clay < 0 or self.obsidian < 0:
-            raise ValueError("Not enough resources")
-        self.production = None
-        self.time -= 1
-
-
 def evaluate_blueprint(blueprint: Blueprint) -> int:
-    overall_best = 0
-
-    def evaluate_game(
-        game: GameState, moves: str, ignores: list[RobotType] | None = None
-    ) -> int:
-        if game.time == 0:
-            nonlocal overall_best
-            if game.geode > overall_best:
-                overall_best = game.geode
-                print(f"{blueprint.id}: {moves}: {game.geode}", file=sys.stderr)
-            return game.geode
-        options = game.get_options()
-        if "geode" in options:
-            game.add_robot("geode")
-            game.tick()
-            return evaluate_game(game, moves + "G")
-        best_score = 0
-        for option in options:
-            if is_robot_good(option, game) and (
-                ignores is None or option not in ignores
-            ):
-                newgame = copy.copy(game)
-                newgame.add_robot(option)
-                newgame.tick()
-                best_score = max(best_score, evaluate_game(newgame, moves + option[0]))
-        newgame = copy.copy(game)
-        newgame.tick()
-        best_score = max(
-            best_score,
-            evaluate_game(
-                newgame,
-                moves + ".",
-                ignores=options if ignores is None else ignores + options,
-            ),
-        )
-        return best_score
-
-    state = GameState(blueprint)
-    return evaluate_game(state, "")
-
-
-def is_robot_good(robot: RobotType, game: GameState) -> bool:
-    blueprint = game.blueprint
-    time = game.time
-    if robot == "ore":
-        if time - 1 - blueprint.ore * game.ore_robots <= 0:
-            return False
-        return (
-            game.ore_robots
-            <= (max(blueprint.clay, blueprint.obsidian[0], blueprint.geode[0]) + 2) // 2
-        )
-
-    elif robot == "clay":
-        return game.clay_robots <= blueprint.obsidian[1] // 2 + 1
-    elif robot == "obsidian":
-        return True
-    return True
+    # a state is (minutes left, robots, stock) with the robots and stock as
+    # (ore, clay, obsidian).  each move waits for a robot and builds it, a
+    # geode robot is worth the geodes it will crack in the minutes left
+    obs_ore, obs_clay = blueprint.obsidian
+    geode_ore, geode_obs = blueprint.geode
+    # what each robot costs and what it adds to the robots, geode first
+    robots = (
+        ((geode_ore, 0, geode_obs), (0, 0, 0)),
+        ((obs_ore, obs_clay, 0), (0, 0, 1)),
+        ((blueprint.clay, 0, 0), (0, 1, 0)),
+        ((blueprint.ore, 0, 0), (1, 0, 0)),
+    )
+    # only one robot is built a minute, more of a robot than any robot costs
+    # of what it collects is no use
+    limits = tuple(max(cost[i] for cost, _ in robots) for i in range(3))
+
+    State = tuple[int, tuple[int, ...], tuple[int, ...]]
+
+    def children(state: State) -> list[tuple[State, int]]:
+        time, have, stock = state
+        moves = []
+        for cost, adds in robots:
+            if any(add and n >= limit for add, n, limit in zip(adds, have, limits)):
+                continue
+            # the minutes until there's enough of everything, and one to build
+            minutes = 1
+            for need, n, robots_n in zip(cost, stock, have):
+                if need > n:
+                    if not robots_n:
+                        break
+                    minutes = max(minutes, (need - n - 1) // robots_n + 2)
+            else:
+                left = time - minutes
+                if left > 0:
+                    child = (
+                        left,
+                        tuple(n + add for n, add in zip(have, adds)),
+                        tuple(
+                            n + robots_n * minutes - need
+                            for n, robots_n, need in zip(stock, have, cost)
+                        ),
+                    )
+                    moves.append((child, 0 if any(adds) else left))
+        return moves
+
+    def bound(state: State) -> int:
+        # as if ore were free and every kind of robot could be built at once,
+        # with a new clay robot every minute
+        time, (_, clay_r, obs_r), (_, clay, obs) = state
+        geodes = 0
+        for left in range(time - 1, -1, -1):
+            build_obs = clay >= obs_clay
+            build_geode = obs >= geode_obs
+            clay += clay_r
+            obs += obs_r
+            clay_r += 1
+            if build_obs:
+                clay -= obs_clay
+                obs_r += 1
+            if build_geode:
+                obs -= geode_obs
+                geodes += left
+        return geodes
+
+    start: State = (MINUTES, (1, 0, 0), (0, 0, 0))
+    with support.span("evaluate_blueprint"):
+        return branch_and_bound(start, children, bound).value
 
 
 def compute(s: str) -> int:
-    blueprints = parse(s)
+    with support.span("parse"):
+        blueprints = parse(s)
     scores = [evaluate_blueprint(blueprint) for blueprint in blueprints]
     for i, score in enumerate(scores, 1):
         print(f"Blueprint {i}: {score}", file=sys.stderr)
@@ -189,7 +137,7 @@ Blueprint 2:
 EXPECTED = 33
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -200,9 +148,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
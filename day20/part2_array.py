@@ -1,64 +1,64 @@
 from __future__ import annotations
 
 import argparse
+import math
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 
-class OrigIDList:
-    def __init__(self, list_: list[int]) -> None:
-        self.list_ = list_
-        self.n = len(list_)
-        self.orig_id = list(range(self.n))
-
-    def swap(self, i: int, j: int) -> int:
-        i %= self.n
-        j %= self.n
-        if i == 0 and j == self.n - 1:
-            self.list_ = self.list_[1:-1] + self.list_[:1] + self.list_[-1:]
-            self.orig_id = self.orig_id[1:-1] + self.orig_id[:1] + self.orig_id[-1:]
-            return self.n - 2
-        elif j == 0 and i == self.n - 1:
-            self.list_ = self.list_[:1] + self.list_[-1:] + self.list_[1:-1]
-            self.orig_id = self.orig_id[:1] + self.orig_id[-1:] + self.orig_id[1:-1]
-            return 1
-        else:
-            self.list_[i], self.list_[j] = self.list_[j], self.list_[i]
-            self.orig_id[i], self.orig_id[j] = self.orig_id[j], self.orig_id[i]
-            return j
-
-    def __getitem__(self, i: int) -> int:
-        return self.list_[i % self.n]
-
-    def oid(self, i: int) -> int:
-        return self.orig_id.index(i)
-
-    def move_forward(self, i: int, n: int) -> None:
-        j = i
-        n = n % (self.n - 1)
-        for _ in range(n):
-            j = self.swap(j, j + 1)
+class BlockList:
+    # the original ids in mixed order, in blocks of about sqrt(n) so that a
+    # move shifts two blocks rather than the whole list
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.size = max(1, math.isqrt(n))
+        self.rebuild(list(range(n)))
+
+    def rebuild(self, ids: list[int]) -> None:
+        self.blocks = [ids[i : i + self.size] for i in range(0, self.n, self.size)]
+        self.block_of = [0] * self.n
+        for b, block in enumerate(self.blocks):
+            for orig_id in block:
+                self.block_of[orig_id] = b
+        # rebuilt every `size` inserts, so no block grows past twice the size
+        self.inserts = 0
+
+    def ids(self) -> list[int]:
+        return [orig_id for block in self.blocks for orig_id in block]
+
+    def move(self, orig_id: int, n: int) -> None:
+        b = self.block_of[orig_id]
+        block = self.blocks[b]
+        i = sum(len(before) for before in self.blocks[:b]) + block.index(orig_id)
+        block.remove(orig_id)
+
+        i = (i + n) % (self.n - 1)
+        for b, block in enumerate(self.blocks):
+            if i <= len(block):
+                block.insert(i, orig_id)
+                self.block_of[orig_id] = b
+                break
+            i -= len(block)
+
+        self.inserts += 1
+        if self.inserts == self.size:
+            self.rebuild(self.ids())
 
 
 def compute(s: str) -> int:
-    vals = OrigIDList([811589153 * int(line) for line in s.splitlines()])
+    vals = [811589153 * v for v in support.ints(s)]
+    mixed = BlockList(len(vals))
     for _ in range(10):
-        for i in range(vals.n):
-            oi = vals.oid(i)
-            vals.move_forward(oi, vals[oi])
+        for orig_id, val in enumerate(vals):
+            mixed.move(orig_id, val)
 
-    i0 = vals.list_.index(0)
+    ids = mixed.ids()
+    i0 = ids.index(vals.index(0))
     coors = 1000, 2000, 3000
-    sum = 0
-    for i in coors:
-        sum += vals[i0 + i]
-
-    return sum
+    return sum(vals[ids[(i0 + i) % len(ids)]] for i in coors)
 
 
 INPUT_S = """\
@@ -73,7 +73,7 @@ INPUT_S = """\
 EXPECTED = 1623178306
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -84,9 +84,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
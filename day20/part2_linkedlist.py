@@ -4,8 +4,6 @@ import argparse
 import os.path
 from dataclasses import dataclass
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
@@ -49,7 +47,7 @@ def print_list(first: Node) -> None:
 
 
 def compute(s: str) -> int:
-    vals = [811589153 * int(line) for line in s.splitlines()]
+    vals = [811589153 * v for v in support.ints(s)]
     numvals = len(vals)
     first = Node(vals[0], None, None)  # type: ignore
     prev = first
@@ -105,7 +103,7 @@ INPUT_S = """\
 EXPECTED = 1623178306
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -116,9 +114,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
@@ -6,8 +6,6 @@ from collections import deque
 from dataclasses import dataclass
 from typing import Deque
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
@@ -89,6 +87,8 @@ def compute(s: str) -> int:
     triggers: dict[str, list[str]] = {}  # when a variable is updated, trigger these
     # triggers to be processed, these variables are already known to be ints
     trigger_queue: Deque[str] = deque()
+    # a variable's value never changes once known, it is only queued once
+    queued: set[str] = set()
     solve_queue: Deque[tuple[str, int]] = deque()
     vars: dict[str, int | Operation | Unknown] = {}
     for line in s.splitlines():
@@ -101,6 +101,7 @@ def compute(s: str) -> int:
             val.op = "="
         vars[var] = val
         if isinstance(val, int):
+            queued.add(var)
             trigger_queue.append(var)
         elif isinstance(val, Operation):
             triggers.setdefault(val.first, []).append(var)
@@ -121,7 +122,8 @@ def compute(s: str) -> int:
             result = operate(vars, trigger)
             if result is not None:
                 vars[trigger] = result
-                if trigger not in trigger_queue:
+                if trigger not in queued:
+                    queued.add(trigger)
                     trigger_queue.append(trigger)
 
     while solve_queue:
@@ -163,7 +165,7 @@ hmdt: 32
 EXPECTED = 301
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -174,9 +176,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
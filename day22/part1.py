@@ -2,110 +2,86 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+import re
 
 import support
-
-Position = tuple[int, int]
+from support.cache import cached
+from support.direction import RIGHT
+from support.direction import TURN_4
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
-# Coordinates are (x,y) tuples, and a point is addressed as m[y][x].
-
-DIR = {0: (1, 0), 1: (0, 1), 2: (-1, 0), 3: (0, -1)}
-
-
-def turn(dir: int, rot: str) -> int:
-    if rot == "L":
-        return (dir - 1) % 4
-    elif rot == "R":
-        return (dir + 1) % 4
-    else:
-        raise ValueError(f"Invalid rotation {rot}")
+# Cells are addressed by their flat index into the board grid.
 
 
 def parse(
     s: str,
-) -> tuple[list[list[str]], list[int | str]]:
-    boardmap = []
-    for line in s.splitlines()[:-2]:
-        boardmap.append(list(line))
-
-    width = max(len(row) for row in boardmap)
-    for row in boardmap:
-        row.extend([" "] * (width - len(row)))
-
-    instructions: list[int | str] = []
-    line = s.splitlines()[-1]
-    token = ""
-    for c in line:
-        if c in "LR":
-            instructions.append(int(token))
-            token = ""
-            instructions.append(c)
-        else:
-            token += c
-    if token:
-        instructions.append(int(token))
+) -> tuple[support.Grid, list[int | str]]:
+    lines = s.splitlines()
+    boardmap = support.Grid.from_str("\n".join(lines[:-2]), fill=" ")
+
+    path = lines[-1]
+    instructions: list[int | str] = [
+        int(token) if token.isdigit() else token
+        for token in re.findall(r"\d+|[LR]", path)
+    ]
 
     return boardmap, instructions
 
 
-def calc_neighbours(boardmap: list[list[str]]) -> list[list[list[Position]]]:
-    neighbors: list[list[list[Position]]] = []
-    for y, row in enumerate(boardmap):
-        neighbors.append([])
-        for x, _ in enumerate(row):
-            neighbors[y].append([])
-            for dx, dy in DIR.values():
-                nx, ny = x + dx, y + dy
-                if (
-                    0 <= nx < len(row)
-                    and 0 <= ny < len(boardmap)
-                    and boardmap[ny][nx] != " "
-                ):
-                    neighbors[y][x].append((nx, ny))
-                else:
-                    odx, ody = -dx, -dy
-                    i = 1
-                    nx, ny = x + odx * i, y + ody * i
-                    while (
-                        0 <= nx < len(row)
-                        and 0 <= ny < len(boardmap)
-                        and boardmap[ny][nx] != " "
-                    ):
-                        i += 1
-                        nx, ny = x + odx * i, y + ody * i
-                    nx, ny = x + odx * (i - 1), y + ody * (i - 1)
-                    neighbors[y][x].append((nx, ny))
+@cached
+def calc_neighbours(boardmap: support.Grid) -> list[list[int]]:
+    # the flat index one step away from every cell in each direction, empty
+    # for the cells off the board
+    data, stride = boardmap.data, boardmap.stride
+    row_spans = [span_of(row) for row in boardmap.rows()]
+    col_spans = [
+        span_of(data[x : boardmap.height * stride : stride])
+        for x in range(boardmap.width)
+    ]
+    neighbors: list[list[int]] = []
+    for i in range(boardmap.height * stride):
+        x, y = boardmap.coords(i)
+        if x >= boardmap.width or data[i] == ord(" "):
+            neighbors.append([])
+            continue
+        first_x, last_x = row_spans[y]
+        first_y, last_y = col_spans[x]
+        neighbors.append(
+            [
+                i + 1 if x < last_x else boardmap.index(first_x, y),
+                i + stride if y < last_y else boardmap.index(x, first_y),
+                i - 1 if x > first_x else boardmap.index(last_x, y),
+                i - stride if y > first_y else boardmap.index(x, last_y),
+            ]
+        )
     return neighbors
 
 
-def get_init_pos(boardmap: list[list[str]]) -> Position:
-    for y, row in enumerate(boardmap):
-        for x, c in enumerate(row):
-            if c == ".":
-                return x, y
-    raise ValueError("No starting position found")
+def span_of(line: bytes | bytearray) -> tuple[int, int]:
+    # the first and last positions on the board, which wrap around to each other
+    first = len(line) - len(line.lstrip(b" "))
+    last = len(line.rstrip(b" ")) - 1
+    return first, last
 
 
 def compute(s: str) -> int:
     boardmap, instructions = parse(s)
     neighbors = calc_neighbours(boardmap)
-    pos, dir = get_init_pos(boardmap), 0
+    pos, dir = boardmap.data.index(b"."), RIGHT
 
     for ins in instructions:
         if isinstance(ins, int):
             for _ in range(ins):
-                nx, ny = neighbors[pos[1]][pos[0]][dir]
-                if boardmap[ny][nx] == "#":
+                npos = neighbors[pos][dir]
+                if boardmap.data[npos] == ord("#"):
                     break
-                pos = nx, ny
+                pos = npos
         else:
-            dir = turn(dir, ins)
+            dir = TURN_4[ins][dir]
 
-    return 1000 * (pos[1] + 1) + 4 * (pos[0] + 1) + dir
+    x, y = boardmap.coords(pos)
+    return 1000 * (y + 1) + 4 * (x + 1) + dir
 
 
 INPUT_S = """\
@@ -127,7 +103,7 @@ INPUT_S = """\
 EXPECTED = 6032
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -135,12 +111,18 @@ def test(input_s: str, expected: int) -> None:
     assert compute(input_s) == expected
 
 
+def test_parse_trailing_turn() -> None:
+    _, instructions = parse("..\n\n10R5L\n")
+    assert instructions == [10, "R", 5, "L"]
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
@@ -2,13 +2,19 @@ from __future__ import annotations
 
 import argparse
 import os.path
+import re
 from collections import deque
 from itertools import product
 from typing import Literal
 
-import pytest
-
 import support
+from support.direction import DELTA_4
+from support.direction import DOWN
+from support.direction import LEFT
+from support.direction import OPPOSITE_4
+from support.direction import RIGHT
+from support.direction import TURN_4
+from support.direction import UP
 
 Position = tuple[int, int]
 Dir = int
@@ -17,8 +23,6 @@ Face = Literal[0, 1, 2, 3, 4, 5, 6]
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
 # Coordinates are (x,y) tuples, and a point is addressed as m[y][x].
-RIGHT, DOWN, LEFT, UP = range(4)
-DIRECTION_DELTA: list[Position] = [(1, 0), (0, 1), (-1, 0), (0, -1)]
 BLOCK_SIZE: int = 50
 
 CUBE_FACES: tuple[tuple[tuple[Face, Dir], ...], ...] = (
@@ -43,37 +47,22 @@ def get_adjacent_face(
     )
 
 
-def turn(dir: Dir, rot: str) -> Dir:
-    if rot == "L":
-        return (dir - 1) % 4
-    elif rot == "R":
-        return (dir + 1) % 4
-    else:
-        raise ValueError(f"Invalid rotation {rot}")
-
-
 def parse(
     s: str,
 ) -> tuple[list[list[str]], list[int | str]]:
+    lines = s.splitlines()
     boardmap = []
-    for line in s.splitlines()[:-2]:
+    for line in lines[:-2]:
         boardmap.append(list(line))
 
     width = max(len(row) for row in boardmap)
     for row in boardmap:
         row.extend([" "] * (width - len(row)))
-    instructions: list[int | str] = []
-    line = s.splitlines()[-1]
-    token = ""
-    for c in line:
-        if c in "LR":
-            instructions.append(int(token))
-            token = ""
-            instructions.append(c)
-        else:
-            token += c
-    if token:
-        instructions.append(int(token))
+    path = lines[-1]
+    instructions: list[int | str] = [
+        int(token) if token.isdigit() else token
+        for token in re.findall(r"\d+|[LR]", path)
+    ]
 
     return boardmap, instructions
 
@@ -102,7 +91,7 @@ def cubemap_from_boardmap(boardmap: list[list[str]]) -> list[list[tuple[Face, Di
     visited = set(queue)
     while queue:
         x, y = queue.popleft()
-        for di, (dx, dy) in enumerate(DIRECTION_DELTA):
+        for di, (dx, dy) in enumerate(DELTA_4):
             nx, ny = x + dx, y + dy
             if 0 <= nx < blockwidth and 0 <= ny < blockheight:
                 if cubemap[ny][nx][0] == 0:
@@ -146,7 +135,7 @@ def calc_neighbours(
     ]
 
     for face, (cx, cy) in cubepos.items():
-        for direction, (dx, dy) in enumerate(DIRECTION_DELTA):
+        for direction, (dx, dy) in enumerate(DELTA_4):
             for px, py in product(range(BLOCK_SIZE), repeat=2):
                 if 0 <= px + dx < BLOCK_SIZE and 0 <= py + dy < BLOCK_SIZE:
                     neighbors[cy * BLOCK_SIZE + py][cx * BLOCK_SIZE + px][direction] = (
@@ -162,7 +151,7 @@ def calc_neighbours(
             ncx, ncy = cubepos[nface]
             norient = cubemap[ncy][ncx][1]
             ndirection = (norient + n_dir_to_us_rel) % 4
-            new_direction = (ndirection + 2) % 4
+            new_direction = OPPOSITE_4[ndirection]
             n_edge_cells = get_edge_cells(ndirection, is_clockwise=False)
             for (px, py), (npx, npy) in zip(edge_cells, n_edge_cells):
                 neighbors[cy * BLOCK_SIZE + py][cx * BLOCK_SIZE + px][direction] = (
@@ -197,7 +186,7 @@ def compute(s: str) -> int:
                 pos = nx, ny
                 dir = nd
         else:
-            dir = turn(dir, ins)
+            dir = TURN_4[ins][dir]
 
     return 1000 * (pos[1] + 1) + 4 * (pos[0] + 1) + dir
 
@@ -221,7 +210,7 @@ INPUT_S = """\
 EXPECTED = 5031
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -231,12 +220,18 @@ def test(input_s: str, expected: int) -> None:
     assert compute(input_s) == expected
 
 
+def test_parse_trailing_turn() -> None:
+    _, instructions = parse("..\n\n10R5L\n")
+    assert instructions == [10, "R", 5, "L"]
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
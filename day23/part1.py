@@ -3,111 +3,72 @@ from __future__ import annotations
 import argparse
 import os.path
 
-import pytest
-
 import support
 
-
-Position = tuple[int, int]
-
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 
-DIRECTIONS = [
-    ((0, -1), [(-1, -1), (0, -1), (1, -1)]),
-    ((0, 1), [(-1, 1), (0, 1), (1, 1)]),
-    ((-1, 0), [(-1, -1), (-1, 0), (-1, 1)]),
-    ((1, 0), [(1, -1), (1, 0), (1, 1)]),
-]
-
-
-def draw_map(elves: list[Position]) -> tuple[list[list[str]], Position]:
-    min_x = min(x for x, _ in elves)
-    max_x = max(x for x, _ in elves)
-    min_y = min(y for _, y in elves)
-    max_y = max(y for _, y in elves)
-
-    offset = (min_x - 1, min_y - 1)
-
-    map_ = [["."] * (max_x - min_x + 3) for _ in range(max_y - min_y + 3)]
-    for x, y in elves:
-        map_[y - offset[1]][x - offset[0]] = "#"
-
-    return map_, offset
-
-
-def remove_overlaps(intentions: dict[Position, Position]) -> None:
-    poplist = []
-    for pos, target in intentions.items():
-        overlaps = 0
-        for (dx, dy) in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-            if intentions.get((target[0] + dx, target[1] + dy)) == target:
-                overlaps += 1
-        if overlaps > 1:
-            poplist.append(pos)
-    for pos in poplist:
-        intentions.pop(pos)
-
-
-def get_intentions(elves: list[Position], time: int) -> dict[Position, Position]:
-    map_, (mx, my) = draw_map(elves)
-
-    intentions: dict[Position, Position] = {}
-
-    elves_with_neighbours = []
-    for x, y in elves:
-        if any(
-            map_[y + dy - my][x + dx - mx] != "."
-            for dx, dy in [
-                (-1, -1),
-                (-1, 0),
-                (-1, 1),
-                (0, -1),
-                (0, 1),
-                (1, -1),
-                (1, 0),
-                (1, 1),
-            ]
-        ):
-            elves_with_neighbours.append((x, y))
-    for i in range(4):
-        direction, adjacents = DIRECTIONS[(time + i) % 4]
-        for x, y in elves_with_neighbours:
-            if (x, y) in intentions:
-                continue
-            if all(map_[y + dy - my][x + dx - mx] == "." for dx, dy in adjacents):
-                intentions[(x, y)] = (x + direction[0], y + direction[1])
-
-    return intentions
-
-
-def calc_blank(elves: list[Position]) -> int:
-    min_x = min(x for x, _ in elves)
-    max_x = max(x for x, _ in elves)
-    min_y = min(y for _, y in elves)
-    max_y = max(y for _, y in elves)
-
-    return (max_x - min_x + 1) * (max_y - min_y + 1) - len(elves)
+NORTH, SOUTH, WEST, EAST = range(4)
+
+
+def spread(elves: support.BitGrid, time: int) -> bool:
+    # one round for every row at once, returns whether any elf moved
+    min_x, min_y, max_x, max_y = elves.bounds()
+    # make sure no elf is on bit 0, it would be shifted off moving west
+    elves.grow(min_x - 1, min_y)
+    # with two empty rows either side, rows[i - 1] and rows[i + 1] always exist
+    ys = range(min_y - 2, max_y + 3)
+    rows = [elves.row(y) for y in ys]
+    proposals = [[0] * len(rows) for _ in range(4)]
+    for i in range(1, len(rows) - 1):
+        row = rows[i]
+        if not row:
+            continue
+        above, below = rows[i - 1], rows[i + 1]
+        free = [
+            ~(above | above << 1 | above >> 1),
+            ~(below | below << 1 | below >> 1),
+            ~(above << 1 | row << 1 | below << 1),
+            ~(above >> 1 | row >> 1 | below >> 1),
+        ]
+        movers = row & ~(free[NORTH] & free[SOUTH] & free[WEST] & free[EAST])
+        for d in range(time, time + 4):
+            proposing = movers & free[d % 4]
+            proposals[d % 4][i] = proposing
+            movers &= ~proposing
+
+    # only elves moving in opposite directions can pick the same cell
+    north, south, west, east = proposals
+    clash_ns = [0] * len(rows)
+    clash_we = [0] * len(rows)
+    for i in range(1, len(rows) - 1):
+        clash_ns[i] = north[i + 1] & south[i - 1]
+        clash_we[i] = west[i] >> 1 & east[i] << 1
+
+    moved = False
+    for i in range(1, len(rows) - 1):
+        leaving = (
+            north[i] & ~clash_ns[i - 1]
+            | south[i] & ~clash_ns[i + 1]
+            | west[i] & ~(clash_we[i] << 1)
+            | east[i] & ~(clash_we[i] >> 1)
+        )
+        arriving = (north[i + 1] | south[i - 1]) & ~clash_ns[i]
+        arriving |= (west[i] >> 1 | east[i] << 1) & ~clash_we[i]
+        if leaving or arriving:
+            moved = True
+            elves.set_row(ys[i], rows[i] & ~leaving | arriving)
+    return moved
 
 
 def compute(s: str) -> int:
-    elves: list[Position] = []
-    for y, line in enumerate(s.splitlines()):
-        for x, c in enumerate(line):
-            if c == "#":
-                elves.append((x, y))
+    elves = support.BitGrid.from_str(s)
 
     for time in range(10):
-        intentions = get_intentions(elves, time)
-        remove_overlaps(intentions)
-
-        if not intentions:
+        if not spread(elves, time):
             break
 
-        for pos, target in intentions.items():
-            elves.remove(pos)
-            elves.append(target)
-
-    return calc_blank(elves)
+    min_x, min_y, max_x, max_y = elves.bounds()
+    return (max_x - min_x + 1) * (max_y - min_y + 1) - len(elves)
 
 
 INPUT_S = """\
@@ -127,7 +88,7 @@ INPUT_S = """\
 EXPECTED = 110
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -138,9 +99,10 @@ def test(input_s: str, expected: int) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
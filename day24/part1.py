@@ -1,70 +1,73 @@
 from __future__ import annotations
 
 import argparse
+import math
 import os.path
 import sys
-from collections import deque
-from typing import Deque
 from typing import IO
 
-import pytest
-from termcolor import colored  # type: ignore
-
 import support
+from support.direction import offsets
+from support.search import bfs
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")
 PRINT_DEBUG = False
 
 
 class BlizzardMap:
-    def __init__(self, valleymap: list[list[str]]):
-        self.height = len(valleymap) - 2
-        self.width = len(valleymap[0]) - 2
-        self.horbliz: list[list[tuple[int, int]]] = [[] for _ in range(self.height)]
-        self.verbliz: list[list[tuple[int, int]]] = [[] for _ in range(self.width)]
-        for y, line in enumerate(valleymap[1:-1], 1):
-            for x, c in enumerate(line[1:-1], 1):
-                if c in "><":
-                    self.horbliz[y - 1].append((x - 1, {">": 1, "<": -1}[c]))
-                elif c in "^v":
-                    self.verbliz[x - 1].append((y - 1, {"^": -1, "v": 1}[c]))
-
-        self.start = (valleymap[0].index("."), 0)
-        self.end = (valleymap[-1].index("."), len(valleymap) - 1)
+    def __init__(self, valleymap: support.Grid):
+        self.valleymap = valleymap
+        self.height = valleymap.height - 2
+        self.width = valleymap.width - 2
+        # the blizzards are back where they started after `period` steps
+        self.period = math.lcm(self.width, self.height)
+        # a step each way, or staying put
+        self.moves = (*offsets(valleymap.stride), 0)
+        self.start = valleymap.coords(valleymap.data.index(b"."))
+        self.end = valleymap.coords(valleymap.data.rindex(b"."))
+
+    def blizzards_at(self, x: int, y: int, t: int) -> str:
+        # a blizzard is at (x, y) at time t if it started t steps upwind of it,
+        # the valley map is the state at t = 0
+        x, y = x - 1, y - 1
+        data, stride = self.valleymap.data, self.valleymap.stride
+        row = (y + 1) * stride + 1
+        return "".join(
+            c
+            for c, i in (
+                (">", row + (x - t) % self.width),
+                ("<", row + (x + t) % self.width),
+                ("v", ((y - t) % self.height + 1) * stride + x + 1),
+                ("^", ((y + t) % self.height + 1) * stride + x + 1),
+            )
+            if data[i] == ord(c)
+        )
 
     def is_blizzard(self, x: int, y: int, t: int) -> bool:
         x, y = x - 1, y - 1
-        for blizx, dx in self.horbliz[y]:
-            if (blizx + dx * t) % self.width == x:
-                return True
-        for blizy, dy in self.verbliz[x]:
-            if (blizy + dy * t) % self.height == y:
-                return True
-        return False
+        data, stride = self.valleymap.data, self.valleymap.stride
+        row = (y + 1) * stride + 1
+        return (
+            data[row + (x - t) % self.width] == ord(">")
+            or data[row + (x + t) % self.width] == ord("<")
+            or data[((y - t) % self.height + 1) * stride + x + 1] == ord("v")
+            or data[((y + t) % self.height + 1) * stride + x + 1] == ord("^")
+        )
 
     def draw_map(
         self,
         t: int,
         transpose: bool = False,
         glyphpos: list[tuple[int, int]] | None = None,
-        glyph: str = colored("o", "cyan"),
+        glyph: str = "\033[36mo\033[m",
         file: IO[str] = sys.stderr,
     ) -> None:
-        blizzmap = [["." for _ in range(self.width)] for _ in range(self.height)]
-        for y, row in enumerate(self.horbliz):
-            for blizx, dx in row:
-                x = (blizx + dx * t) % self.width
-                if blizzmap[y][x] == ".":
-                    blizzmap[y][x] = ">" if dx == 1 else "<"
-                else:
-                    blizzmap[y][x] = "X"
-        for x, col in enumerate(self.verbliz):
-            for blizy, dy in col:
-                y = (blizy + dy * t) % self.height
-                if blizzmap[y][x] == ".":
-                    blizzmap[y][x] = "^" if dy == -1 else "v"
-                else:
-                    blizzmap[y][x] = "X"
+        blizzmap: list[list[str]] = []
+        for y in range(1, self.height + 1):
+            blizzmap.append([])
+            for x in range(1, self.width + 1):
+                here = self.blizzards_at(x, y, t)
+                blizzmap[-1].append(here if len(here) == 1 else "X" if here else ".")
         bmap_w_border: list[list[str]] = (
             [["#" for _ in range(self.width + 2)]]
             + [["#"] + line + ["#"] for line in blizzmap]
@@ -92,68 +95,59 @@ class BlizzardMap:
 
 
 def get_neighbours(
-    blizzards: BlizzardMap,
-    x: int,
-    y: int,
-    t: int,
-    start: tuple[int, int],
-    end: tuple[int, int],
-) -> list[tuple[int, int]]:
+    blizzards: BlizzardMap, state: int, start: int, end: int
+) -> list[int]:
+    # a state is the time of the next move (in the blizzard cycle) and where
+    # we are, packed into an int
+    cells = len(blizzards.valleymap.data)
+    t, pos = divmod(state, cells)
+    data = blizzards.valleymap.data
+    next_t = (t + 1) % blizzards.period * cells
     neighbours = []
-    for dx, dy in ((0, 1), (1, 0), (0, -1), (-1, 0), (0, 0)):
-        nx, ny = x + dx, y + dy
-        if (nx, ny) == end:
-            return [(nx, ny)]
-        if (nx, ny) == start:
-            neighbours.append((nx, ny))
-            continue
-        if not (0 < nx <= blizzards.width and 0 < ny <= blizzards.height):
-            continue
-        if not blizzards.is_blizzard(nx, ny, t):
-            neighbours.append((nx, ny))
-    neighbours.sort(key=lambda p: abs(p[0] - end[0]) + abs(p[1] - end[1]))
+    for move in blizzards.moves:
+        npos = pos + move
+        if npos == start or npos == end:
+            neighbours.append(next_t + npos)
+        elif 0 <= npos < cells and data[npos] != ord("#"):
+            if not blizzards.is_blizzard(*blizzards.valleymap.coords(npos), t):
+                neighbours.append(next_t + npos)
     return neighbours
 
 
 def get_path_bfs(
-    blizzards: BlizzardMap, start: tuple[int, int], end: tuple[int, int]
+    blizzards: BlizzardMap,
+    start: tuple[int, int],
+    end: tuple[int, int],
+    start_time: int = 1,
 ) -> list[tuple[int, int]]:
-    queue: Deque[tuple[tuple[int, int], int, list[tuple[int, int]]]] = deque(
-        [(start, 1, [start])]
+    valleymap = blizzards.valleymap
+    cells = len(valleymap.data)
+    start_i, end_i = valleymap.index(*start), valleymap.index(*end)
+    result = bfs(
+        [start_time % blizzards.period * cells + start_i],
+        lambda state: get_neighbours(blizzards, state, start_i, end_i),
+        goal=lambda state: state % cells == end_i,
+        size=blizzards.period * cells,
     )
-    max_time = 0
-    while queue:
-        time = queue[0][1]
-        if time > max_time:
-            max_time = time
-            visited = set()
-            newqueue: Deque[
-                tuple[tuple[int, int], int, list[tuple[int, int]]]
-            ] = deque()
-            for pos, time, path in queue:
-                if pos not in visited:
-                    visited.add(pos)
-                    newqueue.append((pos, time, path))
-            queue = newqueue
-            if PRINT_DEBUG:
-                print(f"Time: {time}, queue: {len(queue)}", flush=True, file=sys.stderr)
-                blizzards.draw_map(
-                    time, transpose=False, glyphpos=[pos for pos, _, _ in queue]
-                )
-        pos, time, path = queue.popleft()
-        for nx, ny in get_neighbours(blizzards, *pos, time, start, end):
-            if (nx, ny) == end:
-                return path + [(nx, ny)]
-            queue.append(((nx, ny), time + 1, path + [(nx, ny)]))
-    raise ValueError("No path found")
+    if result.goal is None:
+        raise ValueError("No path found")
+    path = [valleymap.coords(state % cells) for state in result.path()]
+    if PRINT_DEBUG:
+        for time, pos in enumerate(path, start_time - 1):
+            print(f"Time: {time}", flush=True, file=sys.stderr)
+            blizzards.draw_map(time, transpose=False, glyphpos=[pos])
+    return path
 
 
 def compute(s: str) -> int:
-    valleymap = [list(line) for line in s.splitlines()]
-    start = (valleymap[0].index("."), 0)
-    end = (valleymap[-1].index("."), len(valleymap) - 1)
-    blizzards = BlizzardMap(valleymap)
-    path = get_path_bfs(blizzards, start, end)
+    with support.span("parse"):
+        valleymap = support.Grid.from_bytes(s.encode())
+    start = valleymap.coords(valleymap.data.index(b"."))
+    end = valleymap.coords(valleymap.data.rindex(b"."))
+    with support.span("build"):
+        blizzards = BlizzardMap(valleymap)
+    with support.span("search"):
+        path = get_path_bfs(blizzards, start, end)
 
     return len(path) - 1
 
@@ -169,7 +163,7 @@ INPUT_S = """\
 EXPECTED = 18
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -181,12 +175,13 @@ def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
     parser.add_argument("-v", "--verbose", action="store_true")
+    support.add_measure_args(parser)
     args = parser.parse_args()
     if args.verbose:
         global PRINT_DEBUG
         PRINT_DEBUG = True
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
+    with open(args.data_file) as f, support.measure(args), support.timing():
         print(compute(f.read()))
 
     return 0
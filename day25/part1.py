@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -18,6 +17,7 @@ PLACE_VALUE = {
 }
 
 PLACE_SYMBOLS = {v: k for k, v in PLACE_VALUE.items()}
+BYTE_VALUE = {ord(k): v for k, v in PLACE_VALUE.items()}
 
 
 def int_from_snafu(x: str) -> int:
@@ -45,8 +45,21 @@ def snafu_from_int(x: int) -> str:
 
 
 def compute(s: str) -> str:
-    nums = [int_from_snafu(x) for x in s.splitlines()]
-    result_in_decimal = sum(nums)
+    return compute_stream(s.splitlines())
+
+
+def compute_stream(lines: Iterable[str]) -> str:
+    result_in_decimal = sum(int_from_snafu(x) for x in lines)
+    return snafu_from_int(result_in_decimal)
+
+
+def compute_bytes(b: support.Bytes) -> str:
+    result_in_decimal = 0
+    for start, end in support.line_spans(b):
+        x = 0
+        for i in range(start, end):
+            x = x * 5 + BYTE_VALUE[b[i]]
+        result_in_decimal += x
     return snafu_from_int(result_in_decimal)
 
 
@@ -68,21 +81,24 @@ INPUT_S = """\
 EXPECTED = "2=-1=0"
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
 def test(input_s: str, expected: int) -> None:
     assert compute(input_s) == expected
+    assert compute_bytes(input_s.encode()) == expected
 
 
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    support.add_measure_args(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():  # type: ignore[attr-defined]
-        print(compute(f.read()))
+    with support.read_input(args.data_file) as b:
+        with support.measure(args), support.timing():
+            print(compute_bytes(b))
 
     return 0
 
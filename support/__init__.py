@@ -0,0 +1,809 @@
+from __future__ import annotations
+
+import argparse
+import array
+import atexit
+import bisect
+import collections
+import contextlib
+import enum
+import importlib
+import mmap
+import os.path
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+from typing import Iterator
+from typing import Sequence
+from typing import TypeVar
+
+if sys.platform != 'win32':
+    import resource
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+T = TypeVar('T')
+TFunc = TypeVar('TFunc', bound=Callable[..., Any])
+
+# input as bytes: `bytes` in tests, the `mmap` from `read_input` otherwise.
+# all of them index to ints, slice to bytes and have `find`
+Bytes = bytes | bytearray | mmap.mmap
+
+
+@contextlib.contextmanager
+def timing(name: str = '') -> Generator[None, None, None]:
+    before = time.perf_counter()
+    try:
+        with span(name or 'total'):
+            yield
+    finally:
+        after = time.perf_counter()
+        if name:
+            name = f' ({name})'
+        elapsed = format_elapsed(after - before)
+        print(f'> {elapsed}{name}', file=sys.stderr, flush=True)
+
+
+def format_elapsed(seconds: float) -> str:
+    t = seconds * 1000
+    unit = 'ms'
+    if t < 100:
+        t *= 1000
+        unit = 'μs'
+    return f'{int(t)} {unit}'
+
+
+def format_size(n: float) -> str:
+    for unit in ('B', 'KiB', 'MiB'):
+        if abs(n) < 1024:
+            return f'{n:.1f} {unit}'
+        n /= 1024
+    return f'{n:.1f} GiB'
+
+
+SIZE_RE = re.compile(r'^(\d+(?:\.\d+)?)\s*([KMG]?)i?B?$', re.IGNORECASE)
+
+
+def parse_size(s: str) -> int:
+    match = SIZE_RE.match(s.strip())
+    if match is None:
+        raise ValueError(f'invalid size: {s!r}')
+    power = ' KMG'.index(match[2].upper() or ' ')
+    return int(float(match[1]) * 1024 ** power)
+
+
+def peak_rss() -> int | None:
+    if sys.platform == 'win32':
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macos reports bytes
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+
+class Instrumentation:
+    def __init__(self) -> None:
+        self.stack: list[str] = []
+        # nested span names => [calls, total seconds, peak traced bytes]
+        self.spans: dict[tuple[str, ...], list[float]] = {}
+        self.counters: collections.Counter[str] = collections.Counter()
+        self.memory = False
+        # running peak of the open spans, outermost first
+        self.peaks: list[int] = [0]
+        # nested span names => [(allocation site, bytes)]
+        self.sites: dict[tuple[str, ...], list[tuple[str, int]]] = {}
+
+    def start_memory(self) -> None:
+        self.memory = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def peak_memory(self) -> int:
+        return max(self.peaks[0], tracemalloc.get_traced_memory()[1])
+
+    def _enter(self, name: str) -> None:
+        self.stack.append(name)
+        if self.memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            self.peaks[-1] = max(self.peaks[-1], peak)
+            self.peaks.append(0)
+            tracemalloc.reset_peak()
+
+    def _exit(self, elapsed: float) -> None:
+        path = tuple(self.stack)
+        self.stack.pop()
+        stats = self.spans.setdefault(path, [0, 0.0, 0])
+        stats[0] += 1
+        stats[1] += elapsed
+        if self.memory and len(self.peaks) > 1:
+            peak = max(self.peaks.pop(), tracemalloc.get_traced_memory()[1])
+            self.peaks[-1] = max(self.peaks[-1], peak)
+            stats[2] = max(stats[2], peak)
+            # snapshots are slow, only take them for the outer phases
+            if len(path) <= 2:
+                self.sites[path] = _top_allocation_sites()
+
+    def report(self) -> str:
+        lines = []
+        if self.spans:
+            lines.append('> spans')
+            for path, (calls, total, peak) in sorted(self.spans.items()):
+                label = f'{"  " * len(path)}{path[-1]}'
+                line = (
+                    f'{label:<40} {int(calls):>9} calls '
+                    f'{format_elapsed(total):>10}'
+                )
+                if self.memory:
+                    line += f' {format_size(peak):>12} peak'
+                lines.append(line)
+                for site, size in self.sites.get(path, ()):
+                    lines.append(f'{"  " * (len(path) + 2)}{format_size(size)} {site}')
+        if self.counters:
+            lines.append('> counters')
+            for name, n in sorted(self.counters.items()):
+                lines.append(f'  {name:<38} {n:>9}')
+        if self.memory:
+            lines.append(f'> peak traced: {format_size(self.peak_memory())}')
+            rss = peak_rss()
+            if rss is not None:
+                lines.append(f'> peak rss: {format_size(rss)}')
+        return '\n'.join(lines)
+
+
+def _top_allocation_sites(n: int = 3) -> list[tuple[str, int]]:
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, contextlib.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+        tracemalloc.Filter(False, '<unknown>'),
+    ))
+    return [
+        (f'{stat.traceback[0].filename}:{stat.traceback[0].lineno}', stat.size)
+        for stat in snapshot.statistics('lineno')[:n]
+    ]
+
+
+_instrumentation: Instrumentation | None = None
+
+
+def enable_instrumentation(
+    *,
+    report: bool = True,
+    memory: bool = False,
+) -> Instrumentation:
+    global _instrumentation
+    if _instrumentation is None:
+        _instrumentation = Instrumentation()
+        if report:
+            atexit.register(_print_instrumentation_report, _instrumentation)
+    if memory and not _instrumentation.memory:
+        _instrumentation.start_memory()
+    return _instrumentation
+
+
+def disable_instrumentation() -> None:
+    global _instrumentation
+    if _instrumentation is not None and _instrumentation.memory:
+        tracemalloc.stop()
+    _instrumentation = None
+
+
+def _print_instrumentation_report(instrumentation: Instrumentation) -> None:
+    report = instrumentation.report()
+    if report:
+        print(report, file=sys.stderr, flush=True)
+
+
+class _Span:
+    __slots__ = ('name', 'before')
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.before = 0.0
+
+    def __enter__(self) -> None:
+        if _instrumentation is not None:
+            _instrumentation._enter(self.name)
+            self.before = time.perf_counter()
+        else:
+            self.before = -1.0
+
+    def __exit__(self, *exc_info: object) -> None:
+        if _instrumentation is not None and self.before >= 0:
+            _instrumentation._exit(time.perf_counter() - self.before)
+
+
+def span(name: str) -> _Span:
+    return _Span(name)
+
+
+def count(name: str, n: int = 1) -> None:
+    if _instrumentation is not None:
+        _instrumentation.counters[name] += n
+
+
+def add_measure_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        '--memory', action='store_true',
+        help='report peak memory and top allocation sites per span',
+    )
+    parser.add_argument(
+        '--memory-budget', type=parse_size, metavar='SIZE',
+        help='fail if the peak traced memory exceeds this (e.g. 512M)',
+    )
+    parser.add_argument(
+        '--cache', action='store_true',
+        help='keep parsed input on disk between runs (see support.cache)',
+    )
+    parser.add_argument(
+        '--profile', nargs='?', const='cprofile', choices=('cprofile', 'sample'),
+        help='print a profile, `sample` also writes collapsed stacks',
+    )
+
+
+@contextlib.contextmanager
+def measure(args: argparse.Namespace) -> Generator[None, None, None]:
+    if args.cache:
+        importlib.import_module('support.cache').enable()
+
+    with contextlib.ExitStack() as ctx:
+        if args.profile is not None:
+            profiling = importlib.import_module('support.profiling')
+            ctx.enter_context(profiling.profile(args.profile))
+        with _measure_memory(args):
+            yield
+
+
+@contextlib.contextmanager
+def _measure_memory(args: argparse.Namespace) -> Generator[None, None, None]:
+    if not args.memory and args.memory_budget is None:
+        yield
+        return
+
+    instrumentation = enable_instrumentation(report=args.memory, memory=True)
+    yield
+    peak = instrumentation.peak_memory()
+    if args.memory_budget is not None and peak > args.memory_budget:
+        raise SystemExit(
+            f'memory budget exceeded: '
+            f'{format_size(peak)} > {format_size(args.memory_budget)}',
+        )
+
+
+if os.environ.get('AOC_INSTRUMENT'):
+    enable_instrumentation()
+
+
+def parametrize(
+    argnames: str | Sequence[str],
+    argvalues: Iterable[Any],
+) -> Callable[[TFunc], TFunc]:
+    # `pytest.mark.parametrize` which leaves the function alone when pytest
+    # isn't running, so solutions can be imported without importing pytest
+    def parametrize_decorator(func: TFunc) -> TFunc:
+        pytest = sys.modules.get('pytest')
+        if pytest is None:
+            return func
+        return pytest.mark.parametrize(argnames, argvalues)(func)
+
+    return parametrize_decorator
+
+
+def progress(iterable: Iterable[T], **kwargs: Any) -> Iterable[T]:
+    # a tqdm progress bar when there's a terminal to draw it on (and tqdm)
+    if not sys.stderr.isatty():
+        return iterable
+    try:
+        tqdm = importlib.import_module('tqdm')
+    except ImportError:
+        return iterable
+    return tqdm.tqdm(iterable, **kwargs)
+
+
+def write_atomic(filename: str, contents: bytes) -> None:
+    # readers see the old file or the new one, never half of one
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(filename))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(contents)
+        os.replace(tmp, filename)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def iter_lines(f: Iterable[str]) -> Iterator[str]:
+    # the lines of an open file one at a time, without their line endings
+    # (like `str.splitlines`), so a `compute_stream` never holds the input
+    for line in f:
+        yield line.rstrip('\r\n')
+
+
+@contextlib.contextmanager
+def read_input(path: str) -> Generator[Bytes, None, None]:
+    # the file mapped read-only instead of read and decoded, pages are only
+    # loaded as they're looked at.  a `memoryview` of it is a zero-copy
+    # window, release it before the block ends
+    with open(path, 'rb') as f:
+        try:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # an empty file can't be mapped
+            yield b''
+            return
+    with m:
+        yield m
+
+
+def line_spans(b: Bytes) -> Iterator[tuple[int, int]]:
+    # (start, end) of each line like `bytes.splitlines`, without slicing
+    start = 0
+    while start < len(b):
+        end = b.find(b'\n', start)
+        if end == -1:
+            end = len(b)
+        nxt = end + 1
+        if end > start and b[end - 1] == ord('\r'):
+            end -= 1
+        yield start, end
+        start = nxt
+
+
+def adjacent_4(x: int, y: int) -> Generator[tuple[int, int], None, None]:
+    yield x, y - 1
+    yield x + 1, y
+    yield x, y + 1
+    yield x - 1, y
+
+
+def adjacent_8(x: int, y: int) -> Generator[tuple[int, int], None, None]:
+    for y_d in (-1, 0, 1):
+        for x_d in (-1, 0, 1):
+            if y_d == x_d == 0:
+                continue
+            yield x + x_d, y + y_d
+
+
+def parse_coords_int(s: str) -> dict[tuple[int, int], int]:
+    coords = {}
+    for y, line in enumerate(s.splitlines()):
+        for x, c in enumerate(line):
+            coords[(x, y)] = int(c)
+    return coords
+
+
+def parse_coords_hash(s: str) -> set[tuple[int, int]]:
+    coords = set()
+    for y, line in enumerate(s.splitlines()):
+        for x, c in enumerate(line):
+            if c == '#':
+                coords.add((x, y))
+    return coords
+
+
+# a `-` right after a digit is a separator (`2-4`) rather than a sign
+INT_RE = re.compile(r'(?<![0-9])-?[0-9]+')
+INT_RE_BYTES = re.compile(INT_RE.pattern.encode())
+
+
+def ints(s: str | Bytes) -> list[int]:
+    # every integer in the input, in order, whatever is around them
+    if isinstance(s, str):
+        return list(map(int, INT_RE.findall(s)))
+    else:
+        return list(map(int, INT_RE_BYTES.findall(s)))
+
+
+def int_array(s: str | Bytes, width: int = 1) -> array.array[int]:
+    # `ints` packed flat, `width` to a row (usually a line)
+    a = array.array('q', ints(s))
+    if len(a) % width:
+        raise ValueError(f'{len(a)} integers is not rows of {width}')
+    return a
+
+
+def parse_numbers_split(s: str) -> list[int]:
+    return [int(x) for x in s.split()]
+
+
+def parse_numbers_comma(s: str) -> list[int]:
+    return [int(x) for x in s.strip().split(',')]
+
+
+def format_coords_hash(coords: set[tuple[int, int]]) -> str:
+    min_x = min(x for x, _ in coords)
+    max_x = max(x for x, _ in coords)
+    min_y = min(y for _, y in coords)
+    max_y = max(y for _, y in coords)
+    return '\n'.join(
+        ''.join(
+            '#' if (x, y) in coords else ' '
+            for x in range(min_x, max_x + 1)
+        )
+        for y in range(min_y, max_y + 1)
+    )
+
+
+def print_coords_hash(coords: set[tuple[int, int]]) -> None:
+    print(format_coords_hash(coords))
+
+
+class Grid:
+    # a flat row-major grid of bytes with rows `stride` apart.  `from_bytes`
+    # keeps the newline column so its rows are `width + 1` apart
+    __slots__ = ('width', 'height', 'stride', 'data')
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        data: bytearray | None = None,
+        *,
+        stride: int | None = None,
+        fill: int = 0,
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.stride = width if stride is None else stride
+        if data is None:
+            data = bytearray((fill,)) * (self.stride * height)
+        self.data = data
+
+    @classmethod
+    def from_bytes(cls, b: Bytes) -> Grid:
+        # a bytearray is used as-is, bytes are copied once to be writable
+        data = b if isinstance(b, bytearray) else bytearray(b)
+        width = b.find(b'\n')
+        if width == -1:
+            width = len(b)
+        stride = width + 1
+        height = (len(b) + 1) // stride
+        if (
+            len(b) not in (height * stride, height * stride - 1) or
+            any(b[stride * y - 1] != ord('\n') for y in range(1, height))
+        ):
+            raise ValueError('lines are not all the same length')
+        return cls(width, height, data, stride=stride)
+
+    @classmethod
+    def from_str(cls, s: str, *, fill: str | None = None) -> Grid:
+        lines = s.splitlines()
+        width = max((len(line) for line in lines), default=0)
+        data = bytearray()
+        for line in lines:
+            if len(line) != width:
+                if fill is None:
+                    raise ValueError('lines are not all the same length')
+                line = line.ljust(width, fill)
+            data += line.encode()
+        return cls(width, len(lines), data)
+
+    def copy(self) -> Grid:
+        return type(self)(
+            self.width, self.height, bytearray(self.data), stride=self.stride,
+        )
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.stride + x
+
+    def coords(self, i: int) -> tuple[int, int]:
+        y, x = divmod(i, self.stride)
+        return x, y
+
+    def __getitem__(self, pos: tuple[int, int]) -> int:
+        x, y = pos
+        if not self.in_bounds(x, y):
+            raise IndexError(pos)
+        return self.data[y * self.stride + x]
+
+    def __setitem__(self, pos: tuple[int, int], value: int) -> None:
+        x, y = pos
+        if not self.in_bounds(x, y):
+            raise IndexError(pos)
+        self.data[y * self.stride + x] = value
+
+    def get(self, pos: tuple[int, int], default: int | None = None) -> int | None:
+        x, y = pos
+        if not self.in_bounds(x, y):
+            return default
+        return self.data[y * self.stride + x]
+
+    def indices(self) -> Generator[int, None, None]:
+        for start in range(0, self.height * self.stride, self.stride):
+            yield from range(start, start + self.width)
+
+    @property
+    def offsets_4(self) -> tuple[int, int, int, int]:
+        # same order as `adjacent_4`
+        return (-self.stride, 1, self.stride, -1)
+
+    @property
+    def offsets_8(self) -> tuple[int, ...]:
+        # same order as `adjacent_8`
+        return tuple(
+            y_d * self.stride + x_d
+            for y_d in (-1, 0, 1)
+            for x_d in (-1, 0, 1)
+            if not y_d == x_d == 0
+        )
+
+    def adjacent_4(self, i: int) -> Generator[int, None, None]:
+        y, x = divmod(i, self.stride)
+        if y > 0:
+            yield i - self.stride
+        if x < self.width - 1:
+            yield i + 1
+        if y < self.height - 1:
+            yield i + self.stride
+        if x > 0:
+            yield i - 1
+
+    def adjacent_8(self, i: int) -> Generator[int, None, None]:
+        y, x = divmod(i, self.stride)
+        for y_d in (-1, 0, 1):
+            for x_d in (-1, 0, 1):
+                if y_d == x_d == 0:
+                    continue
+                if 0 <= x + x_d < self.width and 0 <= y + y_d < self.height:
+                    yield i + y_d * self.stride + x_d
+
+    def rows(self) -> Generator[bytes, None, None]:
+        for start in range(0, self.height * self.stride, self.stride):
+            yield bytes(self.data[start:start + self.width])
+
+    def __str__(self) -> str:
+        return '\n'.join(row.decode() for row in self.rows())
+
+    def numpy(self) -> Any:
+        # a (height, width) uint8 view sharing memory with `data`
+        np = importlib.import_module('numpy')
+        arr = np.frombuffer(self.data, dtype=np.uint8)
+        return np.lib.stride_tricks.as_strided(
+            arr,
+            shape=(self.height, self.width),
+            strides=(self.stride, 1),
+        )
+
+
+_BITS_TO_HASH = str.maketrans('01', ' #')
+
+
+class BitGrid:
+    # a set of coordinates packed one int per row: (x, y) is bit `x - x0` of
+    # `rows[y - y0]`.  rows are added as needed and the origin only moves to
+    # fit a coordinate below it
+    __slots__ = ('rows', 'x0', 'y0')
+
+    def __init__(self, coords: Iterable[tuple[int, int]] = ()) -> None:
+        self.rows: list[int] = []
+        self.x0 = self.y0 = 0
+        for x, y in coords:
+            self.add(x, y)
+
+    @classmethod
+    def from_str(cls, s: str, c: str = '#') -> BitGrid:
+        grid = cls()
+        grid.rows = [
+            int(''.join('1' if c2 == c else '0' for c2 in reversed(line)), 2)
+            if line else 0
+            for line in s.splitlines()
+        ]
+        return grid
+
+    def grow(self, x: int, y: int) -> None:
+        if not self.rows:
+            self.rows.append(0)
+            self.y0 = y
+        if y < self.y0:
+            self.rows[:0] = [0] * (self.y0 - y)
+            self.y0 = y
+        elif y >= self.y0 + len(self.rows):
+            self.rows.extend([0] * (y - self.y0 - len(self.rows) + 1))
+        if x < self.x0:
+            self.rows = [row << (self.x0 - x) for row in self.rows]
+            self.x0 = x
+
+    def add(self, x: int, y: int) -> None:
+        self.grow(x, y)
+        self.rows[y - self.y0] |= 1 << (x - self.x0)
+
+    def discard(self, x: int, y: int) -> None:
+        i = y - self.y0
+        if 0 <= i < len(self.rows) and x >= self.x0:
+            self.rows[i] &= ~(1 << (x - self.x0))
+
+    def __contains__(self, pos: tuple[int, int]) -> bool:
+        x, y = pos
+        return x >= self.x0 and self.row(y) >> (x - self.x0) & 1 == 1
+
+    def __len__(self) -> int:
+        return sum(row.bit_count() for row in self.rows)
+
+    def __iter__(self) -> Generator[tuple[int, int], None, None]:
+        for y, row in enumerate(self.rows, self.y0):
+            while row:
+                low = row & -row
+                yield low.bit_length() - 1 + self.x0, y
+                row ^= low
+
+    def row(self, y: int) -> int:
+        i = y - self.y0
+        return self.rows[i] if 0 <= i < len(self.rows) else 0
+
+    def set_row(self, y: int, bits: int) -> None:
+        self.grow(self.x0, y)
+        self.rows[y - self.y0] = bits
+
+    def shift(self, dx: int, dy: int) -> None:
+        self.x0 += dx
+        self.y0 += dy
+
+    def bounds(self) -> tuple[int, int, int, int]:
+        # min_x, min_y, max_x, max_y of the cells that are set
+        ys = [y for y, row in enumerate(self.rows, self.y0) if row]
+        if not ys:
+            raise ValueError('empty BitGrid has no bounds')
+        rows = [self.row(y) for y in ys]
+        min_x = min((row & -row).bit_length() for row in rows) - 1
+        max_x = max(row.bit_length() for row in rows) - 1
+        return min_x + self.x0, ys[0], max_x + self.x0, ys[-1]
+
+    def __str__(self) -> str:
+        # the same as `format_coords_hash(set(self))`
+        min_x, min_y, max_x, max_y = self.bounds()
+        width = max_x - min_x + 1
+        return '\n'.join(
+            f'{self.row(y) >> (min_x - self.x0):0{width}b}'[::-1]
+            .translate(_BITS_TO_HASH)
+            for y in range(min_y, max_y + 1)
+        )
+
+
+def _interval_start(interval: tuple[int, int]) -> int:
+    return interval[0]
+
+
+class IntervalSet:
+    # sorted half-open [start, end) intervals of ints, overlapping and
+    # touching ones merged, so the size doesn't depend on how much is covered.
+    # works like a `set` of the ints covered
+    __slots__ = ('intervals',)
+
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()) -> None:
+        merged: list[tuple[int, int]] = []
+        for start, end in sorted(intervals):
+            if start >= end:
+                continue
+            elif merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        self.intervals = merged
+
+    @classmethod
+    def from_numpy(cls, starts: Any, ends: Any) -> IntervalSet:
+        # the same from two arrays, sorted and merged without a python loop
+        np = importlib.import_module('numpy')
+        starts, ends = np.asarray(starts), np.asarray(ends)
+        keep = starts < ends
+        order = np.argsort(starts[keep], kind='stable')
+        starts, ends = starts[keep][order], ends[keep][order]
+        # an interval starts a new one if it's past the end of all before it
+        reach = np.maximum.accumulate(ends)
+        first = np.flatnonzero(np.r_[True, starts[1:] > reach[:-1]])
+        last = np.r_[first[1:] - 1, len(starts) - 1]
+        ret = cls()
+        if len(starts):
+            ret.intervals = list(
+                zip(starts[first].tolist(), reach[last].tolist()),
+            )
+        return ret
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return iter(self.intervals)
+
+    def __bool__(self) -> bool:
+        return bool(self.intervals)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.intervals == other.intervals
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.intervals!r})'
+
+    def __contains__(self, x: int) -> bool:
+        i = bisect.bisect_right(self.intervals, x, key=_interval_start)
+        return i > 0 and x < self.intervals[i - 1][1]
+
+    def length(self) -> int:
+        return sum(end - start for start, end in self.intervals)
+
+    def union(self, other: IntervalSet) -> IntervalSet:
+        return type(self)(self.intervals + other.intervals)
+
+    def intersection(self, other: IntervalSet) -> IntervalSet:
+        ret = []
+        a, b = self.intervals, other.intervals
+        i = j = 0
+        while i < len(a) and j < len(b):
+            start = max(a[i][0], b[j][0])
+            end = min(a[i][1], b[j][1])
+            if start < end:
+                ret.append((start, end))
+            # whichever ends first can't overlap anything after the other
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+        return type(self)(ret)
+
+    def issubset(self, other: IntervalSet) -> bool:
+        # each interval has to be inside one of `other`'s
+        for start, end in self.intervals:
+            i = bisect.bisect_right(other.intervals, start, key=_interval_start)
+            if i == 0 or other.intervals[i - 1][1] < end:
+                return False
+        return True
+
+    def gaps(self, start: int, end: int) -> IntervalSet:
+        # what isn't covered in [start, end)
+        ret = []
+        for interval_start, interval_end in self.intervals:
+            if interval_start > start:
+                ret.append((start, min(interval_start, end)))
+            start = max(start, interval_end)
+            if start >= end:
+                break
+        ret.append((start, end))
+        return type(self)(ret)
+
+    __or__ = union
+    __and__ = intersection
+    __le__ = issubset
+
+
+class Direction4(enum.Enum):
+    UP = (0, -1)
+    RIGHT = (1, 0)
+    DOWN = (0, 1)
+    LEFT = (-1, 0)
+
+    def __init__(self, x: int, y: int) -> None:
+        self.x, self.y = x, y
+
+    @property
+    def cw(self) -> Direction4:
+        return _DIRECTION4_CW[self]
+
+    @property
+    def ccw(self) -> Direction4:
+        return _DIRECTION4_CCW[self]
+
+    @property
+    def opposite(self) -> Direction4:
+        return _DIRECTION4_OPPOSITE[self]
+
+    def apply(self, x: int, y: int, *, n: int = 1) -> tuple[int, int]:
+        return self.x * n + x, self.y * n + y
+
+
+_DIRECTION4_CW = {
+    Direction4.UP: Direction4.RIGHT,
+    Direction4.RIGHT: Direction4.DOWN,
+    Direction4.DOWN: Direction4.LEFT,
+    Direction4.LEFT: Direction4.UP,
+}
+_DIRECTION4_CCW = {v: k for k, v in _DIRECTION4_CW.items()}
+_DIRECTION4_OPPOSITE = {k: _DIRECTION4_CW[v] for k, v in _DIRECTION4_CW.items()}
@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import hashlib
+import http.client
+import json
+import os.path
+import random
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+from typing import Callable
+from typing import NamedTuple
+from typing import TypeVar
+
+import support
+
+AOC_URL = 'https://adventofcode.com'
+CACHE_DIR = os.path.join(support.HERE, '../.cache/inputs')
+
+T = TypeVar('T')
+
+
+def _get_cookie_headers() -> dict[str, str]:
+    with open(os.path.join(support.HERE, '../.env')) as f:
+        contents = f.read().strip()
+    return {'Cookie': contents, 'User-Agent': 'anthonywritescode, hi eric'}
+
+
+class RateLimiter:
+    # spaces out calls to wait() across threads to at most `rate` per second
+    def __init__(self, rate: float) -> None:
+        self.interval = 1 / rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            t = max(now, self._next)
+            self._next = t + self.interval
+        if t > now:
+            time.sleep(t - now)
+
+
+class HTTPClient:
+    # a single keep-alive connection, reopened if the server drops it
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        *,
+        limiter: RateLimiter | None = None,
+    ) -> None:
+        parts = urllib.parse.urlsplit(base_url)
+        self.https = parts.scheme == 'https'
+        self.host = parts.netloc
+        self.prefix = parts.path.rstrip('/')
+        self.headers = headers
+        self.limiter = limiter
+        self._conn: http.client.HTTPConnection | None = None
+        self.connections = 0
+
+    def url(self, path: str) -> str:
+        scheme = 'https' if self.https else 'http'
+        return f'{scheme}://{self.host}{self.prefix}{path}'
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            if self.https:
+                self._conn = http.client.HTTPSConnection(self.host, timeout=30)
+            else:
+                self._conn = http.client.HTTPConnection(self.host, timeout=30)
+            self.connections += 1
+        return self._conn
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        headers = {**self.headers, **(headers or {})}
+        if body is not None:
+            headers.setdefault(
+                'Content-Type', 'application/x-www-form-urlencoded',
+            )
+        if self.limiter is not None:
+            self.limiter.wait()
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                conn.request(method, self.prefix + path, body=body, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError):
+                # the kept-alive connection went stale, retry once on a new
+                # one.  only for a GET: the server may have had the request
+                # already, and a POST (an answer) must not go twice
+                self.close()
+                if attempt or method != 'GET':
+                    raise
+            else:
+                if resp.will_close:
+                    self.close()
+                return resp.status, resp.headers, data
+        raise AssertionError('unreachable')
+
+
+_client: HTTPClient | None = None
+
+
+def get_client() -> HTTPClient:
+    global _client
+    if _client is None:
+        _client = HTTPClient(AOC_URL, _get_cookie_headers())
+    return _client
+
+
+def retry_with_backoff(
+    func: Callable[[], T],
+    *,
+    attempts: int = 5,
+    base: float = 1.0,
+    cap: float = 30.0,
+    on_error: Callable[[Exception], object] = lambda e: None,
+) -> T:
+    for attempt in range(attempts):
+        try:
+            return func()
+        except (OSError, http.client.HTTPException) as e:
+            if attempt == attempts - 1:
+                raise
+            on_error(e)
+            # "full jitter": sleep anywhere up to the exponential backoff
+            time.sleep(random.uniform(0, min(cap, base * 2 ** attempt)))
+    raise AssertionError('unreachable')
+
+
+class CachedInput(NamedTuple):
+    content: str
+    etag: str | None
+    last_modified: str | None
+
+
+class InputCache:
+    # blobs/<sha256> holds the contents, <year>-<day>-<session>.json points
+    # at the blob along with the validators for conditional requests
+    def __init__(self, directory: str = CACHE_DIR) -> None:
+        self.directory = directory
+
+    def _index(self, year: int, day: int, session: str) -> str:
+        session_key = hashlib.sha256(session.encode()).hexdigest()[:16]
+        return os.path.join(self.directory, f'{year}-{day:02}-{session_key}.json')
+
+    def _blob(self, digest: str) -> str:
+        return os.path.join(self.directory, 'blobs', digest)
+
+    def get(self, year: int, day: int, session: str) -> CachedInput | None:
+        try:
+            with open(self._index(year, day, session)) as f:
+                index = json.load(f)
+            with open(self._blob(index['sha256']), 'rb') as fb:
+                content = fb.read()
+        except (OSError, ValueError, KeyError):
+            return None
+        if hashlib.sha256(content).hexdigest() != index['sha256']:
+            return None
+        return CachedInput(content.decode(), index['etag'], index['last_modified'])
+
+    def put(
+        self,
+        year: int,
+        day: int,
+        session: str,
+        content: bytes,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        digest = hashlib.sha256(content).hexdigest()
+        support.write_atomic(self._blob(digest), content)
+        index = {'sha256': digest, 'etag': etag, 'last_modified': last_modified}
+        support.write_atomic(
+            self._index(year, day, session), json.dumps(index).encode(),
+        )
+
+
+def get_input(
+    year: int,
+    day: int,
+    *,
+    refresh: bool = False,
+    client: HTTPClient | None = None,
+    cache: InputCache | None = None,
+) -> str:
+    client = client or get_client()
+    cache = cache or InputCache()
+    session = client.headers.get('Cookie', '')
+
+    cached = cache.get(year, day, session)
+    if cached is not None and not refresh:
+        return cached.content
+
+    headers = {}
+    if cached is not None and cached.etag is not None:
+        headers['If-None-Match'] = cached.etag
+    if cached is not None and cached.last_modified is not None:
+        headers['If-Modified-Since'] = cached.last_modified
+
+    path = f'/{year}/day/{day}/input'
+    status, resp_headers, data = client.request('GET', path, headers=headers)
+    if status == 304 and cached is not None:
+        return cached.content
+    elif status != 200:
+        raise urllib.error.HTTPError(
+            client.url(path), status, data.decode(errors='replace')[:80],
+            resp_headers, None,
+        )
+
+    cache.put(
+        year, day, session, data,
+        etag=resp_headers.get('ETag'),
+        last_modified=resp_headers.get('Last-Modified'),
+    )
+    return data.decode()
+
+
+def get_year_day() -> tuple[int, int]:
+    cwd = os.getcwd()
+    day_s = os.path.basename(cwd)
+    year_s = os.path.basename(os.path.dirname(cwd))
+
+    if not day_s.startswith('day') or not year_s.startswith('aoc'):
+        raise AssertionError(f'unexpected working dir: {cwd}')
+
+    return int(year_s[len('aoc'):]), int(day_s[len('day'):])
+
+
+def download_input() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--refresh', action='store_true',
+        help='revalidate a cached input with the server',
+    )
+    args = parser.parse_args()
+
+    year, day = get_year_day()
+
+    try:
+        s = retry_with_backoff(
+            lambda: get_input(year, day, refresh=args.refresh),
+            on_error=lambda e: print(f'zzz: not ready yet: {e}'),
+        )
+    except (OSError, http.client.HTTPException):
+        raise SystemExit('timed out after attempting many times')
+
+    with open('input.txt', 'w') as f:
+        f.write(s)
+
+    lines = s.splitlines()
+    if len(lines) > 10:
+        for line in lines[:10]:
+            print(line)
+        print('...')
+    else:
+        print(lines[0][:80])
+        print('...')
+
+    return 0
+
+
+def download_inputs(
+    pairs: list[tuple[int, int]],
+    *,
+    dest: str = 'day{day:02}/input.txt',
+    jobs: int = 4,
+    rate: float = 1.0,
+    refresh: bool = False,
+    base_url: str = AOC_URL,
+    headers: dict[str, str] | None = None,
+    cache: InputCache | None = None,
+) -> dict[tuple[int, int], BaseException | None]:
+    headers = headers if headers is not None else _get_cookie_headers()
+    cache = cache or InputCache()
+    limiter = RateLimiter(rate)
+    # http.client connections aren't thread safe: one kept-alive client each
+    local = threading.local()
+    clients: list[HTTPClient] = []
+
+    def _download(year: int, day: int) -> None:
+        if not hasattr(local, 'client'):
+            local.client = HTTPClient(base_url, headers, limiter=limiter)
+            clients.append(local.client)
+        s = retry_with_backoff(
+            lambda: get_input(
+                year, day, refresh=refresh, client=local.client, cache=cache,
+            ),
+        )
+        support.write_atomic(dest.format(year=year, day=day), s.encode())
+
+    results: dict[tuple[int, int], BaseException | None] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(_download, year, day): (year, day)
+            for year, day in pairs
+        }
+        for future in concurrent.futures.as_completed(futures):
+            results[futures[future]] = future.exception()
+    for client in clients:
+        client.close()
+    return results
+
+
+def _parse_year_day(s: str, default_year: int) -> tuple[int, int]:
+    year_s, _, day_s = s.rpartition('/')
+    return int(year_s) if year_s else default_year, int(day_s)
+
+
+def download_all_inputs() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        'days', nargs='*',
+        help='DAY or YEAR/DAY (default: every day of --year)',
+    )
+    parser.add_argument('--year', type=int)
+    parser.add_argument('--dest', default='day{day:02}/input.txt')
+    parser.add_argument('-j', '--jobs', type=int, default=4)
+    parser.add_argument(
+        '--rate', type=float, default=1.0,
+        help='maximum requests per second (default: 1)',
+    )
+    parser.add_argument('--refresh', action='store_true')
+    args = parser.parse_args()
+
+    if args.year is not None:
+        year = args.year
+    else:
+        year_s = os.path.basename(os.getcwd())
+        if not year_s.startswith('aoc'):
+            raise SystemExit(f'pass --year, cannot guess it from {year_s!r}')
+        year = int(year_s[len('aoc'):])
+
+    if args.days:
+        pairs = [_parse_year_day(s, year) for s in args.days]
+    else:
+        pairs = [(year, day) for day in range(1, 26)]
+
+    results = download_inputs(
+        pairs,
+        dest=args.dest,
+        jobs=args.jobs,
+        rate=args.rate,
+        refresh=args.refresh,
+    )
+
+    ret = 0
+    for (year, day), exc in sorted(results.items()):
+        if exc is not None:
+            print(f'{year}/{day:02}: \033[41m{exc}\033[m')
+            ret = 1
+        else:
+            print(f'{year}/{day:02}: {args.dest.format(year=year, day=day)}')
+    return ret
+
+
+TOO_QUICK = re.compile('You gave an answer too recently.*to wait.')
+WRONG = re.compile(r"That's not the right answer.*?\.")
+RIGHT = "That's the right answer!"
+ALREADY_DONE = re.compile(r"You don't seem to be solving.*\?")
+
+
+def _post_answer(year: int, day: int, part: int, answer: int) -> str:
+    params = urllib.parse.urlencode({'level': part, 'answer': answer})
+    path = f'/{year}/day/{day}/answer'
+    _, _, data = get_client().request('POST', path, body=params.encode())
+    return data.decode()
+
+
+def submit_solution() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--part', type=int, required=True)
+    args = parser.parse_args()
+
+    year, day = get_year_day()
+    answer = int(sys.stdin.read())
+
+    print(f'answer: {answer}')
+
+    contents = _post_answer(year, day, args.part, answer)
+
+    for error_regex in (WRONG, TOO_QUICK, ALREADY_DONE):
+        error_match = error_regex.search(contents)
+        if error_match:
+            print(f'\033[41m{error_match[0]}\033[m')
+            return 1
+
+    if RIGHT in contents:
+        print(f'\033[42m{RIGHT}\033[m')
+        return 0
+    else:
+        # unexpected output?
+        print(contents)
+        return 1
+
+
+def submit_25_pt2() -> int:
+    parser = argparse.ArgumentParser()
+    parser.parse_args()
+
+    year, day = get_year_day()
+
+    assert day == 25, day
+    contents = _post_answer(year, day, part=2, answer=0)
+
+    if 'Congratulations!' in contents:
+        print('\033[42mCongratulations!\033[m')
+        return 0
+    else:
+        print(contents)
+        return 1
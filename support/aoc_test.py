@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import http.client
+import http.server
+import pathlib
+import threading
+import urllib.error
+from typing import Any
+from typing import Generator
+
+import pytest
+
+from support import aoc
+
+
+class FakeAOC(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    requests: list[tuple[str, int, str | None]]
+    not_ready: int
+    # requests to hang up on without a response
+    dropped: int
+
+    def do_GET(self) -> None:
+        etag = '"abc"'
+        self.requests.append(
+            (self.path, self.client_address[1], self.headers['If-None-Match']),
+        )
+        if self.dropped:
+            type(self).dropped -= 1
+            self.close_connection = True
+        elif self.not_ready:
+            type(self).not_ready -= 1
+            self._respond(404, b'not yet')
+        elif self.headers['If-None-Match'] == etag:
+            self._respond(304, b'')
+        else:
+            self._respond(200, f'input for {self.path}\n'.encode(), etag)
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.requests.append((self.path, self.client_address[1], None))
+        if self.dropped:
+            type(self).dropped -= 1
+            self.close_connection = True
+        else:
+            self._respond(200, b'answered')
+
+    def _respond(self, status: int, body: bytes, etag: str | None = None) -> None:
+        self.send_response(status)
+        if etag is not None:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def aoc_server() -> Generator[type[FakeAOC], None, None]:
+    attrs = {'requests': [], 'not_ready': 0, 'dropped': 0}
+    handler = type('Handler', (FakeAOC,), attrs)
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(
+        target=server.serve_forever,
+        kwargs={'poll_interval': 0.01},
+        daemon=True,
+    )
+    thread.start()
+    handler.url = f'http://127.0.0.1:{server.server_port}'  # type: ignore
+    try:
+        yield handler
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def client(aoc_server: Any) -> Generator[aoc.HTTPClient, None, None]:
+    client = aoc.HTTPClient(aoc_server.url, {'Cookie': 'session=1'})
+    yield client
+    client.close()
+
+
+def test_get_input_cached(
+    aoc_server: Any,
+    client: aoc.HTTPClient,
+    tmp_path: pathlib.Path,
+) -> None:
+    cache = aoc.InputCache(str(tmp_path))
+    for _ in range(3):
+        s = aoc.get_input(2022, 1, client=client, cache=cache)
+        assert s == 'input for /2022/day/1/input\n'
+    assert len(aoc_server.requests) == 1
+
+
+def test_get_input_cache_is_per_session(
+    aoc_server: Any,
+    tmp_path: pathlib.Path,
+) -> None:
+    cache = aoc.InputCache(str(tmp_path))
+    for session in ('session=1', 'session=2'):
+        client = aoc.HTTPClient(aoc_server.url, {'Cookie': session})
+        aoc.get_input(2022, 1, client=client, cache=cache)
+        client.close()
+    assert len(aoc_server.requests) == 2
+    # the same contents are only stored once
+    assert len(list(tmp_path.joinpath('blobs').iterdir())) == 1
+
+
+def test_get_input_refresh_is_conditional(
+    aoc_server: Any,
+    client: aoc.HTTPClient,
+    tmp_path: pathlib.Path,
+) -> None:
+    cache = aoc.InputCache(str(tmp_path))
+    aoc.get_input(2022, 1, client=client, cache=cache)
+    s = aoc.get_input(2022, 1, client=client, cache=cache, refresh=True)
+    assert s == 'input for /2022/day/1/input\n'
+    (_, port1, etag1), (_, port2, etag2) = aoc_server.requests
+    assert (etag1, etag2) == (None, '"abc"')
+    # both requests went over the same kept-alive connection
+    assert port1 == port2
+    assert client.connections == 1
+
+
+def test_get_input_error(
+    aoc_server: Any,
+    client: aoc.HTTPClient,
+    tmp_path: pathlib.Path,
+) -> None:
+    aoc_server.not_ready = 1
+    cache = aoc.InputCache(str(tmp_path))
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        aoc.get_input(2022, 1, client=client, cache=cache)
+    assert excinfo.value.code == 404
+    assert cache.get(2022, 1, 'session=1') is None
+
+
+def test_request_get_retried(aoc_server: Any, client: aoc.HTTPClient) -> None:
+    aoc_server.dropped = 1
+    status, _, data = client.request('GET', '/2022/day/1/input')
+    assert (status, data) == (200, b'input for /2022/day/1/input\n')
+    assert len(aoc_server.requests) == 2
+
+
+def test_request_post_not_retried(aoc_server: Any, client: aoc.HTTPClient) -> None:
+    aoc_server.dropped = 1
+    with pytest.raises(http.client.RemoteDisconnected):
+        client.request('POST', '/2022/day/1/answer', body=b'level=1&answer=2')
+    assert len(aoc_server.requests) == 1
+
+
+def test_retry_with_backoff(
+    aoc_server: Any,
+    client: aoc.HTTPClient,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(aoc.time, 'sleep', sleeps.append)
+    aoc_server.not_ready = 3
+    cache = aoc.InputCache(str(tmp_path))
+    errors: list[Exception] = []
+
+    s = aoc.retry_with_backoff(
+        lambda: aoc.get_input(2022, 1, client=client, cache=cache),
+        base=1,
+        on_error=errors.append,
+    )
+
+    assert s == 'input for /2022/day/1/input\n'
+    assert len(errors) == 3
+    assert len(sleeps) == 3
+    assert all(0 <= t <= 2 ** i for i, t in enumerate(sleeps))
+
+
+def test_retry_with_backoff_gives_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(aoc.time, 'sleep', lambda t: None)
+
+    def func() -> str:
+        raise ConnectionRefusedError
+
+    with pytest.raises(ConnectionRefusedError):
+        aoc.retry_with_backoff(func, attempts=3)
+
+
+def test_input_cache_ignores_corrupt_blob(tmp_path: pathlib.Path) -> None:
+    cache = aoc.InputCache(str(tmp_path))
+    cache.put(2022, 1, 'session=1', b'1\n2\n', etag='"x"')
+    assert cache.get(2022, 1, 'session=1') == ('1\n2\n', '"x"', None)
+    blob, = tmp_path.joinpath('blobs').iterdir()
+    blob.write_bytes(b'oops')
+    assert cache.get(2022, 1, 'session=1') is None
+
+
+def test_rate_limiter(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 100.0
+    sleeps: list[float] = []
+    monkeypatch.setattr(aoc.time, 'monotonic', lambda: now)
+    monkeypatch.setattr(aoc.time, 'sleep', sleeps.append)
+    limiter = aoc.RateLimiter(4)
+    for _ in range(3):
+        limiter.wait()
+    assert sleeps == [.25, .5]
+
+
+def test_download_inputs(
+    aoc_server: Any,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    cache = aoc.InputCache(str(tmp_path.joinpath('cache')))
+    pairs = [(2022, day) for day in range(1, 7)]
+
+    results = aoc.download_inputs(
+        pairs,
+        jobs=2,
+        rate=1000,
+        base_url=aoc_server.url,
+        headers={'Cookie': 'session=1'},
+        cache=cache,
+    )
+
+    assert results == {pair: None for pair in pairs}
+    for day in range(1, 7):
+        contents = tmp_path.joinpath(f'day{day:02}', 'input.txt').read_text()
+        assert contents == f'input for /2022/day/{day}/input\n'
+    assert len(aoc_server.requests) == 6
+    # the workers each keep their connection alive between downloads
+    assert len({port for _, port, _ in aoc_server.requests}) <= 2
+
+    # everything is cached now, so downloading again makes no requests
+    aoc.download_inputs(
+        pairs,
+        base_url=aoc_server.url,
+        headers={'Cookie': 'session=1'},
+        cache=cache,
+    )
+    assert len(aoc_server.requests) == 6
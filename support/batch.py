@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import glob
+import os.path
+import time
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator
+from typing import NamedTuple
+
+import support
+from support.runner import captured_output
+from support.runner import format_error
+from support.runner import load_solution
+from support.runner import ROOT
+from support.runner import Solution
+
+# chunks per worker, enough that a slow chunk at the end doesn't leave the
+# other workers idle for long
+CHUNKS_PER_WORKER = 4
+MAX_CHUNK = 64
+
+
+class FileResult(NamedTuple):
+    path: str
+    answer: str
+    elapsed: float
+    error: str | None = None
+
+
+def expand_inputs(patterns: list[str]) -> list[str]:
+    # every file in a directory, every match of a glob, a file as it is (a
+    # missing one or a glob matching nothing is reported as its error)
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = [
+                os.path.join(pattern, name)
+                for name in sorted(os.listdir(pattern))
+                if os.path.isfile(os.path.join(pattern, name))
+            ]
+        else:
+            matches = sorted(glob.glob(pattern)) or [pattern]
+        paths.extend(matches)
+    # the same input twice (`dir dir/*.txt`) is only run once
+    return list(dict.fromkeys(paths))
+
+
+def chunk_size(n: int, workers: int) -> int:
+    return max(1, min(MAX_CHUNK, n // (workers * CHUNKS_PER_WORKER)))
+
+
+def chunked(paths: list[str], size: int) -> list[list[str]]:
+    return [paths[i:i + size] for i in range(0, len(paths), size)]
+
+
+def run_file(root: str, solution: Solution, path: str) -> FileResult:
+    try:
+        with captured_output() as out:
+            # after the first file the import is a dict lookup
+            mod, s = load_solution(root, solution, path)
+            before = time.perf_counter()
+            ret = mod.compute(s)
+            after = time.perf_counter()
+    except Exception as e:
+        return FileResult(path, '', 0.0, format_error(e))
+
+    # solutions which draw their answer print it instead of returning it
+    answer = out.getvalue().rstrip('\n') if ret is None else str(ret)
+    return FileResult(path, answer, after - before)
+
+
+def run_chunk(root: str, solution: Solution, paths: list[str]) -> list[FileResult]:
+    return [run_file(root, solution, path) for path in paths]
+
+
+def run_isolated(root: str, solution: Solution, path: str) -> FileResult:
+    # `run_file` in a process of its own, its dying is an error of the input
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+        try:
+            return executor.submit(run_file, root, solution, path).result()
+        except BrokenProcessPool as e:
+            return FileResult(path, '', 0.0, format_error(e))
+
+
+def run_batch(
+    root: str,
+    solution: Solution,
+    paths: list[str],
+    *,
+    jobs: int | None = None,
+    chunk: int | None = None,
+) -> Iterator[FileResult]:
+    # results come a chunk at a time, in the order the chunks finish
+    paths = [os.path.abspath(path) for path in paths]
+    workers = jobs or os.cpu_count() or 1
+    size = chunk or chunk_size(len(paths), workers)
+    # a worker killed from outside (the OOM killer) breaks the whole pool,
+    # every chunk it hadn't finished fails with it
+    broken = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(run_chunk, root, solution, chunk_paths): chunk_paths
+            for chunk_paths in chunked(paths, size)
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                yield from future.result()
+            except BrokenProcessPool:
+                broken.extend(futures[future])
+
+    # which input it was isn't known, they run again in a process each so it
+    # takes none of the others with it this time
+    if broken:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as threads:
+            retries = [
+                threads.submit(run_isolated, root, solution, path)
+                for path in broken
+            ]
+            for retry in concurrent.futures.as_completed(retries):
+                yield retry.result()
+
+
+def format_file_result(result: FileResult, width: int) -> str:
+    path = os.path.relpath(result.path)
+    if result.error is not None:
+        return f'{path:<{width}} ERROR {result.error}'
+    # a drawn answer is more than a line, it only gets the first here
+    answer = result.answer.partition('\n')[0]
+    elapsed = support.format_elapsed(result.elapsed)
+    return f'{path:<{width}} {answer:<20} {elapsed:>10}'
+
+
+def format_summary(results: list[FileResult], wall: float) -> str:
+    errors = sum(result.error is not None for result in results)
+    ok = [result for result in results if result.error is None]
+    compute = sum(result.elapsed for result in ok)
+    line = (
+        f'> {len(results)} inputs ({errors} errors), '
+        f'{support.format_elapsed(compute)} compute, '
+        f'{support.format_elapsed(wall)} wall, '
+        f'{len(results) / wall:.1f} inputs/s'
+    )
+    if ok:
+        slowest = max(ok, key=lambda result: result.elapsed)
+        line += (
+            f'\n> mean {support.format_elapsed(compute / len(ok))}, '
+            f'slowest {support.format_elapsed(slowest.elapsed)} '
+            f'({os.path.relpath(slowest.path)})'
+        )
+    return line
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('day', type=int)
+    parser.add_argument('part', help='e.g. part1')
+    parser.add_argument(
+        'inputs', nargs='+',
+        help='input files, directories of them or globs (quoted)',
+    )
+    parser.add_argument('--root', default=ROOT)
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=None,
+        help='worker processes (default: number of CPUs)',
+    )
+    parser.add_argument(
+        '--chunk', type=int, default=None,
+        help='inputs sent to a worker at a time (default: from the count)',
+    )
+    args = parser.parse_args()
+
+    if args.chunk is not None and args.chunk < 1:
+        raise SystemExit('--chunk must be at least 1')
+
+    root = os.path.abspath(args.root)
+    solution = Solution(args.day, args.part)
+    if not os.path.exists(os.path.join(root, solution.dirname, f'{args.part}.py')):
+        raise SystemExit(f'no solution {solution.module}')
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        raise SystemExit('no inputs found')
+
+    width = max(len(os.path.relpath(path)) for path in paths)
+    results = []
+    before = time.perf_counter()
+    batch = run_batch(root, solution, paths, jobs=args.jobs, chunk=args.chunk)
+    for result in batch:
+        print(format_file_result(result, width), flush=True)
+        results.append(result)
+    after = time.perf_counter()
+
+    print(format_summary(results, after - before))
+    return int(any(result.error is not None for result in results))
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
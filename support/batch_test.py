@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import pathlib
+
+import pytest
+
+from support import batch
+from support.batch import FileResult
+from support.conftest import write_solution
+from support.runner import Solution
+
+
+@pytest.fixture
+def root(root: str) -> str:
+    write_solution(
+        root, 1, 'part1',
+        'def compute(s):\n    return sum(int(n) for n in s.split())\n',
+    )
+    inputs = pathlib.Path(root, 'inputs')
+    inputs.mkdir()
+    for i in range(10):
+        inputs.joinpath(f'{i}.txt').write_text(f'{i} {i}\n')
+    inputs.joinpath('bad.txt').write_text('x\n')
+    return root
+
+
+def test_expand_inputs(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    tmp_path.joinpath('d').mkdir()
+    tmp_path.joinpath('d', 'sub').mkdir()
+    for name in ('b.txt', 'a.txt', 'c.in'):
+        tmp_path.joinpath('d', name).touch()
+    assert batch.expand_inputs(['d']) == ['d/a.txt', 'd/b.txt', 'd/c.in']
+    assert batch.expand_inputs(['d/*.txt', 'd', 'missing.txt']) == [
+        'd/a.txt', 'd/b.txt', 'd/c.in', 'missing.txt',
+    ]
+
+
+@pytest.mark.parametrize(
+    ('n', 'workers', 'expected'),
+    ((3, 8, 1), (100, 4, 6), (100000, 4, batch.MAX_CHUNK)),
+)
+def test_chunk_size(n: int, workers: int, expected: int) -> None:
+    assert batch.chunk_size(n, workers) == expected
+
+
+def test_chunked() -> None:
+    paths = ['a', 'b', 'c', 'd', 'e']
+    assert batch.chunked(paths, 2) == [['a', 'b'], ['c', 'd'], ['e']]
+
+
+def test_run_batch(root: str) -> None:
+    paths = batch.expand_inputs([os.path.join(root, 'inputs')])
+    results = list(batch.run_batch(root, Solution(1, 'part1'), paths, jobs=2))
+    answers = {
+        os.path.basename(result.path): result.answer or result.error
+        for result in results
+    }
+    assert answers == {
+        **{f'{i}.txt': str(i * 2) for i in range(10)},
+        'bad.txt': "ValueError: invalid literal for int() with base 10: 'x'",
+    }
+
+
+def test_run_batch_killed_worker(root: str) -> None:
+    # a worker dying breaks the pool, the inputs it took with it run again
+    write_solution(
+        root, 2, 'part1',
+        'import signal\n'
+        'def compute(s):\n'
+        '    if s.startswith("x"):\n'
+        '        os.kill(os.getpid(), signal.SIGKILL)\n'
+        '    return len(s)\n',
+    )
+    paths = batch.expand_inputs([os.path.join(root, 'inputs')])
+    batch_results = batch.run_batch(
+        root, Solution(2, 'part1'), paths, jobs=2, chunk=3,
+    )
+    results = {
+        os.path.basename(result.path): result for result in batch_results
+    }
+    assert {name: result.answer for name, result in results.items()} == {
+        **{f'{i}.txt': '4' for i in range(10)},
+        'bad.txt': '',
+    }
+    error = results['bad.txt'].error
+    assert error is not None
+    assert error.startswith('BrokenProcessPool: ')
+
+
+def test_run_file(root: str) -> None:
+    result = batch.run_file(root, Solution(1, 'part1'), 'inputs/3.txt')
+    assert result.answer == '6'
+    assert result.error is None
+
+
+def test_run_file_missing_input(root: str) -> None:
+    result = batch.run_file(root, Solution(1, 'part1'), 'inputs/missing.txt')
+    assert result.error is not None
+    assert result.error.startswith('FileNotFoundError')
+
+
+def test_format_summary() -> None:
+    results = [
+        FileResult('/a.txt', '1', 0.25),
+        FileResult('/b.txt', '2', 0.75),
+        FileResult('/c.txt', '', 0.0, 'ValueError: nope'),
+    ]
+    lines = batch.format_summary(results, 0.5).splitlines()
+    assert lines[0] == (
+        '> 3 inputs (1 errors), 1000 ms compute, 500 ms wall, 6.0 inputs/s'
+    )
+    assert lines[1].startswith('> mean 500 ms, slowest 750 ms (')
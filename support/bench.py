@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import json
+import math
+import os.path
+import statistics
+import time
+from typing import NamedTuple
+
+import support
+from support.runner import captured_output
+from support.runner import discover
+from support.runner import format_error
+from support.runner import load_solution
+from support.runner import ROOT
+from support.runner import Solution
+
+
+class Measurement(NamedTuple):
+    solution: Solution
+    times: list[float]
+    error: str | None = None
+
+
+class Stats(NamedTuple):
+    runs: int
+    min: float
+    median: float
+    p95: float
+    mean: float
+    stdev: float
+
+    @classmethod
+    def from_times(cls, times: list[float]) -> Stats:
+        times = sorted(times)
+        return cls(
+            runs=len(times),
+            min=times[0],
+            median=statistics.median(times),
+            # nearest-rank percentile, exact for the small samples we take
+            p95=times[math.ceil(len(times) * 0.95) - 1],
+            mean=statistics.fmean(times),
+            stdev=statistics.stdev(times) if len(times) > 1 else 0.0,
+        )
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: float
+    current: float | None  # None: in the baseline but not in this run
+
+    @property
+    def change(self) -> float:
+        if self.current is None:
+            return math.inf
+        elif self.baseline == 0:
+            # a clock too coarse to see the baseline at all
+            return math.inf if self.current > 0 else 0.0
+        else:
+            return self.current / self.baseline - 1
+
+
+def bench_solution(
+    root: str,
+    solution: Solution,
+    *,
+    repeat: int,
+    warmup: int,
+) -> Measurement:
+    times = []
+    try:
+        with captured_output():
+            mod, s = load_solution(root, solution)
+            for _ in range(warmup):
+                mod.compute(s)
+            for _ in range(repeat):
+                before = time.perf_counter()
+                mod.compute(s)
+                after = time.perf_counter()
+                times.append(after - before)
+    except Exception as e:
+        return Measurement(solution, [], format_error(e))
+    return Measurement(solution, times)
+
+
+def bench_all(
+    root: str,
+    solutions: list[Solution],
+    *,
+    repeat: int,
+    warmup: int,
+    jobs: int = 1,
+) -> list[Measurement]:
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(
+                bench_solution, root, solution, repeat=repeat, warmup=warmup,
+            )
+            for solution in solutions
+        ]
+        return [future.result() for future in futures]
+
+
+def load_stats(filename: str) -> dict[str, Stats]:
+    with open(filename) as f:
+        return {name: Stats(**stats) for name, stats in json.load(f).items()}
+
+
+def dump_stats(filename: str, stats: dict[str, Stats]) -> None:
+    with open(filename, 'w') as f:
+        json.dump(
+            {name: s._asdict() for name, s in stats.items()},
+            f,
+            indent=2,
+            sort_keys=True,
+        )
+        f.write('\n')
+
+
+def compare(
+    baseline: dict[str, Stats],
+    current: dict[str, Stats],
+) -> list[Comparison]:
+    # a solution which errored or was renamed still has to show up
+    return [
+        Comparison(
+            name,
+            stats.median,
+            current[name].median if name in current else None,
+        )
+        for name, stats in sorted(baseline.items())
+    ]
+
+
+def format_stats(stats: dict[str, Stats]) -> str:
+    lines = [
+        f'{"solution":<24} {"runs":>4} {"min":>10} {"median":>10} '
+        f'{"p95":>10} {"stdev":>10}',
+    ]
+    for name, s in sorted(stats.items()):
+        lines.append(
+            f'{name:<24} {s.runs:>4} '
+            f'{support.format_elapsed(s.min):>10} '
+            f'{support.format_elapsed(s.median):>10} '
+            f'{support.format_elapsed(s.p95):>10} '
+            f'{support.format_elapsed(s.stdev):>10}',
+        )
+    return '\n'.join(lines)
+
+
+def format_comparisons(comparisons: list[Comparison], threshold: float) -> str:
+    lines = [f'{"solution":<24} {"baseline":>10} {"median":>10} {"change":>8}']
+    for c in comparisons:
+        if c.current is None:
+            lines.append(
+                f'{c.name:<24} '
+                f'{support.format_elapsed(c.baseline):>10} '
+                f'{"missing":>10} {"":>8}  REGRESSION',
+            )
+            continue
+        marker = '  REGRESSION' if c.change > threshold else ''
+        lines.append(
+            f'{c.name:<24} '
+            f'{support.format_elapsed(c.baseline):>10} '
+            f'{support.format_elapsed(c.current):>10} '
+            f'{c.change:>+8.1%}{marker}',
+        )
+    return '\n'.join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('days', nargs='*', type=int, help='default: all days')
+    parser.add_argument('--root', default=ROOT)
+    parser.add_argument('-n', '--repeat', type=int, default=10)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='benchmark several solutions at once (noisier, default: 1)',
+    )
+    parser.add_argument('-o', '--output', help='write the stats as json')
+    parser.add_argument('--baseline', help='json stats to compare against')
+    parser.add_argument(
+        '--threshold', type=float, default=0.1,
+        help='fail if a median regresses by more than this (default: 0.1)',
+    )
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        raise SystemExit('--repeat must be at least 1')
+
+    root = os.path.abspath(args.root)
+    solutions = discover(root, set(args.days) if args.days else None)
+    if not solutions:
+        raise SystemExit('no solutions found')
+
+    ret = 0
+    stats = {}
+    for m in bench_all(
+        root, solutions, repeat=args.repeat, warmup=args.warmup, jobs=args.jobs,
+    ):
+        if m.error is not None:
+            print(f'{m.solution.module}: ERROR {m.error}')
+            ret = 1
+        else:
+            stats[m.solution.module] = Stats.from_times(m.times)
+
+    print(format_stats(stats))
+
+    if args.output:
+        dump_stats(args.output, stats)
+
+    if args.baseline:
+        comparisons = compare(load_stats(args.baseline), stats)
+        print()
+        print(format_comparisons(comparisons, args.threshold))
+        if any(c.change > args.threshold for c in comparisons):
+            ret = 1
+
+    return ret
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
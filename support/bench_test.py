@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import math
+import pathlib
+
+import pytest
+
+from support import bench
+from support.bench import Comparison
+from support.bench import Stats
+
+
+def test_stats_from_times() -> None:
+    stats = Stats.from_times([5.0, 1.0, 3.0, 2.0, 4.0])
+    assert stats._replace(stdev=0.0) == Stats(
+        runs=5,
+        min=1.0,
+        median=3.0,
+        p95=5.0,
+        mean=3.0,
+        stdev=0.0,
+    )
+    assert abs(stats.stdev - 1.5811) < 1e-4
+
+
+def test_stats_from_single_time() -> None:
+    assert Stats.from_times([2.0]) == Stats(1, 2.0, 2.0, 2.0, 2.0, 0.0)
+
+
+def test_stats_roundtrip(tmp_path: pathlib.Path) -> None:
+    stats = {'day01.part1': Stats.from_times([1.0, 2.0])}
+    filename = str(tmp_path.joinpath('bench.json'))
+    bench.dump_stats(filename, stats)
+    assert bench.load_stats(filename) == stats
+
+
+def test_compare() -> None:
+    baseline = {
+        'day01.part1': Stats.from_times([1.0]),
+        'day02.part1': Stats.from_times([1.0]),
+    }
+    current = {
+        'day01.part1': Stats.from_times([1.5]),
+        'day03.part1': Stats.from_times([1.0]),
+    }
+    comparisons = bench.compare(baseline, current)
+    assert comparisons == [
+        Comparison('day01.part1', 1.0, 1.5),
+        Comparison('day02.part1', 1.0, None),
+    ]
+    assert comparisons[0].change == pytest.approx(0.5)
+    assert comparisons[1].change == math.inf
+
+
+def test_comparison_zero_baseline() -> None:
+    assert Comparison('day01.part1', 0.0, 0.5).change == math.inf
+    assert Comparison('day01.part1', 0.0, 0.0).change == 0.0
+
+
+def test_format_comparisons() -> None:
+    comparisons = [
+        Comparison('day01.part1', 1.0, 1.05),
+        Comparison('day01.part2', 1.0, 1.5),
+        Comparison('day02.part1', 1.0, None),
+    ]
+    assert bench.format_comparisons(comparisons, 0.1).splitlines() == [
+        'solution                   baseline     median   change',
+        'day01.part1                 1000 ms    1050 ms    +5.0%',
+        'day01.part2                 1000 ms    1500 ms   +50.0%  REGRESSION',
+        'day02.part1                 1000 ms    missing           REGRESSION',
+    ]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import os.path
+import pickle
+from typing import Any
+from typing import Callable
+from typing import cast
+from typing import TypeVar
+
+import support
+
+CACHE_DIR = os.path.join(support.HERE, '../.cache/parsed')
+MAX_SIZE = 256 * 1024 * 1024
+
+TFunc = TypeVar('TFunc', bound=Callable[..., Any])
+
+# where entries go, None until `enable` is called: caching is opt-in
+_directory: str | None = None
+_max_size = MAX_SIZE
+
+
+def enable(directory: str = CACHE_DIR, max_size: int = MAX_SIZE) -> None:
+    global _directory, _max_size
+    _directory, _max_size = directory, max_size
+
+
+def disable() -> None:
+    global _directory
+    _directory = None
+
+
+@functools.lru_cache(maxsize=None)
+def _file_digest(filename: str, mtime_ns: int) -> bytes:
+    with open(filename, 'rb') as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def _source_digest(filename: str) -> bytes:
+    # by modification time too, a long-lived process (`aoc-daemon`) reloads
+    # solutions after they are edited
+    return _file_digest(filename, os.stat(filename).st_mtime_ns)
+
+
+def cache_key(func: Callable[..., Any], *args: Any, **kwargs: Any) -> str:
+    # any change to the file `func` is in (it or the helpers it calls) or to
+    # its arguments (the input) makes a new entry
+    h = hashlib.sha256()
+    h.update(_source_digest(inspect.getfile(func)))
+    h.update(func.__qualname__.encode())
+    h.update(pickle.dumps((args, kwargs), protocol=pickle.HIGHEST_PROTOCOL))
+    return h.hexdigest()
+
+
+def evict(directory: str, max_size: int) -> None:
+    # least recently used first, reading an entry touches it
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith('.pickle'):
+            st = entry.stat()
+            entries.append((st.st_mtime_ns, st.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_size:
+            break
+        os.remove(path)
+        total -= size
+
+
+def cached(func: TFunc) -> TFunc:
+    # for parsing and precomputation that is slower than unpickling its
+    # result.  the arguments have to pickle the same way every time
+    @functools.wraps(func)
+    def cached_func(*args: Any, **kwargs: Any) -> Any:
+        if _directory is None:
+            return func(*args, **kwargs)
+
+        key = cache_key(func, *args, **kwargs)
+        path = os.path.join(_directory, f'{func.__qualname__}-{key}.pickle')
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            support.count('parse cache misses')
+            value = func(*args, **kwargs)
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            support.write_atomic(path, data)
+            evict(_directory, _max_size)
+        else:
+            support.count('parse cache hits')
+            os.utime(path)
+        return value
+
+    return cast(TFunc, cached_func)
+
+
+if os.environ.get('AOC_CACHE'):
+    enable()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import os
+import pathlib
+from typing import Callable
+from typing import Generator
+
+import pytest
+
+from support import cache
+
+
+@pytest.fixture
+def calls() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def enabled(tmp_path: pathlib.Path) -> Generator[pathlib.Path, None, None]:
+    cache.enable(str(tmp_path))
+    yield tmp_path
+    cache.disable()
+
+
+def _parse(calls: list[str]) -> Callable[[str], list[int]]:
+    @cache.cached
+    def parse(s: str) -> list[int]:
+        calls.append(s)
+        return [int(x) for x in s.split()]
+
+    return parse
+
+
+def test_cached_disabled(calls: list[str]) -> None:
+    parse = _parse(calls)
+    assert parse('1 2') == parse('1 2') == [1, 2]
+    assert calls == ['1 2', '1 2']
+
+
+def test_cached(enabled: pathlib.Path, calls: list[str]) -> None:
+    parse = _parse(calls)
+    assert parse('1 2') == parse('1 2') == [1, 2]
+    assert parse('3') == [3]
+    assert calls == ['1 2', '3']
+    assert len(list(enabled.iterdir())) == 2
+
+
+def test_cached_corrupt_entry(enabled: pathlib.Path, calls: list[str]) -> None:
+    parse = _parse(calls)
+    parse('1 2')
+    (entry,) = enabled.iterdir()
+    entry.write_bytes(b'')
+    assert parse('1 2') == [1, 2]
+    assert calls == ['1 2', '1 2']
+
+
+def _split(s: str, sep: str = ' ') -> list[str]:
+    return s.split(sep)
+
+
+def test_cache_key() -> None:
+    assert cache.cache_key(_split, '1') == cache.cache_key(_split, '1')
+    assert cache.cache_key(_split, '1') != cache.cache_key(_split, '2')
+    assert cache.cache_key(_split, '1') != cache.cache_key(_split, '1', sep=',')
+
+
+def test_source_digest_edited(tmp_path: pathlib.Path) -> None:
+    path = tmp_path.joinpath('part1.py')
+    path.write_text('x = 1\n')
+    os.utime(path, ns=(0, 0))
+    before = cache._source_digest(str(path))
+    assert cache._source_digest(str(path)) == before
+
+    path.write_text('x = 2\n')
+    os.utime(path, ns=(0, 1))
+    assert cache._source_digest(str(path)) != before
+
+
+def test_evict(tmp_path: pathlib.Path) -> None:
+    for i, name in enumerate(('b', 'a', 'c')):
+        path = tmp_path.joinpath(f'{name}.pickle')
+        path.write_bytes(b'x' * 10)
+        os.utime(path, ns=(i * 10**9, i * 10**9))
+    tmp_path.joinpath('notes.txt').write_bytes(b'x' * 100)
+    cache.evict(str(tmp_path), 20)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        'a.pickle', 'c.pickle', 'notes.txt',
+    ]
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import gc
+import math
+import os.path
+import statistics
+import time
+from typing import Callable
+from typing import NamedTuple
+
+import support
+from support import gen
+from support.runner import captured_output
+from support.runner import discover
+from support.runner import format_error
+from support.runner import load_solution
+from support.runner import ROOT
+from support.runner import Solution
+
+SCALES = (1, 2, 4, 8)
+# seconds of runs at each scale, at least
+MIN_TOTAL = 0.2
+
+
+class Bound(NamedTuple):
+    # how fast compute time may grow with n, the `support.gen` scale of the
+    # input, as the exponent of n.  the smallest scale should take 10ms or
+    # so, below that the timer and the allocator decide the slope
+    exponent: float
+    scales: tuple[float, ...] = SCALES
+
+
+# (day, part) as in `Solution`, each at the complexity it is meant to have
+# with 0.3 to spare.
+# solutions missing here aren't checked: day10's input can't grow and
+# day16's search is exponential in the valves
+BOUNDS = {
+    (1, 'part1'): Bound(1.3, (32, 64, 128, 256)),
+    (1, 'part2'): Bound(1.3, (32, 64, 128, 256)),
+    (2, 'part1'): Bound(1.3, (32, 64, 128, 256)),
+    (2, 'part2'): Bound(1.3, (32, 64, 128, 256)),
+    (3, 'part1'): Bound(1.3, (32, 64, 128, 256)),
+    (3, 'part2'): Bound(1.3, (32, 64, 128, 256)),
+    (4, 'part1'): Bound(1.3, (4, 8, 16, 32)),
+    (4, 'part2'): Bound(1.3, (4, 8, 16, 32)),
+    # the moves and the crates each one moves both grow with the stacks
+    (5, 'part1'): Bound(2.3, (16, 32, 64, 128)),
+    (5, 'part2'): Bound(2.3, (16, 32, 64, 128)),
+    (6, 'part1'): Bound(1.3, (128, 256, 512, 1024)),
+    (6, 'part2'): Bound(1.3, (128, 256, 512, 1024)),
+    (7, 'part1'): Bound(1.3, (8, 16, 32, 64)),
+    (7, 'part2'): Bound(1.3, (8, 16, 32, 64)),
+    (8, 'part1'): Bound(1.3, (0.5, 1, 2, 4)),
+    (8, 'part2'): Bound(1.3, (0.5, 1, 2, 4)),
+    (9, 'part1'): Bound(1.3, (0.25, 0.5, 1, 2)),
+    (9, 'part2'): Bound(1.3, (0.25, 0.5, 1, 2)),
+    (11, 'part1'): Bound(1.3, (0.5, 1, 2, 4)),
+    (11, 'part2'): Bound(1.3),
+    (12, 'part1'): Bound(1.3, (4, 8, 16, 32)),
+    (12, 'part2'): Bound(1.3, (4, 8, 16, 32)),
+    (13, 'part1'): Bound(1.3),
+    (13, 'part2'): Bound(1.3),
+    # the sand falls further in a deeper cave, n grains each falling sqrt(n)
+    (14, 'part1'): Bound(1.5, (2, 4, 8, 16)),
+    (14, 'part2'): Bound(1.5, (0.5, 1, 2, 4)),
+    (15, 'part1'): Bound(1.3, (256, 512, 1024, 2048)),
+    # the rows to check grow with the pairs of sensors
+    (15, 'part2'): Bound(2.3, (2, 4, 8, 16)),
+    (17, 'part1'): Bound(1.3, (0.25, 0.5, 1, 2)),
+    (17, 'part2'): Bound(1.3, (0.25, 0.5, 1, 2)),
+    # compares every pair of cubes
+    (18, 'part1'): Bound(2.3, (0.125, 0.25, 0.5, 1)),
+    (18, 'part2'): Bound(1.3, (0.5, 1, 2, 4)),
+    # some blueprints take much longer to search than others
+    (19, 'part1'): Bound(1.5),
+    (19, 'part2'): Bound(1.3),
+    # a move shifts two blocks of sqrt(n)
+    (20, 'part1_array'): Bound(1.8, (0.5, 1, 2, 4)),
+    (20, 'part2_array'): Bound(1.8, (0.25, 0.5, 1, 2)),
+    # walking to a number's new place is linear in the length of the list
+    (20, 'part1_linkedlist'): Bound(2.3, (0.1, 0.2, 0.4, 0.8)),
+    (20, 'part2_linkedlist'): Bound(2.3, (0.05, 0.1, 0.2, 0.4)),
+    (21, 'part1'): Bound(1.3, (2, 4, 8, 16)),
+    (21, 'part2'): Bound(1.3, (2, 4, 8, 16)),
+    (22, 'part1'): Bound(1.3),
+    (22, 'part2'): Bound(1.3),
+    (23, 'part1'): Bound(1.3, (2, 4, 8, 16)),
+    # more elves take more rounds to spread out
+    (23, 'part2'): Bound(1.7, (0.25, 0.5, 1, 2)),
+    # the blizzards' period grows with the valley, so does the way across
+    (24, 'part1'): Bound(1.7, (0.25, 0.5, 1)),
+    (24, 'part2'): Bound(1.7, (0.25, 0.5, 1)),
+    (25, 'part1'): Bound(1.3, (128, 256, 512, 1024)),
+}
+
+
+class Growth(NamedTuple):
+    solution: Solution
+    scales: list[float]
+    times: list[float]
+    error: str | None = None
+
+    @property
+    def exponent(self) -> float:
+        return fit_exponent(self.scales, self.times)
+
+
+def fit_exponent(sizes: list[float], times: list[float]) -> float:
+    # the slope of log(time) against log(size), so n ** k fits as k
+    slope, _ = statistics.linear_regression(
+        [math.log(size) for size in sizes],
+        [math.log(t) for t in times],
+    )
+    return slope
+
+
+def _run_time(compute: Callable[[str], object], s: str) -> float:
+    # a collection in the middle of a run is noise, there are none while
+    # timing (the caller turns them off) and the garbage is cleared first
+    gc.collect()
+    before = time.perf_counter()
+    compute(s)
+    after = time.perf_counter()
+    return after - before
+
+
+def measure_growth(
+    root: str,
+    solution: Solution,
+    scales: tuple[float, ...],
+    *,
+    repeat: int,
+    seed: int = 0,
+    min_total: float = MIN_TOTAL,
+) -> Growth:
+    done: list[float] = []
+    times: list[float] = []
+    gc.disable()
+    try:
+        with captured_output():
+            mod, _ = load_solution(root, solution)
+            inputs = [gen.generate(solution.day, scale, seed) for scale in scales]
+            for scale, s in zip(scales, inputs):
+                t = _run_time(mod.compute, s)
+                done.append(scale)
+                times.append(t)
+
+            # the quickest run is the one with the least noise in it.  the
+            # scales take turns, so the machine getting slower for a while
+            # slows them all alike rather than tilting the slope, and there
+            # are as many rounds as the smallest needs to add up to
+            # `min_total` (a run under a millisecond counts as one)
+            rounds = max(repeat, math.ceil(min_total / max(times[0], 1e-3)))
+            for _ in range(rounds - 1):
+                for i, s in enumerate(inputs):
+                    times[i] = min(times[i], _run_time(mod.compute, s))
+    except Exception as e:
+        return Growth(solution, done, times, format_error(e))
+    finally:
+        gc.enable()
+    return Growth(solution, done, times)
+
+
+def measure_isolated(
+    root: str,
+    solution: Solution,
+    scales: tuple[float, ...],
+    *,
+    repeat: int,
+    seed: int = 0,
+) -> Growth:
+    # `measure_growth` in a fresh process, one at a time.  the heap and the
+    # caches the solutions measured before leave behind skew the timings
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(
+            measure_growth, root, solution, scales, repeat=repeat, seed=seed,
+        )
+        return future.result()
+
+
+def format_growth(growths: list[Growth]) -> str:
+    lines = [f'{"solution":<24} {"smallest":>10} {"largest":>10} {"n ** k":>6}']
+    for growth in growths:
+        bound = BOUNDS[growth.solution].exponent
+        if growth.error is not None:
+            lines.append(f'{growth.solution.module:<24} ERROR {growth.error}')
+            continue
+        marker = f'  TOO SLOW (k <= {bound})' if growth.exponent > bound else ''
+        lines.append(
+            f'{growth.solution.module:<24} '
+            f'{support.format_elapsed(growth.times[0]):>10} '
+            f'{support.format_elapsed(growth.times[-1]):>10} '
+            f'{growth.exponent:>6.2f}{marker}',
+        )
+    return '\n'.join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('days', nargs='*', type=int, help='default: all days')
+    parser.add_argument('--root', default=ROOT)
+    parser.add_argument(
+        '-n', '--repeat', type=int, default=3,
+        help='runs per scale, at least (quick ones run for longer)',
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        raise SystemExit('--repeat must be at least 1')
+
+    root = os.path.abspath(args.root)
+    days = set(args.days) if args.days else None
+    solutions = [
+        solution
+        for solution in discover(root, days)
+        if solution in BOUNDS
+    ]
+    if not solutions:
+        raise SystemExit('no solutions with a bound found')
+
+    growths = [
+        measure_isolated(
+            root,
+            solution,
+            BOUNDS[solution].scales,
+            repeat=args.repeat,
+            seed=args.seed,
+        )
+        for solution in solutions
+    ]
+    print(format_growth(growths))
+
+    for growth in growths:
+        bound = BOUNDS[growth.solution].exponent
+        if growth.error is not None or growth.exponent > bound:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import gc
+import os.path
+import sys
+
+import pytest
+
+from support import complexity
+from support.complexity import Growth
+from support.conftest import write_solution
+from support.runner import ROOT
+from support.runner import Solution
+
+
+@pytest.fixture
+def root(root: str) -> str:
+    write_solution(
+        root, 1, 'part1', 'def compute(s):\n    return sum(map(int, s.split()))\n',
+        '1\n',
+    )
+    write_solution(root, 1, 'part2', 'def compute(s):\n    raise ValueError("nope")\n')
+    return root
+
+
+@pytest.mark.parametrize('k', (0.5, 1, 2))
+def test_fit_exponent(k: float) -> None:
+    sizes: list[float] = [1, 2, 4, 8]
+    times = [0.003 * n ** k for n in sizes]
+    assert complexity.fit_exponent(sizes, times) == pytest.approx(k)
+
+
+def test_measure_growth(root: str) -> None:
+    growth = complexity.measure_growth(
+        root, Solution(1, 'part1'), (0.5, 1), repeat=2, min_total=0,
+    )
+    assert growth.error is None
+    assert growth.scales == [0.5, 1]
+    assert all(t > 0 for t in growth.times)
+
+
+def test_measure_growth_error(root: str) -> None:
+    growth = complexity.measure_growth(
+        root, Solution(1, 'part2'), (0.5, 1), repeat=2, min_total=0,
+    )
+    assert growth.error == 'ValueError: nope'
+    assert gc.isenabled()
+
+
+@pytest.mark.parametrize('solution', complexity.BOUNDS)
+def test_bounds_are_solutions(solution: tuple[int, str]) -> None:
+    day, part = solution
+    assert os.path.exists(os.path.join(ROOT, f'day{day:02}', f'{part}.py'))
+
+
+def test_measure_growth_linear_day(monkeypatch: pytest.MonkeyPatch) -> None:
+    # the real harness on a real day, which had better fit as linear
+    monkeypatch.chdir(ROOT)
+    monkeypatch.setattr(sys, 'path', sys.path[:])
+    solution = Solution(6, 'part1')
+    bound = complexity.BOUNDS[solution]
+    growth = complexity.measure_growth(ROOT, solution, bound.scales, repeat=3)
+    assert growth.error is None
+    assert growth.exponent <= bound.exponent
+
+
+def test_format_growth() -> None:
+    growths = [
+        Growth(Solution(1, 'part1'), [1, 2, 4], [0.001, 0.002, 0.004]),
+        Growth(Solution(1, 'part2'), [1, 2, 4], [0.001, 0.004, 0.016]),
+        Growth(Solution(2, 'part1'), [], [], 'ValueError: nope'),
+    ]
+    assert complexity.format_growth(growths).splitlines() == [
+        'solution                   smallest    largest n ** k',
+        'day01.part1                 1000 μs    4000 μs   1.00',
+        'day01.part2                 1000 μs   16000 μs   2.00  TOO SLOW (k <= 1.3)',
+        'day02.part1              ERROR ValueError: nope',
+    ]
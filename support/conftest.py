@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pathlib
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def root(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    # a tree of days for the runners.  they change directory and import the
+    # days in-process, make sure none of that leaks out
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, 'path', sys.path[:])
+    for name in tuple(sys.modules):
+        if name.startswith('day'):
+            monkeypatch.delitem(sys.modules, name)
+    return str(tmp_path)
+
+
+def write_solution(
+    root: str,
+    day: int,
+    part: str,
+    body: str,
+    input_s: str = 'a b\nc\n',
+) -> None:
+    # `body` comes after the `INPUT_TXT` every solution has
+    day_dir = pathlib.Path(root, f'day{day:02}')
+    day_dir.mkdir(exist_ok=True)
+    day_dir.joinpath('__init__.py').touch()
+    day_dir.joinpath('input.txt').write_text(input_s)
+    day_dir.joinpath(f'{part}.py').write_text(
+        'import os.path\n'
+        'INPUT_TXT = os.path.join(os.path.dirname(__file__), "input.txt")\n'
+        f'{body}',
+    )
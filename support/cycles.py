@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import itertools
+from typing import Callable
+from typing import Hashable
+from typing import Iterable
+from typing import NamedTuple
+from typing import Sequence
+from typing import TypeVar
+
+T = TypeVar('T')
+
+
+class Cycle(NamedTuple):
+    # step `start + length` is the same state as step `start`, and so on
+    # from there: the steps before `start` are the run-up to the cycle
+    start: int
+    length: int
+
+    def reduce(self, n: int) -> tuple[int, int]:
+        # (m, k) where step n is the state of step m, `k` times around the
+        # cycle later.  m is less than `start + length`
+        if n < self.start:
+            return n, 0
+        k, offset = divmod(n - self.start, self.length)
+        return self.start + offset, k
+
+
+def floyd(f: Callable[[T], T], x0: T) -> Cycle:
+    # tortoise and hare, for states cheap to compare and `f` without side
+    # effects.  only ever holds two states
+    tortoise, hare = f(x0), f(f(x0))
+    while tortoise != hare:
+        tortoise, hare = f(tortoise), f(f(hare))
+
+    start = 0
+    tortoise = x0
+    while tortoise != hare:
+        tortoise, hare = f(tortoise), f(hare)
+        start += 1
+
+    length = 1
+    hare = f(tortoise)
+    while tortoise != hare:
+        hare = f(hare)
+        length += 1
+    return Cycle(start, length)
+
+
+def brent(f: Callable[[T], T], x0: T) -> Cycle:
+    # like `floyd` with fewer calls of `f`: the length first, by comparing
+    # with a state saved at each power of two
+    power = length = 1
+    tortoise, hare = x0, f(x0)
+    while tortoise != hare:
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = f(hare)
+        length += 1
+
+    start = 0
+    tortoise = hare = x0
+    for _ in range(length):
+        hare = f(hare)
+    while tortoise != hare:
+        tortoise, hare = f(tortoise), f(hare)
+        start += 1
+    return Cycle(start, length)
+
+
+def find_cycle(keys: Iterable[Hashable]) -> Cycle:
+    # `keys` has a fingerprint of the state after each step, starting with
+    # step 0.  for simulations mutating their state in place, the first
+    # fingerprint seen twice marks the cycle.  holds every fingerprint
+    seen: dict[Hashable, int] = {}
+    for i, key in enumerate(keys):
+        first = seen.setdefault(key, i)
+        if first != i:
+            return Cycle(first, i - first)
+    raise ValueError('the steps ended before a cycle')
+
+
+def project(values: Sequence[int], cycle: Cycle, n: int) -> int:
+    # the value at step n, from the values up to `cycle.start + cycle.length`
+    # and assuming each time around the cycle adds the same to it
+    m, k = cycle.reduce(n)
+    gain = values[cycle.start + cycle.length] - values[cycle.start]
+    return values[m] + k * gain
+
+
+def value_at(
+    state: T,
+    step: Callable[[T], T],
+    key: Callable[[T], Hashable],
+    value: Callable[[T], int],
+    n: int,
+) -> int:
+    # `value` of the state after n calls of `step`, with n as large as it
+    # likes once the states repeat.  `key` fingerprints a state, states with
+    # the same fingerprint have to go on the same way
+    values = []
+    seen: dict[Hashable, int] = {}
+    for i in itertools.count():
+        values.append(value(state))
+        if i == n:
+            return values[n]
+        first = seen.setdefault(key(state), i)
+        if first != i:
+            return project(values, Cycle(first, i - first), n)
+        state = step(state)
+    raise AssertionError('unreachable')
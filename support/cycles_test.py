@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import Callable
+from typing import Iterator
+
+import pytest
+
+from support import cycles
+from support.cycles import Cycle
+
+
+def _rho(x: int) -> int:
+    # 0, 1, 2, 5, 26, 677, 34, 1157, ... until it comes round again
+    return (x * x + 1) % 2047
+
+
+def _states(f: Callable[[int], int], x: int) -> Iterator[int]:
+    while True:
+        yield x
+        x = f(x)
+
+
+def _naive(f: Callable[[int], int], x: int) -> Cycle:
+    seen = []
+    while x not in seen:
+        seen.append(x)
+        x = f(x)
+    return Cycle(seen.index(x), len(seen) - seen.index(x))
+
+
+@pytest.mark.parametrize(
+    ('f', 'x0'),
+    (
+        (_rho, 0),
+        (_rho, 3),
+        (lambda x: (x + 3) % 10, 4),
+        (lambda x: min(x + 1, 7), 0),
+        (lambda x: x, 5),
+    ),
+)
+@pytest.mark.parametrize('find', (cycles.floyd, cycles.brent))
+def test_find_cycle(
+    find: Callable[[Callable[[int], int], int], Cycle],
+    f: Callable[[int], int],
+    x0: int,
+) -> None:
+    expected = _naive(f, x0)
+    assert find(f, x0) == expected
+    assert cycles.find_cycle(_states(f, x0)) == expected
+
+
+def test_find_cycle_none() -> None:
+    with pytest.raises(ValueError):
+        cycles.find_cycle(range(10))
+
+
+@pytest.mark.parametrize(
+    ('n', 'expected'),
+    ((0, (0, 0)), (2, (2, 0)), (3, (3, 0)), (7, (3, 1)), (10, (6, 1)), (11, (3, 2))),
+)
+def test_cycle_reduce(n: int, expected: tuple[int, int]) -> None:
+    assert Cycle(3, 4).reduce(n) == expected
+
+
+def test_project() -> None:
+    # 10, 11 then 12, 15, 17 over and over, each time around adds 7
+    values = [10, 11, 12, 15, 17, 19]
+    assert [cycles.project(values, Cycle(2, 3), n) for n in range(9)] == [
+        10, 11, 12, 15, 17, 19, 22, 24, 26,
+    ]
+
+
+def _step(state: tuple[int, int]) -> tuple[int, int]:
+    # x goes 0, 1, ... 9 then 5, ... 9 over and over, adding itself up
+    x, total = state
+    return (x + 1 if x < 9 else 5), total + x
+
+
+@pytest.mark.parametrize('n', (0, 3, 5, 9, 10, 17, 1000, 10 ** 12))
+def test_value_at(n: int) -> None:
+    if n <= 5:
+        expected = sum(range(n))
+    else:
+        k, r = divmod(n - 5, 5)
+        expected = 10 + 35 * k + sum(range(5, 5 + r))
+    actual = cycles.value_at(
+        (0, 0), _step, lambda state: state[0], lambda state: state[1], n,
+    )
+    assert actual == expected
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os.path
+import re
+import socket
+import socketserver
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import Any
+
+import support
+from support.runner import captured_output
+from support.runner import discover
+from support.runner import format_error
+from support.runner import ROOT
+from support.runner import Solution
+
+SOCKET_PATH = os.path.join(ROOT, '.cache/daemon.sock')
+REQUEST_RE = re.compile(r'^run day(\d\d) (part\d\w*)(?: (.+))?$')
+
+
+def parse_request(line: str) -> tuple[Solution, str | None]:
+    # `run dayNN partN [input path]`, the day's input.txt by default
+    match = REQUEST_RE.match(line.strip())
+    if match is None:
+        raise ValueError(f'expected `run dayNN partN [input]`: {line.strip()!r}')
+    return Solution(int(match[1]), match[2]), match[3]
+
+
+class Worker:
+    # keeps the solutions imported and their inputs read between requests, a
+    # solution is reimported when its file changes (but not `support`)
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self.modules: dict[Solution, tuple[ModuleType, int]] = {}
+        self.inputs: dict[str, tuple[int, str]] = {}
+        if root not in sys.path:
+            sys.path.insert(0, root)
+
+    def _module(self, solution: Solution) -> ModuleType:
+        path = os.path.join(self.root, solution.dirname, f'{solution.part}.py')
+        mtime = os.stat(path).st_mtime_ns
+        loaded = self.modules.get(solution)
+        if loaded is None:
+            mod = importlib.import_module(solution.module)
+        elif loaded[1] != mtime:
+            support.count('reloads')
+            mod = importlib.reload(loaded[0])
+        else:
+            return loaded[0]
+        self.modules[solution] = (mod, mtime)
+        return mod
+
+    def _input(self, path: str) -> str:
+        mtime = os.stat(path).st_mtime_ns
+        cached = self.inputs.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path) as f:
+                cached = self.inputs[path] = (mtime, f.read())
+        return cached[1]
+
+    def preload(self) -> None:
+        for solution in discover(self.root):
+            try:
+                self.run(solution, compute=False)
+            except Exception:  # reported when it's asked for
+                pass
+
+    def run(
+        self,
+        solution: Solution,
+        path: str | None = None,
+        *,
+        compute: bool = True,
+    ) -> dict[str, Any]:
+        # some days read their example inputs relative to the working directory
+        os.chdir(os.path.join(self.root, solution.dirname))
+        with captured_output() as out:
+            mod = self._module(solution)
+            s = self._input(mod.INPUT_TXT if path is None else path)
+            if not compute:
+                return {}
+            before = time.perf_counter()
+            ret = mod.compute(s)
+            after = time.perf_counter()
+        # solutions which draw their answer print it instead of returning it
+        answer = out.getvalue().rstrip('\n') if ret is None else str(ret)
+        return {'answer': answer, 'elapsed': after - before}
+
+    def handle(self, line: str) -> dict[str, Any]:
+        try:
+            solution, path = parse_request(line)
+            return self.run(solution, path)
+        except Exception as e:
+            return {'error': format_error(e)}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: _Server
+
+    def handle(self) -> None:
+        # one response line for each request line until the client hangs up
+        for request in self.rfile:
+            line = request.decode()
+            if line.strip() == 'stop':
+                self.server.stopping = True
+                return
+            response = self.server.worker.handle(line)
+            self.wfile.write(f'{json.dumps(response)}\n'.encode())
+            self.wfile.flush()
+
+
+class _Server(socketserver.UnixStreamServer):
+    def __init__(self, path: str, worker: Worker) -> None:
+        self.worker = worker
+        self.stopping = False
+        super().__init__(path, _Handler)
+
+
+def serve(
+    path: str,
+    worker: Worker,
+    ready: threading.Event | None = None,
+) -> None:
+    # one request at a time: solutions change directory and print answers
+    if os.path.exists(path):
+        os.remove(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with _Server(path, worker) as server:
+        if ready is not None:
+            ready.set()
+        try:
+            while not server.stopping:
+                server.handle_request()
+        finally:
+            os.remove(path)
+
+
+def request(path: str, line: str) -> dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        with sock.makefile('rwb') as f:
+            f.write(f'{line}\n'.encode())
+            f.flush()
+            return json.loads(f.readline())
+
+
+def stop(path: str) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall(b'stop\n')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--socket', default=SOCKET_PATH)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    serve_parser = subparsers.add_parser('serve')
+    serve_parser.add_argument('--root', default=ROOT)
+    run_parser = subparsers.add_parser('run')
+    run_parser.add_argument('day', help='e.g. day01')
+    run_parser.add_argument('part', help='e.g. part1')
+    run_parser.add_argument('input', nargs='?', help="default: the day's input")
+    subparsers.add_parser('stop')
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        worker = Worker(os.path.abspath(args.root))
+        worker.preload()
+        print(f'serving on {args.socket}', file=sys.stderr)
+        serve(args.socket, worker)
+        return 0
+
+    try:
+        if args.command == 'stop':
+            stop(args.socket)
+            return 0
+        line = f'run {args.day} {args.part}'
+        if args.input is not None:
+            line += f' {os.path.abspath(args.input)}'
+        response = request(args.socket, line)
+    except OSError as e:
+        raise SystemExit(f'no daemon on {args.socket} ({e}), start one: serve')
+
+    if 'error' in response:
+        print(response['error'], file=sys.stderr)
+        return 1
+    print(response['answer'])
+    elapsed = support.format_elapsed(response['elapsed'])
+    print(f'> {elapsed}', file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
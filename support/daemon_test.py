@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import threading
+
+import pytest
+
+from support import daemon
+from support.conftest import write_solution
+from support.runner import Solution
+
+
+@pytest.fixture
+def root(root: str) -> str:
+    write_solution(root, 1, 'part1', 'def compute(s):\n    return len(s.split())\n')
+    write_solution(root, 1, 'part2', 'def compute(s):\n    print(s.upper().strip())\n')
+    return root
+
+
+@pytest.mark.parametrize(
+    ('line', 'expected'),
+    (
+        ('run day01 part1\n', (Solution(1, 'part1'), None)),
+        ('run day20 part2_array', (Solution(20, 'part2_array'), None)),
+        ('run day01 part2 /tmp/a b.txt', (Solution(1, 'part2'), '/tmp/a b.txt')),
+    ),
+)
+def test_parse_request(line: str, expected: tuple[Solution, str | None]) -> None:
+    assert daemon.parse_request(line) == expected
+
+
+@pytest.mark.parametrize('line', ('', 'run', 'run day1 part1', 'go day01 part1'))
+def test_parse_request_invalid(line: str) -> None:
+    with pytest.raises(ValueError):
+        daemon.parse_request(line)
+
+
+def test_worker(root: str, tmp_path: pathlib.Path) -> None:
+    worker = daemon.Worker(root)
+    assert worker.handle('run day01 part1')['answer'] == '3'
+    assert worker.handle('run day01 part2')['answer'] == 'A B\nC'
+    other = tmp_path.joinpath('other.txt')
+    other.write_text('x\n')
+    assert worker.handle(f'run day01 part1 {other}')['answer'] == '1'
+    assert worker.handle('run day02 part1')['error'].startswith('FileNotFound')
+
+
+def test_worker_reloads_changed_solution(root: str, tmp_path: pathlib.Path) -> None:
+    worker = daemon.Worker(root)
+    assert worker.handle('run day01 part1')['answer'] == '3'
+    path = tmp_path.joinpath('day01', 'part1.py')
+    path.write_text(path.read_text().replace('len(', '-len('))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert worker.handle('run day01 part1')['answer'] == '-3'
+
+
+def test_serve(root: str, tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path.joinpath('d.sock'))
+    worker = daemon.Worker(root)
+    ready = threading.Event()
+    thread = threading.Thread(target=daemon.serve, args=(path, worker, ready))
+    thread.start()
+    try:
+        assert ready.wait(5)
+        assert daemon.request(path, 'run day01 part1')['answer'] == '3'
+        assert 'error' in daemon.request(path, 'nonsense')
+    finally:
+        daemon.stop(path)
+        thread.join(5)
+    assert not thread.is_alive()
+    assert not os.path.exists(path)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+# directions are small ints, clockwise from right with y going down (the
+# order of the puzzles' "facing"), so turning is indexing a table:
+# `CW_4[d]`, and stepping is `DELTA_4[d]` or, on a flat grid, `offsets[d]`.
+# unlike `Direction4`, which starts from up
+RIGHT, DOWN, LEFT, UP = range(4)
+DELTA_4 = ((1, 0), (0, 1), (-1, 0), (0, -1))
+CW_4 = (DOWN, LEFT, UP, RIGHT)
+CCW_4 = (UP, RIGHT, DOWN, LEFT)
+OPPOSITE_4 = (LEFT, UP, RIGHT, DOWN)
+# `TURN_4['R'][d]`
+TURN_4 = {'R': CW_4, 'L': CCW_4}
+
+# the same with the diagonals between, a 4 direction `d` is `2 * d` here
+E, SE, S, SW, W, NW, N, NE = range(8)
+DELTA_8 = ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+CW_8 = tuple((d + 1) % 8 for d in range(8))
+CCW_8 = tuple((d - 1) % 8 for d in range(8))
+OPPOSITE_8 = tuple((d + 4) % 8 for d in range(8))
+
+
+def offsets(
+    stride: int,
+    deltas: tuple[tuple[int, int], ...] = DELTA_4,
+) -> tuple[int, ...]:
+    # what each direction adds to a flat index (see `support.Grid`), in the
+    # order of `deltas`
+    return tuple(dy * stride + dx for dx, dy in deltas)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+import support
+from support import direction
+
+
+def test_turns_4() -> None:
+    for d, (dx, dy) in enumerate(direction.DELTA_4):
+        # with y going down, clockwise takes (x, y) to (-y, x)
+        assert direction.DELTA_4[direction.CW_4[d]] == (-dy, dx)
+        assert direction.DELTA_4[direction.CCW_4[d]] == (dy, -dx)
+        assert direction.DELTA_4[direction.OPPOSITE_4[d]] == (-dx, -dy)
+    assert direction.TURN_4['R'][direction.UP] == direction.RIGHT
+    assert direction.TURN_4['L'][direction.UP] == direction.LEFT
+
+
+def test_turns_8() -> None:
+    for d, (dx, dy) in enumerate(direction.DELTA_8):
+        assert direction.CCW_8[direction.CW_8[d]] == d
+        assert direction.CW_8[direction.CW_8[d]] == (d + 2) % 8
+        assert direction.DELTA_8[direction.OPPOSITE_8[d]] == (-dx, -dy)
+    assert set(direction.DELTA_8) == set(support.adjacent_8(0, 0))
+    for d in range(4):
+        assert direction.DELTA_8[2 * d] == direction.DELTA_4[d]
+        assert direction.CW_8[direction.CW_8[2 * d]] == 2 * direction.CW_4[d]
+
+
+@pytest.mark.parametrize('deltas', (direction.DELTA_4, direction.DELTA_8))
+def test_offsets(deltas: tuple[tuple[int, int], ...]) -> None:
+    grid = support.Grid.from_bytes(b'abc\ndef\nghi\n')
+    i = grid.index(1, 1)
+    assert [
+        grid.data[i + offset] for offset in direction.offsets(grid.stride, deltas)
+    ] == [grid.data[grid.index(1 + dx, 1 + dy)] for dx, dy in deltas]
+    assert direction.offsets(grid.stride) == (1, 4, -1, -4)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import argparse
+import importlib
+import random
+import sys
+
+DAYS = range(1, 26)
+
+
+def scaled(n: int, scale: float) -> int:
+    return max(1, round(n * scale))
+
+
+def scaled_side(n: int, scale: float, dims: int = 2) -> int:
+    # the side of a `dims` dimensional input whose area / volume is scaled
+    return max(1, round(n * scale ** (1 / dims)))
+
+
+def generate(day: int, scale: float = 1, seed: int = 0) -> str:
+    # a puzzle input for `day` roughly `scale` times the size of a real one,
+    # the same `seed` always gives the same input
+    if day not in DAYS:
+        raise ValueError(f'no generator for day {day}')
+    if scale <= 0:
+        raise ValueError(f'scale must be positive: {scale}')
+    mod = importlib.import_module(f'support.gen.day{day:02}')
+    rng = random.Random(seed * len(DAYS) + day)
+    return mod.generate(rng, scale)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('day', type=int)
+    parser.add_argument('--scale', type=float, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', help='default: stdout')
+    args = parser.parse_args()
+
+    s = generate(args.day, args.scale, args.seed)
+    if args.output is None:
+        sys.stdout.write(s)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(s)
+    return 0
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    elves = []
+    for _ in range(gen.scaled(250, scale)):
+        calories = [rng.randint(1000, 15000) for _ in range(rng.randint(1, 15))]
+        elves.append(''.join(f'{n}\n' for n in calories))
+    return '\n'.join(elves)
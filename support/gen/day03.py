@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import random
+import string
+
+from support import gen
+
+ITEMS = string.ascii_letters
+
+
+def _group(rng: random.Random) -> list[str]:
+    # the three elves only have the badge in common: every other item comes
+    # from a pool of its own.  each pool is split between the compartments
+    # with one item in both
+    badge = rng.choice(ITEMS)
+    others = [c for c in ITEMS if c != badge]
+    rng.shuffle(others)
+    lines = []
+    for i in range(3):
+        pool = others[i::3]
+        shared, pool = pool[0], pool[1:]
+        split = len(pool) // 2
+        size = rng.randint(8, 24)
+        first = [shared, badge, *rng.choices(pool[:split], k=size - 2)]
+        second = [shared, *rng.choices(pool[split:], k=size - 1)]
+        rng.shuffle(first)
+        rng.shuffle(second)
+        lines.append(''.join(first + second))
+    return lines
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    return ''.join(
+        f'{line}\n'
+        for _ in range(gen.scaled(100, scale))
+        for line in _group(rng)
+    )
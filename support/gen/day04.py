@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+
+def _section(rng: random.Random) -> str:
+    start, end = sorted(rng.choices(range(1, 100), k=2))
+    return f'{start}-{end}'
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    return ''.join(
+        f'{_section(rng)},{_section(rng)}\n' for _ in range(gen.scaled(1000, scale))
+    )
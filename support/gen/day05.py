@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import random
+import string
+
+from support import gen
+
+# the stack numbers are one character wide
+STACKS = 9
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    tallest = max(2, gen.scaled(8, scale))
+    stacks = [
+        rng.choices(string.ascii_uppercase, k=rng.randint(2, tallest))
+        for _ in range(STACKS)
+    ]
+    height = max(len(stack) for stack in stacks)
+    lines = []
+    for y in reversed(range(height)):
+        row = (f'[{stack[y]}]' if y < len(stack) else '   ' for stack in stacks)
+        lines.append(' '.join(row))
+    lines.append(' '.join(f' {i} ' for i in range(1, STACKS + 1)))
+    lines.append('')
+
+    # never empty a stack, the answer is the crate on top of each one
+    for _ in range(gen.scaled(500, scale)):
+        src = rng.choice([i for i, stack in enumerate(stacks) if len(stack) > 1])
+        dst = rng.choice([i for i in range(STACKS) if i != src])
+        n = rng.randint(1, len(stacks[src]) - 1)
+        stacks[dst].extend(reversed(stacks[src][-n:]))
+        del stacks[src][-n:]
+        lines.append(f'move {n} from {src + 1} to {dst + 1}')
+    return ''.join(f'{line}\n' for line in lines)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import random
+import string
+
+from support import gen
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # 3 letters can't hold a start-of-packet marker and 13 can't hold a
+    # start-of-message marker, so the first is about a quarter of the way in
+    # and the second right at the end
+    n = gen.scaled(4096, scale)
+    packet = rng.choices('abc', k=n // 4)
+    packet += rng.choices(string.ascii_lowercase[:13], k=n - len(packet) - 14)
+    packet += rng.sample(string.ascii_lowercase, k=14)
+    return ''.join(packet) + '\n'
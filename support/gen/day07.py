@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import random
+import string
+
+from support import gen
+
+DISK = 70_000_000
+NEEDED = 30_000_000
+
+
+class _Dir:
+    def __init__(self) -> None:
+        self.dirs: dict[str, _Dir] = {}
+        self.files: dict[str, int] = {}
+
+
+def _name(rng: random.Random, taken: dict[str, _Dir] | dict[str, int]) -> str:
+    while True:
+        name = ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+        if rng.random() < 0.5:
+            name += '.' + ''.join(rng.choices(string.ascii_lowercase, k=3))
+        if name not in taken:
+            return name
+
+
+def _listing(d: _Dir, lines: list[str]) -> None:
+    lines.append('$ ls')
+    lines.extend(f'dir {name}' for name in d.dirs)
+    lines.extend(f'{size} {name}' for name, size in d.files.items())
+    for name, sub in d.dirs.items():
+        lines.append(f'$ cd {name}')
+        _listing(sub, lines)
+        lines.append('$ cd ..')
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # each directory hangs off a random earlier one, which keeps the tree
+    # only logarithmically deep
+    root = _Dir()
+    dirs = [root]
+    for _ in range(gen.scaled(180, scale)):
+        parent = rng.choice(dirs)
+        parent.dirs[_name(rng, parent.dirs)] = sub = _Dir()
+        dirs.append(sub)
+
+    # the disk is always too full for the update, but not full
+    n = gen.scaled(300, scale)
+    weights = [rng.randint(1, 300) for _ in range(n)]
+    used = rng.randint(DISK - NEEDED + n + 1, DISK - n - 1)
+    total = sum(weights)
+    for weight in weights:
+        d = rng.choice(dirs)
+        d.files[_name(rng, d.files)] = max(1, weight * used // total)
+
+    lines = ['$ cd /']
+    _listing(root, lines)
+    return ''.join(f'{line}\n' for line in lines)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # the trees get taller towards the middle of the forest
+    side = gen.scaled_side(99, scale)
+    half = max(1, side // 2)
+    lines = []
+    for y in range(side):
+        row = []
+        for x in range(side):
+            edge = max(abs(x - half), abs(y - half)) / half
+            height = round(2 + 6 * (1 - edge)) + rng.randint(-2, 2)
+            row.append(str(min(9, max(0, height))))
+        lines.append(''.join(row))
+    return ''.join(f'{line}\n' for line in lines)
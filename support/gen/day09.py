@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    return ''.join(
+        f'{rng.choice("UDLR")} {rng.randint(1, 19)}\n'
+        for _ in range(gen.scaled(2000, scale))
+    )
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import random
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # the CRT is 240 pixels, a longer program runs off the screen, so this
+    # one is the same size at any scale
+    lines = []
+    cycles, x = 0, 1
+    while cycles < 240:
+        if cycles > 238 or rng.random() < 0.3:
+            lines.append('noop')
+            cycles += 1
+        else:
+            # keep the sprite somewhere near the screen
+            v = rng.randint(max(-20, -5 - x), min(20, 45 - x))
+            lines.append(f'addx {v}')
+            cycles += 2
+            x += v
+    return ''.join(f'{line}\n' for line in lines)
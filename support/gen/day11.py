@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+# every monkey tests against its own prime, which keeps the common multiple
+# (and so the worry levels) small.  a bigger input means more items
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19)
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # the monkeys come first so they are the same at every scale
+    n = len(PRIMES)
+    squares = rng.randrange(n)
+    primes = rng.sample(PRIMES, k=n)
+    operations, targets = [], []
+    for i in range(n):
+        if i == squares:
+            operations.append('old * old')
+        elif rng.random() < 0.3:
+            operations.append(f'old * {rng.randint(2, 19)}')
+        else:
+            operations.append(f'old + {rng.randint(1, 8)}')
+        targets.append(rng.sample([j for j in range(n) if j != i], k=2))
+
+    items: list[list[int]] = [[] for _ in range(n)]
+    for i in range(max(n, gen.scaled(36, scale))):
+        # everyone starts with at least one item
+        monkey = i if i < n else rng.randrange(n)
+        items[monkey].append(rng.randint(50, 99))
+
+    monkeys = []
+    for i in range(n):
+        if_true, if_false = targets[i]
+        monkeys.append(
+            f'Monkey {i}:\n'
+            f'  Starting items: {", ".join(map(str, items[i]))}\n'
+            f'  Operation: new = {operations[i]}\n'
+            f'  Test: divisible by {primes[i]}\n'
+            f'    If true: throw to monkey {if_true}\n'
+            f'    If false: throw to monkey {if_false}\n',
+        )
+    return '\n'.join(monkeys)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import random
+import string
+
+from support import gen
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # a hill that gets one step higher every ring towards E in the middle,
+    # with noise on top.  S is at the foot of the hill on the left edge and
+    # the row between them is left alone so there is always a way up
+    width = max(60, gen.scaled_side(159, scale))
+    height = max(3, gen.scaled_side(41, scale))
+    cx, cy = width // 2, height // 2
+    rings = max(cx, cy, width - 1 - cx, height - 1 - cy)
+    lines = []
+    for y in range(height):
+        row = []
+        for x in range(width):
+            ring = max(abs(x - cx), abs(y - cy))
+            elevation = 25 - 26 * ring // (rings + 1)
+            if y != cy:
+                elevation = min(25, max(0, elevation + rng.randint(-1, 2)))
+            row.append(string.ascii_lowercase[elevation])
+        lines.append(row)
+    lines[cy][0] = 'S'
+    lines[cy][cx] = 'E'
+    return ''.join(f'{"".join(row)}\n' for row in lines)
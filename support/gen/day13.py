@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+
+def _packet(rng: random.Random, depth: int = 0) -> str:
+    parts = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.4:
+            parts.append(_packet(rng, depth + 1))
+        else:
+            parts.append(str(rng.randint(0, 10)))
+    return f'[{",".join(parts)}]'
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    pairs = []
+    for _ in range(gen.scaled(150, scale)):
+        left = _packet(rng)
+        while (right := _packet(rng)) == left:
+            pass
+        pairs.append(f'{left}\n{right}\n')
+    return '\n'.join(pairs)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+# the solutions use a 1000 wide cave with the sand pouring in at x=500, the
+# pile on the floor is twice as wide as the cave is deep
+SOURCE_X = 500
+MAX_DEPTH = 480
+
+
+def _path(rng: random.Random, depth: int) -> str:
+    x = rng.randint(SOURCE_X - depth // 2, SOURCE_X + depth // 2)
+    y = rng.randint(10, depth)
+    points = [(x, y)]
+    for i in range(rng.randint(1, 6)):
+        if i % 2 == 0:
+            x = min(SOURCE_X + depth, max(SOURCE_X - depth, x + rng.randint(-8, 8)))
+        else:
+            y = min(depth, max(10, y + rng.randint(-8, 8)))
+        points.append((x, y))
+    return ' -> '.join(f'{x},{y}' for x, y in points)
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    depth = min(MAX_DEPTH, gen.scaled_side(165, scale))
+    return ''.join(
+        f'{_path(rng, depth)}\n' for _ in range(gen.scaled(140, scale))
+    )
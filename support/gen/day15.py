@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+# the search area the solutions use
+MAX_COOR = 4_000_000
+
+
+def _centers(gap: int, r: int, low: int, high: int) -> list[int]:
+    # centers of radius `r` intervals that cover low..high except for `gap`
+    centers = []
+    c = gap - 1 - r
+    while c + r >= low:
+        centers.append(c)
+        c -= 2 * r
+    c = gap + 1 + r
+    while c - r <= high:
+        centers.append(c)
+        c += 2 * r
+    return centers
+
+
+def _overlaps(u: int, v: int, r: int) -> bool:
+    # does the square around (u, v) overlap the search area, which is a
+    # diamond in these coordinates
+    return (
+        u + r >= 0
+        and u - r <= 2 * MAX_COOR
+        and v + r >= -MAX_COOR
+        and v - r <= MAX_COOR
+        and u + v + 2 * r >= 0
+        and u + v - 2 * r <= 2 * MAX_COOR
+        and u - v + 2 * r >= 0
+        and u - v - 2 * r <= 2 * MAX_COOR
+    )
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # with u = x + y and v = x - y a sensor covers a square.  a grid of those
+    # squares covers everything but the row and column through the distress
+    # beacon, and two more lines of squares cover those except for the
+    # beacon itself.  odd radii keep every center on a whole x, y
+    bx, by = rng.randint(0, MAX_COOR), rng.randint(0, MAX_COOR)
+    bu, bv = bx + by, bx - by
+    r = MAX_COOR // round(gen.scaled(30, scale) ** 0.5) | 1
+    us = _centers(bu, r, 0, 2 * MAX_COOR)
+    vs = _centers(bv, r, -MAX_COOR, MAX_COOR)
+    squares = [(u, v) for u in us for v in vs]
+    squares += [(bu, v) for v in vs] + [(u, bv) for u in us]
+
+    lines = []
+    for u, v in squares:
+        if not _overlaps(u, v, r):
+            continue
+        sx, sy = (u + v) // 2, (u - v) // 2
+        # a bit further is fine as long as the distress beacon is out of reach
+        dist = abs(sx - bx) + abs(sy - by)
+        reach = rng.randint(r, min(dist - 1, r * 3 // 2))
+        dx = rng.randint(-reach, reach)
+        dy = rng.choice((-1, 1)) * (reach - abs(dx))
+        lines.append(
+            f'Sensor at x={sx}, y={sy}: '
+            f'closest beacon is at x={sx + dx}, y={sy + dy}',
+        )
+    rng.shuffle(lines)
+    return ''.join(f'{line}\n' for line in lines)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import itertools
+import random
+import string
+
+from support import gen
+
+START = 'AA'
+
+
+def _names(rng: random.Random, n: int) -> list[str]:
+    # two letters like the real thing, as long as there are enough of them
+    size = 2
+    while len(string.ascii_uppercase) ** size <= n:
+        size += 1
+    letters = itertools.product(string.ascii_uppercase, repeat=size)
+    names = [''.join(p) for p in letters]
+    names.remove('A' * size)
+    return [START, *rng.sample(names, k=n - 1)]
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # like the real inputs the working valves (and AA) are joined by corridors
+    # of broken ones, which keeps them a few minutes apart
+    valves = gen.scaled(15, scale)
+    edges = [(i, rng.randrange(i)) for i in range(1, valves + 1)]
+    for _ in range(valves // 4):
+        a, b = rng.sample(range(valves + 1), k=2)
+        edges.append((a, b))
+    links: list[list[int]] = [[] for _ in range(valves + 1)]
+    for a, b in edges:
+        broken = range(len(links), len(links) + rng.randint(1, 3))
+        links.extend([] for _ in broken)
+        corridor = [a, *broken, b]
+        for c, d in zip(corridor, corridor[1:]):
+            links[c].append(d)
+            links[d].append(c)
+
+    names = _names(rng, len(links))
+    lines = []
+    for i, name in enumerate(names):
+        flow_rate = rng.randint(3, 25) if 0 < i <= valves else 0
+        if len(links[i]) == 1:
+            tunnels = f'tunnel leads to valve {names[links[i][0]]}'
+        else:
+            tunnels = f'tunnels lead to valves {", ".join(names[j] for j in links[i])}'
+        lines.append(f'Valve {name} has flow rate={flow_rate}; {tunnels}')
+    rng.shuffle(lines)
+    return ''.join(f'{line}\n' for line in lines)
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    return ''.join(rng.choices('<>', k=gen.scaled(10091, scale))) + '\n'
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # a lumpy ball, denser towards the middle, with air pockets inside
+    side = gen.scaled_side(22, scale, dims=3)
+    r = side / 2
+    cubes: set[tuple[int, int, int]] = set()
+    target = gen.scaled(2800, scale)
+    while len(cubes) < target:
+        x, y, z = (rng.randrange(side) for _ in range(3))
+        dist = ((x - r) ** 2 + (y - r) ** 2 + (z - r) ** 2) ** 0.5 / r
+        if rng.random() > dist ** 4:
+            cubes.add((x, y, z))
+    return ''.join(f'{x},{y},{z}\n' for x, y, z in cubes)
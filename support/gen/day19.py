@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    lines = []
+    for i in range(1, gen.scaled(30, scale) + 1):
+        lines.append(
+            f'Blueprint {i}: '
+            f'Each ore robot costs {rng.randint(2, 4)} ore. '
+            f'Each clay robot costs {rng.randint(3, 4)} ore. '
+            f'Each obsidian robot costs {rng.randint(2, 4)} ore '
+            f'and {rng.randint(5, 20)} clay. '
+            f'Each geode robot costs {rng.randint(2, 4)} ore '
+            f'and {rng.randint(7, 20)} obsidian.',
+        )
+    return ''.join(f'{line}\n' for line in lines)
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # repeats are fine, but there is exactly one 0
+    n = gen.scaled(5000, scale)
+    numbers = [rng.choice((-1, 1)) * rng.randint(1, 9999) for _ in range(n - 1)]
+    numbers.insert(rng.randrange(n), 0)
+    return ''.join(f'{number}\n' for number in numbers)
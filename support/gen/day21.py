@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import random
+import string
+
+from support import gen
+
+# keeps the numbers about the size of the real ones
+LIMIT = 10 ** 13
+
+
+def _combine(rng: random.Random, a: int, b: int) -> tuple[str, int]:
+    # every division is exact, so solving for humn never has to round
+    ops = ['+']
+    if a > b:
+        ops.append('-')
+    if a * b < LIMIT:
+        ops.append('*')
+    if b > 1 and a % b == 0:
+        ops.append('/')
+    op = rng.choice(ops)
+    if op == '+':
+        return op, a + b
+    elif op == '-':
+        return op, a - b
+    elif op == '*':
+        return op, a * b
+    else:
+        return op, a // b
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    names: set[str] = {'root', 'humn'}
+
+    def name() -> str:
+        while (new := ''.join(rng.choices(string.ascii_lowercase, k=4))) in names:
+            pass
+        names.add(new)
+        return new
+
+    # combine random pairs of trees until only two are left, humn is one of
+    # the leaves with the value that makes the two equal
+    humn = rng.randint(100, 5000)
+    jobs = {'humn': str(humn)}
+    trees = [('humn', humn)]
+    for _ in range(gen.scaled(1130, scale)):
+        leaf = name()
+        value = rng.randint(1, 20)
+        jobs[leaf] = str(value)
+        trees.append((leaf, value))
+    while len(trees) > 2:
+        i, j = rng.sample(range(len(trees)), k=2)
+        (a, a_value), (b, b_value) = trees[i], trees[j]
+        op, value = _combine(rng, a_value, b_value)
+        monkey = name()
+        jobs[monkey] = f'{a} {op} {b}'
+        trees[i] = (monkey, value)
+        trees[j] = trees[-1]
+        trees.pop()
+
+    # top up the other side with one more number to make them match
+    (a, a_value), (b, b_value) = trees
+    if a_value != b_value:
+        leaf, monkey = name(), name()
+        jobs[leaf] = str(abs(a_value - b_value))
+        jobs[monkey] = f'{b} {"+" if a_value > b_value else "-"} {leaf}'
+        b = monkey
+    jobs['root'] = f'{a} + {b}'
+
+    # part 1 uses whatever humn shouts, which doesn't divide evenly anymore
+    jobs['humn'] = str(rng.randint(100, 5000))
+    lines = [f'{monkey}: {job}' for monkey, job in jobs.items()]
+    rng.shuffle(lines)
+    return ''.join(f'{line}\n' for line in lines)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+# part 2 folds the map with 50 wide faces, laid out like the real inputs
+FACE = 50
+NET = (
+    ' ##',
+    ' # ',
+    '## ',
+    '#  ',
+)
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # a bigger input is a longer path, the map is the same size
+    lines = []
+    for net_row in NET:
+        for _ in range(FACE):
+            row = []
+            for c in net_row.rstrip():
+                if c == ' ':
+                    row.append(' ' * FACE)
+                else:
+                    row.append(''.join(rng.choices('.#', (9, 1), k=FACE)))
+            lines.append(''.join(row))
+
+    path = [str(rng.randint(1, FACE))]
+    for _ in range(gen.scaled(2000, scale)):
+        path.append(rng.choice('LR'))
+        path.append(str(rng.randint(1, FACE)))
+    return ''.join(f'{line}\n' for line in lines) + f'\n{"".join(path)}\n'
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    side = gen.scaled_side(75, scale)
+    return ''.join(
+        ''.join(rng.choices('.#', k=side)) + '\n' for _ in range(side)
+    )
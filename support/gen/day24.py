@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # the blizzards repeat every lcm(width, height) minutes and the search
+    # state includes that phase, a 15:2 valley keeps it at 15 * height
+    m = max(5, gen.scaled_side(10, scale))
+    width, height = 15 * m, 2 * m
+    cols = []
+    for x in range(width):
+        # nothing blows up or down through the entrance or the exit, and a
+        # column that is mostly ^ and v can be impossible to get across
+        if x in (0, width - 1):
+            vertical = 0
+        else:
+            vertical = rng.randint(0, height * 2 // 5)
+        col = rng.choices('^v', k=vertical)
+        col += rng.choices('<>.', (4, 4, 3), k=height - vertical)
+        rng.shuffle(col)
+        cols.append(col)
+
+    lines = ['#.' + '#' * width]
+    lines.extend(f'#{"".join(row)}#' for row in zip(*cols))
+    lines.append('#' * width + '.#')
+    return ''.join(f'{line}\n' for line in lines)
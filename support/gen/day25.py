@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import random
+
+from support import gen
+
+DIGITS = '012=-'
+
+
+def to_snafu(n: int) -> str:
+    digits = []
+    while n:
+        n, d = divmod(n, 5)
+        digits.append(DIGITS[d])
+        if d > 2:
+            n += 1
+    return ''.join(reversed(digits))
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    return ''.join(
+        f'{to_snafu(rng.randint(1, 5 ** rng.randint(1, 20)))}\n'
+        for _ in range(gen.scaled(125, scale))
+    )
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import importlib
+import random
+import re
+from types import ModuleType
+
+import pytest
+
+from support import gen
+from support import runner
+from support.gen import day15
+from support.gen import day25
+from support.runner import Solution
+
+
+@pytest.fixture
+def repo(root: str, monkeypatch: pytest.MonkeyPatch) -> str:
+    # the real days, without the modules other tests' trees left behind
+    monkeypatch.chdir(runner.ROOT)
+    return runner.ROOT
+
+
+def _solution(module: str, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    monkeypatch.syspath_prepend(runner.ROOT)
+    return pytest.importorskip(module)
+
+
+@pytest.mark.parametrize('day', gen.DAYS)
+def test_generate(day: int) -> None:
+    s = gen.generate(day, scale=0.1)
+    assert s.endswith('\n')
+    assert s == gen.generate(day, scale=0.1)
+
+
+def test_generate_seed() -> None:
+    assert gen.generate(1, seed=1) != gen.generate(1, seed=2)
+
+
+@pytest.mark.parametrize('day', (1, 3, 13, 20))
+def test_generate_scale(day: int) -> None:
+    small, big = gen.generate(day), gen.generate(day, scale=10)
+    assert 8 < len(big) / len(small) < 12
+
+
+@pytest.mark.parametrize(('day', 'scale'), ((0, 1), (26, 1), (1, 0)))
+def test_generate_invalid(day: int, scale: float) -> None:
+    with pytest.raises(ValueError):
+        gen.generate(day, scale)
+
+
+@pytest.mark.parametrize('seed', (0, 1))
+@pytest.mark.parametrize(
+    'solution',
+    runner.discover(runner.ROOT),
+    ids=lambda solution: solution.module,
+)
+def test_generate_solvable(repo: str, solution: Solution, seed: int) -> None:
+    # the complexity runs need every day's input to go through its solution
+    mod, _ = runner.load_solution(repo, solution)
+    mod.compute(gen.generate(solution.day, scale=0.25, seed=seed))
+
+
+@pytest.mark.parametrize(
+    ('module', 'regex', 'record'),
+    (
+        ('day11.part1', 'monkey_re', 'Monkey'),
+        ('day16.part1', 'node_re', 'Valve'),
+        ('day19.part1', 'BLUEPRINT_RE', 'Blueprint'),
+    ),
+)
+def test_generate_matches_parser(
+    module: str,
+    regex: str,
+    record: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pattern: re.Pattern[str] = getattr(_solution(module, monkeypatch), regex)
+    s = gen.generate(int(module[3:5]), scale=3)
+    assert len(list(pattern.finditer(s))) == s.count(record) > 0
+
+
+@pytest.mark.parametrize('max_coor', (20, 97))
+def test_day15_one_distress_beacon(
+    max_coor: int,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(day15, 'MAX_COOR', max_coor)
+    sensors = []
+    for line in day15.generate(random.Random(0), 2).splitlines():
+        sx, sy, bx, by = map(int, re.findall(r'-?\d+', line))
+        sensors.append((sx, sy, abs(sx - bx) + abs(sy - by)))
+    uncovered = [
+        (x, y)
+        for x in range(max_coor + 1)
+        for y in range(max_coor + 1)
+        if all(abs(x - sx) + abs(y - sy) > r for sx, sy, r in sensors)
+    ]
+    assert len(uncovered) == 1
+
+
+def test_day21_solvable(monkeypatch: pytest.MonkeyPatch) -> None:
+    # humn has to be exact for part 2, which inverts every operation
+    part2 = _solution('day21.part2', monkeypatch)
+    s = gen.generate(21)
+    humn = part2.compute(s)
+    jobs = dict(line.split(': ') for line in s.splitlines())
+    jobs['humn'] = str(humn)
+    jobs['root'] = jobs['root'].replace('+', '-')
+    part1 = importlib.import_module('day21.part1')
+    assert part1.compute(''.join(f'{k}: {v}\n' for k, v in jobs.items())) == 0
+
+
+@pytest.mark.parametrize('n', (1, 2, 3, 4, 5, 8, 2022, 314159265))
+def test_day25_to_snafu(n: int) -> None:
+    value = 0
+    for c in day25.to_snafu(n):
+        value = value * 5 + day25.DIGITS.index(c) - 5 * (c in '=-')
+    assert value == n
+
+
+@pytest.mark.parametrize('scale', (0.25, 1, 3))
+def test_day24_no_walls(scale: float) -> None:
+    # a column of mostly ^ and v can block the way across for good
+    rows = gen.generate(24, scale).splitlines()[1:-1]
+    cols = list(zip(*(row[1:-1] for row in rows)))
+    assert not {*cols[0], *cols[-1]} & {'^', 'v'}
+    assert all(col.count('^') + col.count('v') <= len(col) * 2 // 5 for col in cols)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Callable
+from typing import Generic
+from typing import Hashable
+from typing import Iterable
+from typing import TypeVar
+
+import support
+
+# states are hashable and small (tuples of ints, ints), everything that
+# decides what can still happen from a state has to be in it
+S = TypeVar('S', bound=Hashable)
+
+TABLE_SIZE = 1 << 20
+
+
+class Optimum(Generic[S]):
+    __slots__ = ('value', 'path')
+
+    def __init__(self, value: int, path: list[S]) -> None:
+        # `path` goes from the start to the state with the best value, just
+        # the start if nothing beat the value passed in as `best`
+        self.value = value
+        self.path = path
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.value!r}, {self.path!r})'
+
+
+def branch_and_bound(
+    start: S,
+    children: Callable[[S], Iterable[tuple[S, int]]],
+    bound: Callable[[S], int],
+    *,
+    best: int = 0,
+    table_size: int = TABLE_SIZE,
+) -> Optimum[S]:
+    # the most value to be had on a path from `start`, depth first.  each
+    # child comes with what getting to it adds, and a child is skipped when
+    # `bound` (never less than what's left to gain from it) can't beat the
+    # best so far.  children are tried in the order given, the likeliest
+    # first finds a good `best` sooner.  the table has the most value each
+    # state was reached with, reaching one again with no more is skipped
+    # too.  when it's full the state put in first goes
+    table: dict[S, int] = {}
+    best_value = best
+    best_path = [start]
+    path = [start]
+    nodes = pruned = transposed = evicted = 0
+
+    def visit(state: S, value: int) -> None:
+        nonlocal best_value, best_path, nodes, pruned, transposed, evicted
+        nodes += 1
+        if value > best_value:
+            best_value = value
+            best_path = path.copy()
+            support.count('improvements')
+
+        for child, gain in children(state):
+            child_value = value + gain
+            if child_value + bound(child) <= best_value:
+                pruned += 1
+                continue
+            seen = table.get(child)
+            if seen is not None and seen >= child_value:
+                transposed += 1
+                continue
+            if seen is None and len(table) >= table_size:
+                del table[next(iter(table))]
+                evicted += 1
+            table[child] = child_value
+
+            path.append(child)
+            visit(child, child_value)
+            path.pop()
+
+    visit(start, 0)
+    support.count('nodes expanded', nodes)
+    support.count('pruned (bound)', pruned)
+    support.count('pruned (table)', transposed)
+    support.count('table evictions', evicted)
+    return Optimum(best_value, best_path)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import itertools
+from typing import Counter
+
+import pytest
+
+import support
+from support import optimize
+
+# value, weight
+ITEMS = ((60, 10), (100, 20), (120, 30), (30, 5), (45, 15), (80, 25), (10, 1))
+CAPACITY = 50
+
+State = tuple[int, int]
+
+
+def _children(state: State) -> list[tuple[State, int]]:
+    # take each item after the last one taken, while it fits
+    last, room = state
+    return [
+        ((i, room - weight), value)
+        for i, (value, weight) in enumerate(ITEMS)
+        if i > last and weight <= room
+    ]
+
+
+def _bound(state: State) -> int:
+    # as if items could be cut to fit
+    last, room = state
+    rest = sorted(ITEMS[last + 1:], key=lambda item: item[0] / item[1], reverse=True)
+    potential = 0.0
+    for value, weight in rest:
+        take = min(weight, room)
+        potential += value * take / weight
+        room -= take
+    return int(potential) + 1
+
+
+def _brute_force() -> int:
+    return max(
+        sum(value for value, _ in items)
+        for n in range(len(ITEMS) + 1)
+        for items in itertools.combinations(ITEMS, n)
+        if sum(weight for _, weight in items) <= CAPACITY
+    )
+
+
+def test_branch_and_bound() -> None:
+    optimum = optimize.branch_and_bound((-1, CAPACITY), _children, _bound)
+    assert optimum.value == _brute_force() == 235
+    # the path adds up to the value
+    path_value = sum(ITEMS[i][0] for i, _ in optimum.path[1:])
+    assert optimum.path[0] == (-1, CAPACITY)
+    assert path_value == optimum.value
+
+
+def test_branch_and_bound_no_bound() -> None:
+    optimum = optimize.branch_and_bound(
+        (-1, CAPACITY), _children, lambda state: CAPACITY * 1000,
+    )
+    assert optimum.value == 235
+
+
+@pytest.mark.parametrize('table_size', (1, 2, 5))
+def test_branch_and_bound_small_table(table_size: int) -> None:
+    optimum = optimize.branch_and_bound(
+        (-1, CAPACITY), _children, _bound, table_size=table_size,
+    )
+    assert optimum.value == 235
+
+
+def test_branch_and_bound_best_unbeaten() -> None:
+    optimum = optimize.branch_and_bound(
+        (-1, CAPACITY), _children, _bound, best=1000,
+    )
+    assert optimum.value == 1000
+    assert optimum.path == [(-1, CAPACITY)]
+
+
+def test_branch_and_bound_transposition() -> None:
+    # a grid walk where many paths meet: only right or down, worth the cell
+    def children(state: State) -> list[tuple[State, int]]:
+        x, y = state
+        return [
+            ((x2, y2), (x2 * 7 + y2 * 3) % 5)
+            for x2, y2 in ((x + 1, y), (x, y + 1))
+            if x2 < 8 and y2 < 8
+        ]
+
+    def longest(x: int, y: int) -> int:
+        best = 0
+        for (x2, y2), gain in children((x, y)):
+            best = max(best, gain + longest(x2, y2))
+        return best
+
+    optimum = optimize.branch_and_bound((0, 0), children, lambda state: 100)
+    assert optimum.value == longest(0, 0)
+
+
+def test_branch_and_bound_counters() -> None:
+    def counters(table_size: int) -> Counter[str]:
+        instrumentation = support.enable_instrumentation(report=False)
+        try:
+            optimize.branch_and_bound(
+                (-1, CAPACITY), _children, _bound, table_size=table_size,
+            )
+        finally:
+            support.disable_instrumentation()
+        return instrumentation.counters
+
+    full, small = counters(optimize.TABLE_SIZE), counters(1)
+    assert full['pruned (bound)'] > 0
+    assert full['table evictions'] == 0
+    assert small['table evictions'] > 0
+    assert small['nodes expanded'] >= full['nodes expanded']
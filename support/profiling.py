@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import collections
+import contextlib
+import cProfile
+import os.path
+import pstats
+import signal
+import sys
+from types import FrameType
+from typing import Any
+from typing import Generator
+
+import support
+
+PROFILE_DIR = os.path.join(support.HERE, '../.cache/profile')
+MODES = ('cprofile', 'sample')
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f'{code.co_name} ({filename}:{code.co_firstlineno})'
+
+
+class Sampler:
+    # the stack every `interval` seconds of cpu time, from a SIGPROF timer so
+    # nothing runs in between.  stacks are outermost first
+    def __init__(self, interval: float = 0.001) -> None:
+        self.interval = interval
+        self.stacks: collections.Counter[tuple[str, ...]] = collections.Counter()
+
+    def _sample(self, signum: int, frame: FrameType | None) -> None:
+        stack = []
+        while frame is not None:
+            stack.append(_frame_name(frame))
+            frame = frame.f_back
+        stack.reverse()
+        self.stacks[tuple(stack)] += 1
+
+    @contextlib.contextmanager
+    def running(self) -> Generator[Sampler, None, None]:
+        if not hasattr(signal, 'setitimer'):
+            raise SystemExit('sampling needs signal.setitimer (not on windows)')
+        prev = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            yield self
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, prev)
+
+    def collapsed(self) -> str:
+        # `a;b;c count` lines, what flamegraph.pl and speedscope read
+        return ''.join(
+            f'{";".join(stack)} {count}\n'
+            for stack, count in sorted(self.stacks.items())
+        )
+
+    def format_table(self, top: int = 25) -> str:
+        own: collections.Counter[str] = collections.Counter()
+        total: collections.Counter[str] = collections.Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for name in set(stack):
+                total[name] += count
+        n = sum(self.stacks.values()) or 1
+
+        lines = [f'{"own":>6} {"total":>6}  function ({n} samples)']
+        for name, count in own.most_common(top):
+            lines.append(
+                f'{count / n:>6.1%} {total[name] / n:>6.1%}  {name}',
+            )
+        return '\n'.join(lines)
+
+
+def _output_name() -> str:
+    # dayNN-partN for the solution being run
+    path = os.path.abspath(sys.argv[0])
+    day = os.path.basename(os.path.dirname(path))
+    part, _ = os.path.splitext(os.path.basename(path))
+    return f'{day}-{part}'
+
+
+def _write(filename: str, contents: str) -> None:
+    support.write_atomic(filename, contents.encode())
+    print(f'> profile written to {filename}', file=sys.stderr)
+
+
+@contextlib.contextmanager
+def profile(
+    mode: str,
+    *,
+    directory: str = PROFILE_DIR,
+    name: str | None = None,
+    top: int = 25,
+) -> Generator[Any, None, None]:
+    # `cprofile` counts every call, `sample` is cheaper and keeps whole stacks
+    # (cProfile only knows direct callers) for a flamegraph
+    if mode not in MODES:
+        raise ValueError(f'unknown profile mode: {mode}')
+    base = os.path.normpath(os.path.join(directory, name or _output_name()))
+
+    if mode == 'cprofile':
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+        stats = pstats.Stats(profiler, stream=sys.stderr)
+        stats.sort_stats('cumulative').print_stats(top)
+        os.makedirs(directory, exist_ok=True)
+        stats.dump_stats(f'{base}.pstats')
+        print(f'> profile written to {base}.pstats', file=sys.stderr)
+    else:
+        sampler = Sampler()
+        with sampler.running():
+            yield sampler
+        print(sampler.format_table(top), file=sys.stderr)
+        _write(f'{base}.collapsed', sampler.collapsed())
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pathlib
+import signal
+import time
+
+import pytest
+
+from support import profiling
+
+needs_setitimer = pytest.mark.skipif(
+    not hasattr(signal, 'setitimer'), reason='no signal.setitimer',
+)
+
+
+def _busy(seconds: float) -> None:
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+
+
+def _sampler() -> profiling.Sampler:
+    sampler = profiling.Sampler()
+    sampler.stacks[('main', 'compute', 'parse')] += 1
+    sampler.stacks[('main', 'compute', 'search')] += 3
+    return sampler
+
+
+def test_sampler_collapsed() -> None:
+    assert _sampler().collapsed() == (
+        'main;compute;parse 1\n'
+        'main;compute;search 3\n'
+    )
+
+
+def test_sampler_format_table() -> None:
+    assert _sampler().format_table().splitlines() == [
+        '   own  total  function (4 samples)',
+        ' 75.0%  75.0%  search',
+        ' 25.0%  25.0%  parse',
+    ]
+
+
+@needs_setitimer
+def test_sampler_running() -> None:
+    sampler = profiling.Sampler()
+    with sampler.running():
+        _busy(0.1)
+    assert signal.getsignal(signal.SIGPROF) == signal.SIG_DFL
+    assert any(stack[-1].startswith('_busy ') for stack in sampler.stacks)
+
+
+def test_profile_cprofile(tmp_path: pathlib.Path) -> None:
+    with profiling.profile('cprofile', directory=str(tmp_path), name='p'):
+        _busy(0.01)
+    assert tmp_path.joinpath('p.pstats').exists()
+
+
+@needs_setitimer
+def test_profile_sample(tmp_path: pathlib.Path) -> None:
+    with profiling.profile('sample', directory=str(tmp_path), name='p'):
+        _busy(0.1)
+    assert '_busy (profiling_test.py:' in tmp_path.joinpath('p.collapsed').read_text()
+
+
+def test_profile_unknown_mode() -> None:
+    with pytest.raises(ValueError):
+        with profiling.profile('perf'):
+            pass
@@ -0,0 +1,439 @@
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import contextlib
+import glob
+import hashlib
+import importlib
+import io
+import json
+import os.path
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures.process import BrokenProcessPool
+from types import ModuleType
+from typing import Generator
+from typing import NamedTuple
+
+import support
+
+ROOT = os.path.dirname(support.HERE)
+RESULTS_DIR = os.path.join(ROOT, '.cache/results')
+SOLUTION_RE = re.compile(r'^day(\d\d)/(part\d\w*)\.py$')
+IMPORTTIME_RE = re.compile(r'^import time:\s*\d+ \|\s*(\d+) \|( *)(\S+)$')
+
+
+class Solution(NamedTuple):
+    day: int
+    part: str
+
+    @property
+    def dirname(self) -> str:
+        return f'day{self.day:02}'
+
+    @property
+    def module(self) -> str:
+        return f'{self.dirname}.{self.part}'
+
+
+class Result(NamedTuple):
+    solution: Solution
+    answer: str
+    elapsed: float
+    error: str | None = None
+    # answered alongside part 1 by `compute_both`, its time is in part 1's
+    shared: bool = False
+    # from an earlier run of the same code on the same input
+    cached: bool = False
+
+
+class ImportTime(NamedTuple):
+    solution: Solution
+    elapsed: float
+    # what the solution imports directly, slowest first
+    modules: list[tuple[str, float]]
+
+
+def discover(root: str, days: set[int] | None = None) -> list[Solution]:
+    solutions = []
+    for path in glob.glob(os.path.join(root, 'day??', 'part*.py')):
+        relpath = os.path.relpath(path, root).replace(os.sep, '/')
+        match = SOLUTION_RE.match(relpath)
+        if match is None:
+            continue
+        day = int(match[1])
+        # day00 is the template for new days, not a solution
+        if day == 0 or (days is not None and day not in days):
+            continue
+        solutions.append(Solution(day, match[2]))
+    solutions.sort()
+    return solutions
+
+
+@contextlib.contextmanager
+def captured_output() -> Generator[io.StringIO, None, None]:
+    # some answers are printed rather than returned, other output is debugging
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+        yield out
+
+
+def load_solution(
+    root: str,
+    solution: Solution,
+    path: str | None = None,
+) -> tuple[ModuleType, str]:
+    # the solution and its input, or the input at `path` instead
+    if path is not None:
+        path = os.path.abspath(path)
+    # some days read their example inputs relative to the working directory
+    os.chdir(os.path.join(root, solution.dirname))
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    mod = importlib.import_module(solution.module)
+    with open(mod.INPUT_TXT if path is None else path) as f:
+        return mod, f.read()
+
+
+def format_error(e: Exception) -> str:
+    return f'{type(e).__name__}: {e}'
+
+
+def run_solution(root: str, solution: Solution) -> Result:
+    try:
+        with captured_output() as out:
+            mod, s = load_solution(root, solution)
+            before = time.perf_counter()
+            ret = mod.compute(s)
+            after = time.perf_counter()
+    except Exception as e:
+        return Result(solution, '', 0.0, format_error(e))
+
+    # solutions which draw their answer print it instead of returning it
+    answer = out.getvalue().rstrip('\n') if ret is None else str(ret)
+    return Result(solution, answer, after - before)
+
+
+def run_both(root: str, part1: Solution, part2: Solution) -> list[Result]:
+    # a day's part 2 may have a `compute_both` which parses the input once
+    # and answers both parts, otherwise the parts are run one at a time
+    try:
+        with captured_output():
+            mod, s = load_solution(root, part2)
+            compute_both = getattr(mod, 'compute_both', None)
+            if compute_both is None:
+                return [run_solution(root, part1), run_solution(root, part2)]
+            before = time.perf_counter()
+            answer1, answer2 = compute_both(s)
+            after = time.perf_counter()
+    except Exception as e:
+        error = format_error(e)
+        return [Result(part1, '', 0.0, error), Result(part2, '', 0.0, error)]
+
+    return [
+        Result(part1, str(answer1), after - before),
+        Result(part2, str(answer2), 0.0, shared=True),
+    ]
+
+
+def run_group(root: str, group: tuple[Solution, ...]) -> list[Result]:
+    if len(group) == 2:
+        return run_both(root, *group)
+    else:
+        return [run_solution(root, solution) for solution in group]
+
+
+def run_isolated(root: str, group: tuple[Solution, ...]) -> list[Result]:
+    # `run_group` in a process of its own, its dying is an error of the group
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+        try:
+            return executor.submit(run_group, root, group).result()
+        except BrokenProcessPool as e:
+            error = format_error(e)
+            return [Result(solution, '', 0.0, error) for solution in group]
+
+
+def group_solutions(
+    solutions: list[Solution],
+    *,
+    shared: bool = True,
+) -> list[tuple[Solution, ...]]:
+    # a day's part 1 and part 2 go together so they can share the work,
+    # `solutions` is sorted so part 1 comes first
+    groups: list[tuple[Solution, ...]] = []
+    paired = set()
+    for solution in solutions:
+        part2 = solution._replace(part='part2')
+        if shared and solution.part == 'part1' and part2 in solutions:
+            groups.append((solution, part2))
+            paired.add(part2)
+        elif solution not in paired:
+            groups.append((solution,))
+    return groups
+
+
+class ResultCache:
+    # <key>.json holds the results of a group of solutions, the key covers
+    # everything they run (their source, `support`'s, the input) and how
+    def __init__(self, directory: str = RESULTS_DIR) -> None:
+        self.directory = directory
+
+    def key(
+        self,
+        root: str,
+        group: tuple[Solution, ...],
+        *,
+        shared: bool = True,
+    ) -> str | None:
+        h = hashlib.sha256()
+        # shared and separate runs time part 2 differently
+        h.update(b'shared' if shared else b'separate')
+        paths = [
+            os.path.join(root, solution.dirname, f'{solution.part}.py')
+            for solution in group
+        ]
+        paths.append(os.path.join(root, group[0].dirname, 'input.txt'))
+        paths.extend(sorted(glob.glob(os.path.join(support.HERE, '*.py'))))
+        try:
+            for path in paths:
+                with open(path, 'rb') as f:
+                    h.update(hashlib.sha256(f.read()).digest())
+        except OSError:  # no input, the solution will report it
+            return None
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key: str) -> list[Result] | None:
+        try:
+            with open(self._path(key)) as f:
+                entries = json.load(f)
+            return [
+                Result(
+                    Solution(entry['day'], entry['part']),
+                    entry['answer'],
+                    entry['elapsed'],
+                    shared=entry['shared'],
+                    cached=True,
+                )
+                for entry in entries
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, key: str, results: list[Result]) -> None:
+        # errors are worth another look next time
+        if any(result.error is not None for result in results):
+            return
+        entries = [
+            {
+                'day': result.solution.day,
+                'part': result.solution.part,
+                'answer': result.answer,
+                'elapsed': result.elapsed,
+                'shared': result.shared,
+            }
+            for result in results
+        ]
+        support.write_atomic(self._path(key), json.dumps(entries).encode())
+
+
+def run_all(
+    root: str,
+    solutions: list[Solution],
+    *,
+    jobs: int | None = None,
+    shared: bool = True,
+    cache: ResultCache | None = None,
+) -> list[Result]:
+    results = []
+    todo: list[tuple[tuple[Solution, ...], str | None]] = []
+    for group in group_solutions(solutions, shared=shared):
+        if cache is not None:
+            key = cache.key(root, group, shared=shared)
+        else:
+            key = None
+        cached = cache.get(key) if cache is not None and key else None
+        if cached is None:
+            todo.append((group, key))
+        else:
+            results.extend(cached)
+
+    def finish(key: str | None, group_results: list[Result]) -> None:
+        if cache is not None and key is not None:
+            cache.put(key, group_results)
+        results.extend(group_results)
+
+    # a worker killed from outside (the OOM killer) breaks the whole pool,
+    # every group it hadn't finished fails with it
+    broken = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        # the later days are the slow ones, get them started first
+        futures = {
+            executor.submit(run_group, root, group): (group, key)
+            for group, key in reversed(todo)
+        }
+        for future in concurrent.futures.as_completed(futures):
+            group, key = futures[future]
+            try:
+                finish(key, future.result())
+            except BrokenProcessPool:
+                broken.append((group, key))
+
+    # which of them was killed isn't known, they run again in a process each
+    # so it takes none of the others with it this time
+    if broken:
+        workers = jobs or os.cpu_count() or 1
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as threads:
+            retries = {
+                threads.submit(run_isolated, root, group): key
+                for group, key in broken
+            }
+            for retry in concurrent.futures.as_completed(retries):
+                finish(retries[retry], retry.result())
+    results.sort()
+    return results
+
+
+def parse_importtime(output: str, module: str) -> tuple[float, list[tuple[str, float]]]:
+    # `-X importtime` prints each import after everything it imported, with
+    # nested imports indented by 2 spaces per level
+    children: list[tuple[str, float]] = []
+    for line in output.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match is None:
+            continue
+        cumulative, depth = int(match[1]) / 1e6, len(match[2]) // 2
+        if depth == 1:
+            children.append((match[3], cumulative))
+        elif depth == 0 and match[3] == module:
+            children.sort(key=lambda child: child[1], reverse=True)
+            return cumulative, children
+        elif depth == 0:
+            children = []
+    raise ValueError(f'{module} not found in import times')
+
+
+def measure_import(root: str, solution: Solution) -> ImportTime:
+    # a fresh interpreter each time, nothing is imported already.  run from
+    # the day's directory like `run_solution`, some days read files on import
+    env = {**os.environ, 'PYTHONPATH': os.path.abspath(root)}
+    proc = subprocess.run(
+        (sys.executable, '-X', 'importtime', '-c', f'import {solution.module}'),
+        cwd=os.path.join(root, solution.dirname),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, modules = parse_importtime(proc.stderr, solution.module)
+    return ImportTime(solution, elapsed, modules)
+
+
+def measure_imports(root: str, solutions: list[Solution]) -> list[ImportTime]:
+    # one at a time, imports running alongside each other skew the timings
+    return [measure_import(root, solution) for solution in solutions]
+
+
+def format_results(results: list[Result]) -> str:
+    lines = [f'{"day":<5} {"part":<18} {"answer":<20} {"time":>10}']
+    for result in results:
+        if result.error is not None:
+            answer, elapsed = f'ERROR {result.error}', ''
+        elif result.shared:
+            answer, elapsed = result.answer, 'shared'
+        else:
+            answer = result.answer
+            elapsed = support.format_elapsed(result.elapsed)
+        if result.cached:
+            elapsed = f'({elapsed})'
+        first, *rest = answer.splitlines() or ['']
+        lines.append(
+            f'{result.solution.dirname:<5} {result.solution.part:<18} '
+            f'{first:<20} {elapsed:>10}'.rstrip(),
+        )
+        lines.extend(f'{"":<24} {line}' for line in rest)
+    return '\n'.join(lines)
+
+
+def format_import_times(import_times: list[ImportTime], top: int = 3) -> str:
+    lines = [f'{"day":<5} {"part":<18} {"import":>10}   slowest imports']
+    for import_time in import_times:
+        slowest = ', '.join(
+            f'{name} {support.format_elapsed(elapsed)}'
+            for name, elapsed in import_time.modules[:top]
+        )
+        lines.append(
+            f'{import_time.solution.dirname:<5} '
+            f'{import_time.solution.part:<18} '
+            f'{support.format_elapsed(import_time.elapsed):>10}   {slowest}',
+        )
+    return '\n'.join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('days', nargs='*', type=int, help='default: all days')
+    parser.add_argument('--root', default=ROOT)
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=None,
+        help='worker processes (default: number of CPUs)',
+    )
+    parser.add_argument(
+        '--separate', action='store_true',
+        help="run each part on its own, not both through a day's compute_both",
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='run every solution, even unchanged ones (and keep no results)',
+    )
+    parser.add_argument(
+        '--import-time', action='store_true',
+        help='also report how long each solution takes to import',
+    )
+    args = parser.parse_args()
+
+    root = os.path.abspath(args.root)
+    solutions = discover(root, set(args.days) if args.days else None)
+    if not solutions:
+        raise SystemExit('no solutions found')
+
+    before = time.perf_counter()
+    cache = None if args.no_cache else ResultCache()
+    results = run_all(
+        root, solutions, jobs=args.jobs, shared=not args.separate, cache=cache,
+    )
+    after = time.perf_counter()
+
+    print(format_results(results))
+    total = sum(result.elapsed for result in results if not result.cached)
+    print(
+        f'> {len(results)} solutions, '
+        f'{support.format_elapsed(total)} compute, '
+        f'{support.format_elapsed(after - before)} wall',
+    )
+    if cache is not None:
+        cached = [result for result in results if result.cached]
+        saved = sum(result.elapsed for result in cached)
+        print(
+            f'> {len(cached)} cached ({support.format_elapsed(saved)} saved), '
+            f'{len(results) - len(cached)} run',
+        )
+
+    if args.import_time:
+        import_times = measure_imports(root, solutions)
+        print()
+        print(format_import_times(import_times))
+        total = sum(import_time.elapsed for import_time in import_times)
+        print(f'> {support.format_elapsed(total)} import')
+
+    return int(any(result.error is not None for result in results))
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import pathlib
+
+import pytest
+
+from support import runner
+from support.conftest import write_solution
+from support.runner import Result
+from support.runner import Solution
+
+
+@pytest.fixture
+def root(root: str) -> str:
+    for day, part, body in (
+        (0, 'part1', 'def compute(s):\n    return 0\n'),
+        (1, 'part1', 'def compute(s):\n    return len(s.split())\n'),
+        (1, 'part2', 'def compute(s):\n    print(s.upper().strip())\n'),
+        (3, 'part2_array', 'def compute(s):\n    raise ValueError("nope")\n'),
+        (4, 'part1', 'def compute(s):\n    return 1\n'),
+        (
+            4, 'part2',
+            'def compute(s):\n    return 2\n'
+            'def compute_both(s):\n    return len(s), len(s.split())\n',
+        ),
+    ):
+        write_solution(root, day, part, body)
+    pathlib.Path(root, 'day01', 'notes.py').touch()
+    return root
+
+
+def test_discover(root: str) -> None:
+    assert runner.discover(root) == [
+        Solution(1, 'part1'),
+        Solution(1, 'part2'),
+        Solution(3, 'part2_array'),
+        Solution(4, 'part1'),
+        Solution(4, 'part2'),
+    ]
+
+
+def test_discover_days(root: str) -> None:
+    assert runner.discover(root, {3}) == [Solution(3, 'part2_array')]
+
+
+def test_solution_module() -> None:
+    assert Solution(3, 'part2_array').module == 'day03.part2_array'
+
+
+def test_load_solution_path(root: str) -> None:
+    pathlib.Path(root, 'other.txt').write_text('x\n')
+    mod, s = runner.load_solution(root, Solution(1, 'part1'), 'other.txt')
+    assert mod.__name__ == 'day01.part1'
+    assert s == 'x\n'
+
+
+def test_run_solution(root: str) -> None:
+    result = runner.run_solution(root, Solution(1, 'part1'))
+    assert result.answer == '3'
+    assert result.error is None
+
+
+def test_run_solution_printed_answer(root: str) -> None:
+    result = runner.run_solution(root, Solution(1, 'part2'))
+    assert result.answer == 'A B\nC'
+
+
+def test_run_solution_error(root: str) -> None:
+    result = runner.run_solution(root, Solution(3, 'part2_array'))
+    assert result.error == 'ValueError: nope'
+
+
+def test_group_solutions(root: str) -> None:
+    solutions = runner.discover(root)
+    assert runner.group_solutions(solutions) == [
+        (Solution(1, 'part1'), Solution(1, 'part2')),
+        (Solution(3, 'part2_array'),),
+        (Solution(4, 'part1'), Solution(4, 'part2')),
+    ]
+    assert runner.group_solutions(solutions, shared=False) == [
+        (solution,) for solution in solutions
+    ]
+
+
+def test_run_both(root: str) -> None:
+    part1, part2 = runner.run_both(root, Solution(4, 'part1'), Solution(4, 'part2'))
+    assert (part1.answer, part1.shared) == ('6', False)
+    assert (part2.answer, part2.shared) == ('3', True)
+
+
+def test_run_both_without_compute_both(root: str) -> None:
+    part1, part2 = runner.run_both(root, Solution(1, 'part1'), Solution(1, 'part2'))
+    assert (part1.answer, part2.answer) == ('3', 'A B\nC')
+    assert not part2.shared
+
+
+def test_result_cache(root: str, tmp_path: pathlib.Path) -> None:
+    cache = runner.ResultCache(str(tmp_path.joinpath('results')))
+    group = (Solution(4, 'part1'), Solution(4, 'part2'))
+    key = cache.key(root, group)
+    assert key is not None
+    assert cache.get(key) is None
+
+    results = runner.run_both(root, *group)
+    cache.put(key, results)
+    assert cache.get(key) == [result._replace(cached=True) for result in results]
+
+
+def test_result_cache_key(root: str, tmp_path: pathlib.Path) -> None:
+    cache = runner.ResultCache(str(tmp_path.joinpath('results')))
+    group = (Solution(1, 'part1'),)
+    key = cache.key(root, group)
+    assert key == cache.key(root, group)
+    assert key != cache.key(root, (Solution(1, 'part2'),))
+    assert key != cache.key(root, group, shared=False)
+
+    tmp_path.joinpath('day01', 'input.txt').write_text('a b c\n')
+    assert cache.key(root, group) != key
+    tmp_path.joinpath('day01', 'input.txt').unlink()
+    assert cache.key(root, group) is None
+
+
+def test_result_cache_skips_errors(root: str, tmp_path: pathlib.Path) -> None:
+    cache = runner.ResultCache(str(tmp_path.joinpath('results')))
+    group = (Solution(3, 'part2_array'),)
+    key = cache.key(root, group)
+    assert key is not None
+    cache.put(key, runner.run_group(root, group))
+    assert cache.get(key) is None
+
+
+def test_run_all(root: str) -> None:
+    results = runner.run_all(root, runner.discover(root), jobs=2)
+    assert [(r.solution, r.answer) for r in results] == [
+        (Solution(1, 'part1'), '3'),
+        (Solution(1, 'part2'), 'A B\nC'),
+        (Solution(3, 'part2_array'), ''),
+        (Solution(4, 'part1'), '6'),
+        (Solution(4, 'part2'), '3'),
+    ]
+
+
+def test_run_all_killed_worker(root: str) -> None:
+    # a worker dying breaks the pool, the other days still get their answers
+    write_solution(
+        root, 2, 'part1',
+        'import signal\n'
+        'def compute(s):\n    os.kill(os.getpid(), signal.SIGKILL)\n',
+    )
+    results = runner.run_all(root, runner.discover(root, {1, 2}), jobs=2)
+    assert [(r.solution, r.answer) for r in results] == [
+        (Solution(1, 'part1'), '3'),
+        (Solution(1, 'part2'), 'A B\nC'),
+        (Solution(2, 'part1'), ''),
+    ]
+    assert results[0].error is None
+    assert results[2].error is not None
+    assert results[2].error.startswith('BrokenProcessPool: ')
+
+
+def test_format_results() -> None:
+    results = [
+        Result(Solution(1, 'part1'), '3', 0.0012),
+        Result(Solution(1, 'part2'), 'A B\nC', 0.5),
+        Result(Solution(3, 'part2_array'), '', 0.0, 'ValueError: nope'),
+        Result(Solution(4, 'part1'), '6', 0.25),
+        Result(Solution(4, 'part2'), '3', 0.0, shared=True),
+        Result(Solution(5, 'part1'), '7', 0.002, cached=True),
+    ]
+    assert runner.format_results(results).splitlines() == [
+        'day   part               answer                     time',
+        'day01 part1              3                       1200 μs',
+        'day01 part2              A B                      500 ms',
+        '                         C',
+        'day03 part2_array        ERROR ValueError: nope',
+        'day04 part1              6                        250 ms',
+        'day04 part2              3                        shared',
+        'day05 part1              7                     (2000 μs)',
+    ]
+
+
+IMPORTTIME_OUTPUT = '''\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | _io
+import time:        80 |         80 |   encodings.aliases
+import time:       300 |        380 | encodings
+import time:       900 |        900 | day01
+import time:       400 |        400 |     _heapq
+import time:      1100 |       1500 |   heapq
+import time:      2000 |       2000 |   support
+import time:       500 |       4000 | day01.part1
+'''
+
+
+def test_parse_importtime() -> None:
+    elapsed, modules = runner.parse_importtime(IMPORTTIME_OUTPUT, 'day01.part1')
+    assert elapsed == 0.004
+    assert modules == [('support', 0.002), ('heapq', 0.0015)]
+
+
+def test_parse_importtime_missing() -> None:
+    with pytest.raises(ValueError):
+        runner.parse_importtime(IMPORTTIME_OUTPUT, 'day02.part1')
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import array
+import heapq
+from collections import deque
+from typing import Callable
+from typing import Iterable
+
+import support
+
+# states are non-negative ints, usually a flat index (see `support.Grid`) or
+# some other packing of the search state into a single number
+Neighbors = Callable[[int], Iterable[int]]
+WeightedNeighbors = Callable[[int], Iterable[tuple[int, int]]]
+Goal = Callable[[int], bool]
+
+
+class SearchResult:
+    # `dist` and `parent` are arrays (-1 when unreached) for dense searches
+    # and dicts otherwise.  the starts have a parent of -1
+    __slots__ = ('goal', 'dist', 'parent')
+
+    def __init__(
+        self,
+        goal: int | None,
+        dist: dict[int, int] | array.array[int],
+        parent: dict[int, int] | array.array[int],
+    ) -> None:
+        self.goal = goal
+        self.dist = dist
+        self.parent = parent
+
+    def distance(self, state: int | None = None) -> int | None:
+        if state is None:
+            state = self.goal
+        if state is None:
+            return None
+        elif isinstance(self.dist, dict):
+            return self.dist.get(state)
+        else:
+            d = self.dist[state]
+            return d if d >= 0 else None
+
+    def path(self, state: int | None = None) -> list[int]:
+        if state is None:
+            state = self.goal
+        if state is None or self.distance(state) is None:
+            raise ValueError(f'state not reached: {state}')
+        path = [state]
+        while (state := self.parent[state]) >= 0:
+            path.append(state)
+        path.reverse()
+        return path
+
+
+def _bfs_dense(
+    starts: Iterable[int],
+    neighbors: Neighbors,
+    goal: Goal | None,
+    size: int,
+) -> SearchResult:
+    seen = bytearray(size)
+    dist = array.array('q', (-1,)) * size
+    parent = array.array('q', (-1,)) * size
+    queue: deque[int] = deque()
+    for start in starts:
+        if not seen[start]:
+            seen[start] = 1
+            dist[start] = 0
+            queue.append(start)
+            if goal is not None and goal(start):
+                return SearchResult(start, dist, parent)
+
+    expanded = pushes = 0
+    found = None
+    while queue:
+        state = queue.popleft()
+        expanded += 1
+        d = dist[state] + 1
+        for n in neighbors(state):
+            if not seen[n]:
+                seen[n] = 1
+                dist[n] = d
+                parent[n] = state
+                queue.append(n)
+                pushes += 1
+                if goal is not None and goal(n):
+                    found = n
+                    break
+        else:
+            continue
+        break
+
+    support.count('nodes expanded', expanded)
+    support.count('queue pushes', pushes)
+    return SearchResult(found, dist, parent)
+
+
+def _bfs_sparse(
+    starts: Iterable[int],
+    neighbors: Neighbors,
+    goal: Goal | None,
+) -> SearchResult:
+    dist: dict[int, int] = {}
+    parent: dict[int, int] = {}
+    queue: deque[int] = deque()
+    for start in starts:
+        if start not in dist:
+            dist[start] = 0
+            parent[start] = -1
+            queue.append(start)
+            if goal is not None and goal(start):
+                return SearchResult(start, dist, parent)
+
+    expanded = pushes = 0
+    found = None
+    while queue:
+        state = queue.popleft()
+        expanded += 1
+        d = dist[state] + 1
+        for n in neighbors(state):
+            if n not in dist:
+                dist[n] = d
+                parent[n] = state
+                queue.append(n)
+                pushes += 1
+                if goal is not None and goal(n):
+                    found = n
+                    break
+        else:
+            continue
+        break
+
+    support.count('nodes expanded', expanded)
+    support.count('queue pushes', pushes)
+    return SearchResult(found, dist, parent)
+
+
+def bfs(
+    starts: Iterable[int],
+    neighbors: Neighbors,
+    *,
+    goal: Goal | None = None,
+    size: int | None = None,
+) -> SearchResult:
+    # several starts make this a multi-source search.  stops as soon as a
+    # goal is reached, otherwise every reachable state is visited.  passing
+    # `size` (all states are below it) keeps the bookkeeping in flat arrays
+    if size is None:
+        return _bfs_sparse(starts, neighbors, goal)
+    else:
+        return _bfs_dense(starts, neighbors, goal, size)
+
+
+def astar(
+    starts: Iterable[int],
+    neighbors: WeightedNeighbors,
+    heuristic: Callable[[int], int] | None = None,
+    *,
+    goal: Goal | None = None,
+) -> SearchResult:
+    # `heuristic` must never overestimate the remaining cost
+    dist: dict[int, int] = {}
+    parent: dict[int, int] = {}
+    heap: list[tuple[int, int, int]] = []
+    for start in starts:
+        dist[start] = 0
+        parent[start] = -1
+        h = heuristic(start) if heuristic is not None else 0
+        heap.append((h, 0, start))
+    heapq.heapify(heap)
+
+    expanded = pushes = stale = 0
+    found = None
+    while heap:
+        _, d, state = heapq.heappop(heap)
+        if d > dist[state]:
+            stale += 1
+            continue
+        expanded += 1
+        if goal is not None and goal(state):
+            found = state
+            break
+        for n, cost in neighbors(state):
+            nd = d + cost
+            if n not in dist or nd < dist[n]:
+                dist[n] = nd
+                parent[n] = state
+                h = heuristic(n) if heuristic is not None else 0
+                heapq.heappush(heap, (nd + h, nd, n))
+                pushes += 1
+
+    support.count('nodes expanded', expanded)
+    support.count('queue pushes', pushes)
+    support.count('stale pops', stale)
+    return SearchResult(found, dist, parent)
+
+
+def dijkstra(
+    starts: Iterable[int],
+    neighbors: WeightedNeighbors,
+    *,
+    goal: Goal | None = None,
+) -> SearchResult:
+    return astar(starts, neighbors, goal=goal)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import pytest
+
+import support
+from support import search
+
+# S at (0, 0), E at (4, 0), walls in between
+MAZE = support.Grid.from_str(
+    'S.#.E\n'
+    '.##..\n'
+    '.....\n',
+)
+START = MAZE.index(0, 0)
+END = MAZE.index(4, 0)
+
+
+def _neighbors(i: int) -> list[int]:
+    return [j for j in MAZE.adjacent_4(i) if MAZE.data[j] != ord('#')]
+
+
+def _weighted(i: int) -> Iterable[tuple[int, int]]:
+    # moving right is free, everything else costs 2
+    for j in _neighbors(i):
+        yield j, 0 if j == i + 1 else 2
+
+
+@pytest.mark.parametrize('size', (None, len(MAZE.data)))
+def test_bfs(size: int | None) -> None:
+    result = search.bfs([START], _neighbors, goal=END.__eq__, size=size)
+    assert result.goal == END
+    assert result.distance() == 8
+    path = result.path()
+    assert (path[0], path[-1], len(path)) == (START, END, 9)
+    assert all(b in _neighbors(a) for a, b in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize('size', (None, len(MAZE.data)))
+def test_bfs_exhaustive(size: int | None) -> None:
+    result = search.bfs([START], _neighbors, size=size)
+    assert result.goal is None
+    assert result.distance(END) == 8
+    assert result.distance(MAZE.index(2, 0)) is None
+    with pytest.raises(ValueError):
+        result.path(MAZE.index(2, 0))
+
+
+@pytest.mark.parametrize('size', (None, len(MAZE.data)))
+def test_bfs_multi_source(size: int | None) -> None:
+    starts = [START, MAZE.index(3, 0)]
+    result = search.bfs(starts, _neighbors, goal=END.__eq__, size=size)
+    assert result.distance() == 1
+    assert result.path() == [MAZE.index(3, 0), END]
+
+
+def test_bfs_start_is_goal() -> None:
+    result = search.bfs([START], _neighbors, goal=START.__eq__)
+    assert result.path() == [START]
+
+
+def test_dijkstra() -> None:
+    result = search.dijkstra([START], _weighted, goal=END.__eq__)
+    # down twice, then right along the bottom and back up
+    assert result.distance() == 8
+
+
+def test_astar_matches_dijkstra() -> None:
+    def heuristic(i: int) -> int:
+        x, y = MAZE.coords(i)
+        return 2 * y
+
+    expected = search.dijkstra([START], _weighted, goal=END.__eq__)
+    result = search.astar([START], _weighted, heuristic, goal=END.__eq__)
+    assert result.distance() == expected.distance()
+    assert result.path()[0] == START
+
+
+def test_search_counters() -> None:
+    instrumentation = support.enable_instrumentation(report=False)
+    try:
+        search.bfs([START], _neighbors, size=len(MAZE.data))
+    finally:
+        support.disable_instrumentation()
+    # every open cell is reached and expanded once
+    assert instrumentation.counters['nodes expanded'] == 12
+    assert instrumentation.counters['queue pushes'] == 11
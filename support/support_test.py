@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+import pathlib
+import random
+import sys
+from typing import Generator
+
+import pytest
+
 import support
 
 
@@ -53,3 +60,316 @@ def test_direction4() -> None:
     assert support.Direction4.UP.ccw is support.Direction4.LEFT
     assert support.Direction4.UP.opposite is support.Direction4.DOWN
     assert support.Direction4.UP.apply(0, 0) == (0, -1)
+
+
+def test_parametrize_without_pytest(monkeypatch: pytest.MonkeyPatch) -> None:
+    def f() -> None:
+        pass
+
+    monkeypatch.delitem(sys.modules, 'pytest')
+    assert support.parametrize('x', (1, 2))(f) is f
+
+
+def test_progress_not_a_tty() -> None:
+    items = [1, 2, 3]
+    assert support.progress(items, total=3) is items
+
+
+def test_iter_lines() -> None:
+    lines = support.iter_lines(['a\n', '\n', 'b c\r\n', 'd'])
+    assert next(lines) == 'a'
+    assert list(lines) == ['', 'b c', 'd']
+
+
+@pytest.mark.parametrize(
+    ('b', 'expected'),
+    (
+        (b'', []),
+        (b'a\nbc\n', [b'a', b'bc']),
+        (b'a\n\nbc', [b'a', b'', b'bc']),
+        (b'a\r\n\r\n', [b'a', b'']),
+    ),
+)
+def test_line_spans(b: bytes, expected: list[bytes]) -> None:
+    assert [b[start:end] for start, end in support.line_spans(b)] == expected
+    assert b.splitlines() == expected
+
+
+def test_read_input(tmp_path: pathlib.Path) -> None:
+    path = tmp_path.joinpath('input.txt')
+    path.write_bytes(b'12\n34\n')
+    with support.read_input(str(path)) as b:
+        assert b[:] == b'12\n34\n'
+        assert b.find(b'\n') == 2
+        assert b[3] == ord('3')
+        with memoryview(b) as view:
+            assert bytes(view[3:5]) == b'34'
+
+
+def test_read_input_empty(tmp_path: pathlib.Path) -> None:
+    path = tmp_path.joinpath('input.txt')
+    path.touch()
+    with support.read_input(str(path)) as b:
+        assert list(support.line_spans(b)) == []
+
+
+@pytest.mark.parametrize(
+    ('s', 'expected'),
+    (
+        ('', []),
+        ('2-4,6-8\n', [2, 4, 6, 8]),
+        ('x=-3, y=12: -7', [-3, 12, -7]),
+        ('10R5L-5', [10, 5, -5]),
+        (b'1,-2,3\n4,5,6\n', [1, -2, 3, 4, 5, 6]),
+    ),
+)
+def test_ints(s: str | bytes, expected: list[int]) -> None:
+    assert support.ints(s) == expected
+
+
+def test_int_array() -> None:
+    a = support.int_array(b'1,2,3\n-4,5,6\n', 3)
+    assert a.typecode == 'q'
+    assert a[3:6].tolist() == [-4, 5, 6]
+
+
+def test_int_array_ragged() -> None:
+    with pytest.raises(ValueError):
+        support.int_array('1,2,3\n4,5\n', 3)
+
+
+def test_grid_from_bytes() -> None:
+    b = bytearray(b'123\n456\n')
+    grid = support.Grid.from_bytes(b)
+    assert (grid.width, grid.height, grid.stride) == (3, 2, 4)
+    assert grid.data is b
+    assert grid[2, 1] == ord('6')
+    assert str(grid) == '123\n456'
+
+
+def test_grid_from_bytes_no_trailing_newline() -> None:
+    grid = support.Grid.from_bytes(b'12\n34')
+    assert (grid.width, grid.height) == (2, 2)
+    assert grid[1, 1] == ord('4')
+
+
+def test_grid_from_bytes_ragged() -> None:
+    with pytest.raises(ValueError):
+        support.Grid.from_bytes(b'123\n45\n678\n')
+
+
+def test_grid_from_str_fill() -> None:
+    grid = support.Grid.from_str('ab\nc\n', fill=' ')
+    assert list(grid.rows()) == [b'ab', b'c ']
+    with pytest.raises(ValueError):
+        support.Grid.from_str('ab\nc\n')
+
+
+def test_grid_accessors() -> None:
+    grid = support.Grid(3, 2, fill=ord('.'))
+    grid[1, 1] = ord('#')
+    assert grid.data[grid.index(1, 1)] == ord('#')
+    assert grid.coords(grid.index(1, 1)) == (1, 1)
+    assert grid.get((3, 0)) is None
+    with pytest.raises(IndexError):
+        grid[-1, 0]
+    with pytest.raises(IndexError):
+        grid[0, 2] = 0
+
+
+@pytest.mark.parametrize('stride', (3, 4))
+def test_grid_adjacent(stride: int) -> None:
+    grid = support.Grid(3, 3, stride=stride)
+    for i in grid.indices():
+        x, y = grid.coords(i)
+        assert [grid.coords(j) for j in grid.adjacent_4(i)] == [
+            p for p in support.adjacent_4(x, y) if grid.in_bounds(*p)
+        ]
+        assert [grid.coords(j) for j in grid.adjacent_8(i)] == [
+            p for p in support.adjacent_8(x, y) if grid.in_bounds(*p)
+        ]
+    center = grid.index(1, 1)
+    assert [grid.coords(center + d) for d in grid.offsets_4] == list(
+        support.adjacent_4(1, 1),
+    )
+    assert [grid.coords(center + d) for d in grid.offsets_8] == list(
+        support.adjacent_8(1, 1),
+    )
+
+
+def test_bitgrid() -> None:
+    grid = support.BitGrid([(1, 2), (3, 2)])
+    assert (1, 2) in grid
+    assert (2, 2) not in grid
+    assert (1, 50) not in grid
+    assert len(grid) == 2
+    assert grid.row(2) == 0b1010
+    grid.discard(1, 2)
+    grid.discard(100, 100)
+    assert sorted(grid) == [(3, 2)]
+
+
+def test_bitgrid_grows_to_negative_coords() -> None:
+    grid = support.BitGrid([(0, 0)])
+    grid.add(-2, -3)
+    assert (grid.x0, grid.y0) == (-2, -3)
+    assert sorted(grid) == [(-2, -3), (0, 0)]
+    assert grid.bounds() == (-2, -3, 0, 0)
+
+
+def test_bitgrid_shift() -> None:
+    grid = support.BitGrid([(0, 0), (1, 1)])
+    grid.shift(5, -1)
+    assert sorted(grid) == [(5, -1), (6, 0)]
+
+
+def test_bitgrid_from_str() -> None:
+    grid = support.BitGrid.from_str('.#.\n\n#..\n')
+    assert sorted(grid) == sorted(support.parse_coords_hash('.#.\n\n#..\n'))
+
+
+def test_bitgrid_str() -> None:
+    coords = {(1, 0), (0, 1), (-3, 4)}
+    assert str(support.BitGrid(coords)) == support.format_coords_hash(coords)
+
+
+def test_interval_set_merges() -> None:
+    intervals = support.IntervalSet([(5, 8), (0, 2), (2, 3), (7, 10), (4, 4)])
+    assert list(intervals) == [(0, 3), (5, 10)]
+    assert intervals.length() == 8
+
+
+def _covered(intervals: support.IntervalSet) -> set[int]:
+    return {x for start, end in intervals for x in range(start, end)}
+
+
+def _random_intervals(rng: random.Random) -> support.IntervalSet:
+    starts = [rng.randrange(-20, 60) for _ in range(rng.randrange(6))]
+    return support.IntervalSet(
+        (start, start + rng.randrange(-2, 12)) for start in starts
+    )
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_interval_set_like_a_set(seed: int) -> None:
+    rng = random.Random(seed)
+    a, b = _random_intervals(rng), _random_intervals(rng)
+    assert _covered(a | b) == _covered(a) | _covered(b)
+    assert _covered(a & b) == _covered(a) & _covered(b)
+    assert (a <= b) == (_covered(a) <= _covered(b))
+    assert a <= a | b
+    assert a & b <= a
+    assert [x in a for x in range(-25, 75)] == [
+        x in _covered(a) for x in range(-25, 75)
+    ]
+    assert _covered(a.gaps(-10, 40)) == set(range(-10, 40)) - _covered(a)
+    assert (a | b).length() == len(_covered(a) | _covered(b))
+
+
+def test_interval_set_gaps() -> None:
+    intervals = support.IntervalSet([(2, 4), (6, 8)])
+    assert list(intervals.gaps(0, 10)) == [(0, 2), (4, 6), (8, 10)]
+    assert list(intervals.gaps(3, 7)) == [(4, 6)]
+    assert not intervals.gaps(6, 8)
+    assert list(support.IntervalSet().gaps(0, 5)) == [(0, 5)]
+
+
+def test_interval_set_from_numpy() -> None:
+    np = pytest.importorskip('numpy')
+    starts = np.array([5, 0, 2, 7, 4, 20])
+    ends = np.array([8, 2, 3, 10, 4, 19])
+    assert support.IntervalSet.from_numpy(starts, ends) == support.IntervalSet(
+        zip(starts.tolist(), ends.tolist()),
+    )
+    assert not support.IntervalSet.from_numpy(np.array([1]), np.array([1]))
+
+
+@pytest.fixture
+def instrumentation() -> Generator[support.Instrumentation, None, None]:
+    yield support.enable_instrumentation(report=False)
+    support.disable_instrumentation()
+
+
+def test_span_nesting(instrumentation: support.Instrumentation) -> None:
+    for _ in range(3):
+        with support.span('search'):
+            with support.span('expand'):
+                pass
+    with support.span('parse'):
+        pass
+    assert instrumentation.stack == []
+    assert {k: v[0] for k, v in instrumentation.spans.items()} == {
+        ('search',): 3,
+        ('search', 'expand'): 3,
+        ('parse',): 1,
+    }
+
+
+def test_count(instrumentation: support.Instrumentation) -> None:
+    support.count('pushes')
+    support.count('pushes', 2)
+    assert instrumentation.counters == {'pushes': 3}
+
+
+def test_report(instrumentation: support.Instrumentation) -> None:
+    instrumentation.spans = {
+        ('search',): [2, 0.5, 0],
+        ('search', 'bfs'): [4, 0.25, 0],
+    }
+    support.count('nodes', 12)
+    assert instrumentation.report().splitlines() == [
+        '> spans',
+        '  search                                         2 calls     500 ms',
+        '    bfs                                          4 calls     250 ms',
+        '> counters',
+        '  nodes                                         12',
+    ]
+
+
+def test_instrumentation_disabled() -> None:
+    with support.span('search'):
+        support.count('nodes')
+
+
+def test_memory_spans() -> None:
+    instrumentation = support.enable_instrumentation(report=False, memory=True)
+    try:
+        with support.span('total'):
+            with support.span('build'):
+                big = [0] * 1_000_000
+            del big
+            with support.span('search'):
+                pass
+    finally:
+        support.disable_instrumentation()
+
+    peaks = {k: v[2] for k, v in instrumentation.spans.items()}
+    assert peaks[('total', 'build')] >= 8_000_000
+    assert peaks[('total', 'search')] < 1_000_000
+    assert peaks[('total',)] >= peaks[('total', 'build')]
+    assert instrumentation.peak_memory() >= peaks[('total',)]
+    site, size = instrumentation.sites[('total', 'build')][0]
+    assert site.startswith(__file__)
+
+
+@pytest.mark.parametrize(
+    ('s', 'expected'),
+    (
+        ('512', 512),
+        ('2K', 2048),
+        ('1.5MiB', 1536 * 1024),
+        ('1g', 1024 ** 3),
+    ),
+)
+def test_parse_size(s: str, expected: int) -> None:
+    assert support.parse_size(s) == expected
+
+
+def test_parse_size_invalid() -> None:
+    with pytest.raises(ValueError):
+        support.parse_size('lots')
+
+
+def test_format_size() -> None:
+    assert support.format_size(512) == '512.0 B'
+    assert support.format_size(3 * 1024 ** 2) == '3.0 MiB'